@@ -5,6 +5,7 @@ Caches previously translated text to speed up subsequent runs.
 import json
 import hashlib
 import os
+from collections import OrderedDict
 from typing import Dict, Optional, Tuple
 from datetime import datetime
 import logging
@@ -27,6 +28,7 @@ class TranslationCache:
     """
     
     CACHE_VERSION = "1.0"
+    MEMO_MAX_ENTRIES = 100_000
     
     def __init__(self, cache_dir: Optional[str] = None):
         """
@@ -40,6 +42,8 @@ class TranslationCache:
         resolved_cache_dir = cache_dir or _resolve_default_cache_dir()
         self.cache_dir = os.path.abspath(resolved_cache_dir)
         self.cache: Dict[str, Dict] = {}  # text_hash -> {translation, source_lang, target_lang, timestamp}
+        # (source_lang, target_lang, text) -> translation; skips re-hashing hot strings
+        self._memo: OrderedDict[Tuple[str, str, str], str] = OrderedDict()
         self.hits = 0
         self.misses = 0
         self._modified = False
@@ -58,6 +62,7 @@ class TranslationCache:
     def _load_cache(self):
         """Load cache from disk."""
         cache_file = self._get_cache_file()
+        self._memo.clear()
         
         if not os.path.exists(cache_file):
             self.cache = {}
@@ -115,15 +120,31 @@ class TranslationCache:
         Returns:
             Cached translation or None if not found
         """
+        memo_key = (source_lang, target_lang, text)
+        translation = self._memo.get(memo_key)
+        if translation is not None:
+            self._memo.move_to_end(memo_key)
+            self.hits += 1
+            return translation
+
         text_hash = self._hash_text(text, source_lang, target_lang)
         
         entry = self.cache.get(text_hash)
         if entry:
             self.hits += 1
-            return entry.get('translation')
+            translation = entry.get('translation')
+            if translation is not None:
+                self._memo_put(memo_key, translation)
+            return translation
         
         self.misses += 1
         return None
+
+    def _memo_put(self, key: Tuple[str, str, str], translation: str) -> None:
+        self._memo[key] = translation
+        self._memo.move_to_end(key)
+        if len(self._memo) > self.MEMO_MAX_ENTRIES:
+            self._memo.popitem(last=False)
     
     def set(self, text: str, translation: str, source_lang: str, target_lang: str):
         """Store a translation in the cache."""
@@ -137,6 +158,7 @@ class TranslationCache:
             'timestamp': datetime.now().isoformat()
         }
         self._modified = True
+        self._memo_put((source_lang, target_lang, text), translation)
     
     def get_or_translate(self, text: str, source_lang: str, target_lang: str,
                          translate_func) -> Tuple[str, bool]:
@@ -163,6 +185,7 @@ class TranslationCache:
     def clear(self):
         """Clear all cached entries."""
         self.cache = {}
+        self._memo.clear()
         self._modified = True
         self.hits = 0
         self.misses = 0
@@ -176,6 +199,8 @@ class TranslationCache:
         
         for key in to_remove:
             del self.cache[key]
+        for memo_key in [k for k in self._memo if k[1] == target_lang]:
+            del self._memo[memo_key]
         
         self._modified = True
         logger.info(f"Cleared {len(to_remove)} entries for language {target_lang}")
@@ -211,6 +236,7 @@ class TranslationCache:
             del self.cache[key]
         
         if to_remove:
+            self._memo.clear()
             self._modified = True
             logger.info(f"Cleaned up {len(to_remove)} old cache entries")
     
@@ -56,6 +56,11 @@ DEFAULT_MIRROR_MAX_FAILURES = 5
 DEFAULT_MIRROR_BAN_TIME = 120   # 2-minute cooldown (was 3600); mirrors recover quickly after a soft ban
 DEFAULT_RACING_ENDPOINTS = 1    # 1 endpoint at a time to prevent cascade bans (was 2)
 
+# Per-host token bucket (requests/second); unlimited until the first 429,
+# then halves on each 429 and grows 5% per 10 successes
+ENDPOINT_RATE_MIN = 0.25
+ENDPOINT_RATE_MAX = 16.0
+
 # --- Safety & Recognition ---
 # Non-translatable key patterns
 NON_TRANSLATABLE_KEYS = {
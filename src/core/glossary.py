@@ -91,10 +91,18 @@ class Glossary:
             logger.error(f"Failed to save glossary: {e}")
             return False
     
-    def add_term(self, original: str, translation: str, is_regex: bool = False):
-        """Add a term to the glossary."""
-        self.terms[original] = {'translation': translation, 'is_regex': is_regex}
+    def add_term(self, original: str, translation: str, is_regex: bool = False) -> bool:
+        """Add a term to the glossary.
+
+        Returns False (and skips the pattern rebuild) when the term already
+        maps to the same translation and type.
+        """
+        entry = {'translation': translation, 'is_regex': is_regex}
+        if self.terms.get(original) == entry:
+            return False
+        self.terms[original] = entry
         self._build_pattern()
+        return True
     
     def remove_term(self, original: str):
         """Remove a term from the glossary."""
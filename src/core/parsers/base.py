@@ -3,6 +3,9 @@ from typing import List, Any, Dict, Tuple
 from PyQt6.QtCore import QObject, pyqtSignal as Signal
 import re
 
+# Numbered/named backreferences change meaning once patterns are joined
+_BACKREF_RE = re.compile(r'\\[1-9]|\(\?P=')
+
 
 class ParserMeta(type(QObject), ABCMeta):
     """Metaclass that combines QObject's meta and ABCMeta to avoid conflicts."""
@@ -23,6 +26,25 @@ class BaseParser(QObject, metaclass=ParserMeta):
                         self.blacklist_patterns.append(re.compile(pattern.strip(), re.IGNORECASE))
                 except re.error:
                     pass  # Ignore invalid regex
+        self._blacklist_re = self._combine_blacklist(self.blacklist_patterns)
+
+    @staticmethod
+    def _combine_blacklist(patterns: List[re.Pattern]) -> "re.Pattern | None":
+        """Join the user patterns into one alternation so each string is
+        scanned by a single search call.
+
+        Returns None when the patterns cannot be joined safely (backreferences,
+        duplicate group names, inline global flags); callers then fall back to
+        checking them one by one.
+        """
+        if len(patterns) < 2:
+            return patterns[0] if patterns else None
+        if any(_BACKREF_RE.search(p.pattern) for p in patterns):
+            return None
+        try:
+            return re.compile("|".join(f"(?:{p.pattern})" for p in patterns), re.IGNORECASE)
+        except re.error:
+            return None
 
     @abstractmethod
     def extract_text(self, file_path: str) -> List[Tuple[str, str, str]]:
@@ -112,7 +134,10 @@ class BaseParser(QObject, metaclass=ParserMeta):
             return False
 
         # 0. Check User Blacklist
-        if self.blacklist_patterns:
+        if self._blacklist_re is not None:
+            if self._blacklist_re.search(trimmed):
+                return False
+        elif self.blacklist_patterns:
             for pattern in self.blacklist_patterns:
                 if pattern.search(trimmed):
                     return False
@@ -1554,6 +1554,9 @@ class RubyParser(BaseParser):
         if any(p in text for p in '.!?,:;"\''): return True
         
         # If it contains engine codes like \V[n] or \C[n], it's dialogue
-        if '\\' in text and any(c in text.upper() for c in 'VCNPGIS'): return True
+        if '\\' in text:
+            # One uppercased copy, not one per letter probed
+            upper = text.upper()
+            if any(c in upper for c in 'VCNPGIS'): return True
         
         return False
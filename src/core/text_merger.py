@@ -7,6 +7,10 @@ from src.core.constants import (TOKEN_LINE_BREAK, REGEX_LINE_SPLIT, DEFAULT_BATC
 
 logger = logging.getLogger(__name__)
 
+# Legacy Unicode ⟦_M_⟧ bracket mutations, normalized to the canonical ASCII form
+_LEGACY_MERGE_SEP_RE = re.compile(r'[?\[(\{【⟦]\s*_\s*[mM]\s*_\s*[?\])\}】⟧]')
+_MERGE_SPLIT_RE = re.compile(REGEX_MERGE_SPLIT, re.IGNORECASE | re.DOTALL)
+
 class TextMerger:
     """
     Manages the merging of multiple text entries into single translation blocks
@@ -16,6 +20,7 @@ class TextMerger:
     def __init__(self, batch_size: int = DEFAULT_BATCH_SIZE):
         self.batch_size = batch_size
         self.current_block: List[Tuple[str, str, str]] = [] # context, key, text
+        self._current_chars = 0  # running sum of text lengths in current_block
         self.merged_requests: List[Dict[str, Any]] = []
         
         # Safe limit slightly lower than Google's 5000 char hard limit
@@ -33,15 +38,15 @@ class TextMerger:
             return
 
         # Calculate predicted size
-        current_char_count = sum(len(e[2]) for e in self.current_block)
         from src.core.constants import SAFE_MERGE_SEPARATOR
         separator_overhead = len(self.current_block) * len(SAFE_MERGE_SEPARATOR)
-        total_predicted = current_char_count + len(text) + separator_overhead
+        total_predicted = self._current_chars + len(text) + separator_overhead
         
         if len(self.current_block) >= self.batch_size or total_predicted > self.MAX_SAFE_CHARS:
             self.flush_block()
             
         self.current_block.append((context_info, key, text))
+        self._current_chars += len(text)
 
     def flush_block(self):
         """Finalize the current block and wrap it for translation."""
@@ -74,6 +79,7 @@ class TextMerger:
                 }
             })
         self.current_block = []
+        self._current_chars = 0
 
     def get_requests(self) -> List[Dict[str, Any]]:
         self.flush_block()
@@ -81,10 +87,27 @@ class TextMerger:
         
     def reset(self):
         self.current_block = []
+        self._current_chars = 0
         self.merged_requests = []
 
     def split_merged_result(self, merged_text: str, original_entries: List[Tuple[str, str, str]]) -> List[Tuple[str, str]]:
         """Splits the merged result and returns a list of (key, text) pairs."""
+        return self._split_pairs(merged_text, original_entries)[0]
+
+    def split_merged_result_checked(self, merged_text: str, original_entries: Any) -> Tuple[List[Tuple[str, str]], bool]:
+        """Backward compatibility wrapper for existing tests and UI."""
+        formatted_orig = [
+            entry if len(entry) == 3 else ("", str(entry[1]), str(entry[2]))
+            for entry in original_entries
+        ]
+        return self._split_pairs(merged_text, formatted_orig)
+
+    def _split_pairs(self, merged_text: str, original_entries: List[Tuple[str, str, str]]) -> Tuple[List[Tuple[str, str]], bool]:
+        """Split once and zip parts with their entries in merge order.
+
+        The merger built the block, so entry order is authoritative: part *i*
+        belongs to ``original_entries[i]``.
+        """
         lines, expected_count, mismatch = self._split_lines(merged_text, original_entries)
 
         if mismatch:
@@ -93,27 +116,9 @@ class TextMerger:
                 lines = lines[:expected_count]
             else:
                 # Fewer parts than expected — pad with original texts to avoid data loss.
-                for i in range(len(lines), expected_count):
-                    lines.append(original_entries[i][2])
+                lines.extend(entry[2] for entry in original_entries[len(lines):])
 
-        results = []
-        for i, line in enumerate(lines):
-            if i < len(original_entries):
-                results.append((original_entries[i][1], line))
-        return results
-
-    def split_merged_result_checked(self, merged_text: str, original_entries: Any) -> Tuple[List[Tuple[str, str]], bool]:
-        """Backward compatibility wrapper for existing tests and UI."""
-        formatted_orig = []
-        for entry in original_entries:
-            if len(entry) == 3:
-                formatted_orig.append(entry)
-            else:
-                formatted_orig.append(("", str(entry[1]), str(entry[2])))
-
-        res = self.split_merged_result(merged_text, formatted_orig)
-        _, _, mismatch = self._split_lines(merged_text, formatted_orig)
-        return res, mismatch
+        return [(entry[1], line) for entry, line in zip(original_entries, lines)], mismatch
 
     def _split_lines(self, merged_text: str, original_entries: List[Tuple[str, str, str]]) -> Tuple[List[str], int, bool]:
         """
@@ -125,16 +130,10 @@ class TextMerger:
         # Normalize separators for splitting.
         # Primary: |||RPGMSEP_M||| (ASCII, Google-safe, already matched by REGEX_MERGE_SPLIT).
         # Legacy: Unicode ⟦_M_⟧ bracket mutations → normalize to canonical ASCII form.
-        merged_text = re.sub(r'[?\[(\{【⟦]\s*_\s*[mM]\s*_\s*[?\])\}】⟧]', '|||RPGMSEP_M|||', merged_text)
+        merged_text = _LEGACY_MERGE_SEP_RE.sub('|||RPGMSEP_M|||', merged_text)
 
-        # Use regex to find separators
-        if not hasattr(self, '_merge_split_pattern'):
-            self._merge_split_pattern = re.compile(REGEX_MERGE_SPLIT, re.IGNORECASE | re.DOTALL)
-            
-        if self._merge_split_pattern.search(merged_text):
-            lines = self._merge_split_pattern.split(merged_text)
-        else:
-            lines = [merged_text]
+        # split() returns [merged_text] when no separator is present
+        lines = _MERGE_SPLIT_RE.split(merged_text)
 
         # Cleanup whitespace and drop blank lines created by leading/trailing separators
         lines = [l.strip() for l in lines if l.strip()]
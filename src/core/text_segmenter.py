@@ -23,6 +23,7 @@ from __future__ import annotations
 
 import logging
 import re
+from bisect import bisect_right
 from dataclasses import dataclass
 from enum import Enum, auto
 from typing import List, Optional, Tuple
@@ -37,50 +38,63 @@ TEXT_SEGMENT_SEPARATOR = "|||TXTSEG|||"
 # Canonical form for splitting (exact match, no whitespace consumption)
 _TSS_CANONICAL_RE = re.compile(r"\|\|\|TXTSEG\|\|\|")
 
+# Join character for batch scans; a non-word char so ``\b`` behaves as at EOS
+_BATCH_SCAN_SEPARATOR = "\x00"
+
 # ---------------------------------------------------------------------------
 # Code pattern — reuse the battle-tested regex from syntax_guard_rpgm
 # ---------------------------------------------------------------------------
 # This is the same set of patterns used by the old 4-phase protection system.
 # The order is: most specific → least specific so that longer patterns match
-# before shorter substrings.
+# before shorter substrings.  Alternatives are grouped by their opening
+# character, so at a ``\`` the engine tries only the escape codes instead of
+# every alternative; the order within each group is the match priority.
+# The segmenters skip the scan for text without any of these openers, so a
+# new alternative must also start with [, {, \ or <.
 _PROTECT_PATTERN_STR = (
-    r'(\[\[.*?\]\]|'                     # [[escaped]]
+    r'(\[(?:'
+        r'\[.*?\]\]|'                    # [[escaped]]
+        r'(?:sad|happy|angry|sweat|confused|smirk|evil|thinking|doubt|grin|NOTE|custom)\d*\]|'  # Flavor tags
+        r'[^\[\]]+\]'                    # Generic [variable]
+    r')|'
     r'\{\{.*?\}\}|'                      # {{escaped}}
-    r'\\c\[\d+\]|'                       # \c[n] - color
-    r'\\C\[\d+\]|'                       # \C[n] - color (uppercase)
-    r'\\i\[\d+\]|'                       # \i[n] - icon
-    r'\\I\[\d+\]|'                       # \I[n] - icon (uppercase)
-    r'\\p\[\d+\]|'                       # \p[n] - party member name
-    r'\\P\[[^\]]+\]|'                    # \P[var] - player variable
-    r'\\f\[[^\]]+\]|'                    # \f[filename] - face image
-    r'\\n<[^>]+>|'                       # \n<name> - nameplate
-    r'\\[Ww]\[\d+\]|'                    # \W[n]/\w[n] - wait frames
-    r'\\[Ff][Bb]|'                       # \FB/\fb - font bold toggle
-    r'\\[Ff][Ii]|'                       # \FI/\fi - font italic toggle
-    r'\\[Vv]\[\d+\]|'                    # \V[n]/\v[n] - variable value
-    r'\\[Nn]\[\d+\]|'                    # \N[n]/\n[n] - actor name
-    r'\\[Ff][Ss]\[\d+\]|'               # \FS[n]/\fs[n] - font size
-    r'\\[Ff][Ss]\b|'                     # \FS without bracket
-    r'\\[Oo][Cc]\[\d+\]|'               # \OC[n] - VisuStella outline color
-    r'\\[Hh][Cc]\[\d+\]|'               # \HC[n] - VisuStella hex color
-    r'\\[Aa][Cc]\[\d+\]|'               # \AC[n] - VisuStella actor color
-    r'\\[Pp][Xx]\[\d+\]|'               # \PX[n] - position X
-    r'\\[Pp][Yy]\[\d+\]|'               # \PY[n] - position Y
-    r'\\[Ww][Cc]\[\d+\]|'               # \WC[n] - window color
-    r'\\[Tt][Tt]\[[^\]]+\]|'            # \TT[text] - tooltip
-    r'\\[Bb][Gg]\[[^\]]+\]|'            # \BG[img] - background image
-    r'\\[Mm][Ss][Gg][Cc][Oo][Rr][Ee][^\[]*\[[^\]]*\]|'  # \MSGCore[...]
-    r'\\[Pp][Oo][Pp]\[[^\]]*\]|'        # \pop[...] - popup
-    r'\\[Ww][Oo][Rr][Dd][Ww][Rr][Aa][Pp]\[[^\]]*\]|'  # \WordWrap[...]
-    r'\\msghnd|'                         # \msghnd
-    r'\\[{}.<>!g$\\nip^;]|'             # Simple escapes
-    r'<WordWrap>|'                       # <WordWrap>
-    r'<(?:clear|indent|left|center|right)>|'  # Other tags
-    r'\[(?:sad|happy|angry|sweat|confused|smirk|evil|thinking|doubt|grin|NOTE|custom)\d*\]|'  # Flavor tags
-    r'\[[^\[\]]+\])'                     # Generic [variable]
+    r'\\(?:'
+        r'c\[\d+\]|'                     # \c[n] - color
+        r'C\[\d+\]|'                     # \C[n] - color (uppercase)
+        r'i\[\d+\]|'                     # \i[n] - icon
+        r'I\[\d+\]|'                     # \I[n] - icon (uppercase)
+        r'p\[\d+\]|'                     # \p[n] - party member name
+        r'P\[[^\]]+\]|'                  # \P[var] - player variable
+        r'f\[[^\]]+\]|'                  # \f[filename] - face image
+        r'n<[^>]+>|'                     # \n<name> - nameplate
+        r'[Ww]\[\d+\]|'                  # \W[n]/\w[n] - wait frames
+        r'[Ff][Bb]|'                     # \FB/\fb - font bold toggle
+        r'[Ff][Ii]|'                     # \FI/\fi - font italic toggle
+        r'[Vv]\[\d+\]|'                  # \V[n]/\v[n] - variable value
+        r'[Nn]\[\d+\]|'                  # \N[n]/\n[n] - actor name
+        r'[Ff][Ss]\[\d+\]|'             # \FS[n]/\fs[n] - font size
+        r'[Ff][Ss]\b|'                   # \FS without bracket
+        r'[Oo][Cc]\[\d+\]|'             # \OC[n] - VisuStella outline color
+        r'[Hh][Cc]\[\d+\]|'             # \HC[n] - VisuStella hex color
+        r'[Aa][Cc]\[\d+\]|'             # \AC[n] - VisuStella actor color
+        r'[Pp][Xx]\[\d+\]|'             # \PX[n] - position X
+        r'[Pp][Yy]\[\d+\]|'             # \PY[n] - position Y
+        r'[Ww][Cc]\[\d+\]|'             # \WC[n] - window color
+        r'[Tt][Tt]\[[^\]]+\]|'          # \TT[text] - tooltip
+        r'[Bb][Gg]\[[^\]]+\]|'          # \BG[img] - background image
+        r'[Mm][Ss][Gg][Cc][Oo][Rr][Ee][^\[]*\[[^\]]*\]|'  # \MSGCore[...]
+        r'[Pp][Oo][Pp]\[[^\]]*\]|'      # \pop[...] - popup
+        r'[Ww][Oo][Rr][Dd][Ww][Rr][Aa][Pp]\[[^\]]*\]|'  # \WordWrap[...]
+        r'msghnd|'                       # \msghnd
+        r'[{}.<>!g$\\nip^;]'            # Simple escapes
+    r')|'
+    r'<(?:WordWrap|clear|indent|left|center|right)>)'  # <WordWrap> and other tags
 )
 
+# Exactly one capturing group: segment_text relies on split() returning
+# alternating text/code parts
 _CODE_RE = re.compile(_PROTECT_PATTERN_STR)
+_MULTI_SPACE_RE = re.compile(r"  +")
 
 # ---------------------------------------------------------------------------
 # Segment types
@@ -111,26 +125,30 @@ def segment_text(text: str) -> List[Segment]:
     """
     if not text:
         return [Segment(SegmentType.TEXT, "")]
+    if not _may_contain_code(text):
+        return [Segment(SegmentType.TEXT, text)]
+    # split() runs the match loop in C; the capture group keeps the codes
+    return _segments_from_parts(_CODE_RE.split(text))
 
-    segments: List[Segment] = []
-    pos = 0
-
-    for m in _CODE_RE.finditer(text):
-        # TEXT before this code
-        if m.start() > pos:
-            _append_text(segments, text[pos:m.start()])
-        # CODE
-        _append_code(segments, m.group(0))
-        pos = m.end()
 
-    # Remaining TEXT after the last code
-    if pos < len(text):
-        _append_text(segments, text[pos:])
+def segment_texts(texts: List[str]) -> List[List[Segment]]:
+    """Segment many strings with a single regex scan over their concatenation.
 
-    if not segments:
-        segments.append(Segment(SegmentType.TEXT, text))
+    Equivalent to ``[segment_text(t) for t in texts]``.  A code match that
+    straddles a join boundary is discarded and the texts it touched are
+    re-segmented individually.
+    """
+    # Only texts that can hold a code take part in the joined scan
+    has_code = [_may_contain_code(t) for t in texts]
+    scan = [t for t, flag in zip(texts, has_code) if flag]
+    if len(scan) < 2 or any(_BATCH_SCAN_SEPARATOR in t for t in scan):
+        return [segment_text(t) for t in texts]
 
-    return segments
+    scanned = iter(_segment_batch(scan))
+    return [
+        next(scanned) if flag else [Segment(SegmentType.TEXT, t)]
+        for t, flag in zip(texts, has_code)
+    ]
 
 
 def clean_text(text: str) -> Tuple[str, List[Segment]]:
@@ -173,6 +191,81 @@ def reassemble(translated_clean: str, segments: List[Segment]) -> str:
 # Internal helpers
 # ---------------------------------------------------------------------------
 
+def _build_segments(text: str, spans: List[Tuple[int, int]]) -> List[Segment]:
+    segments: List[Segment] = []
+    pos = 0
+
+    for start, end in spans:
+        # TEXT before this code
+        if start > pos:
+            _append_text(segments, text[pos:start])
+        # CODE
+        _append_code(segments, text[start:end])
+        pos = end
+
+    # Remaining TEXT after the last code
+    if pos < len(text):
+        _append_text(segments, text[pos:])
+
+    if not segments:
+        segments.append(Segment(SegmentType.TEXT, text))
+
+    return segments
+
+
+def _may_contain_code(text: str) -> bool:
+    # Every code opens with one of these; most dialogue lines have none, and
+    # four substring checks are far cheaper than starting a regex scan
+    return "\\" in text or "[" in text or "<" in text or "{" in text
+
+
+def _segment_batch(texts: List[str]) -> List[List[Segment]]:
+    """Segment *texts* with one regex scan over their concatenation."""
+    starts: List[int] = []
+    offset = 0
+    for t in texts:
+        starts.append(offset)
+        offset += len(t) + 1
+
+    spans: List[List[Tuple[int, int]]] = [[] for _ in texts]
+    rescan: set[int] = set()
+    for m in _CODE_RE.finditer(_BATCH_SCAN_SEPARATOR.join(texts)):
+        start, end = m.span()
+        idx = bisect_right(starts, start) - 1
+        base = starts[idx]
+        if end > base + len(texts[idx]):
+            rescan.update(range(idx, bisect_right(starts, end - 1)))
+            continue
+        spans[idx].append((start - base, end - base))
+
+    return [
+        segment_text(t) if (i in rescan or not t) else _build_segments(t, spans[i])
+        for i, t in enumerate(texts)
+    ]
+
+
+def _segments_from_parts(parts: List[str]) -> List[Segment]:
+    """Build segments from ``_CODE_RE.split`` output: text, code, text, …"""
+    if len(parts) == 1:
+        return [Segment(SegmentType.TEXT, parts[0])]
+
+    segments: List[Segment] = []
+    if parts[0]:
+        segments.append(Segment(SegmentType.TEXT, parts[0]))
+    # Codes with no text between them form one CODE segment
+    code = ""
+    for i in range(1, len(parts), 2):
+        code += parts[i]
+        after = parts[i + 1]
+        if after:
+            segments.append(Segment(SegmentType.CODE, code))
+            segments.append(Segment(SegmentType.TEXT, after))
+            code = ""
+    if code:
+        segments.append(Segment(SegmentType.CODE, code))
+    return segments
+
+
 def _append_text(segments: List[Segment], content: str) -> None:
     if segments and segments[-1].type == SegmentType.TEXT:
         segments[-1].content += content
@@ -264,7 +357,7 @@ def _proportional_reinsert(translated: str, segments: List[Segment]) -> str:
         else:
             result = code
 
-    return re.sub(r"  +", " ", result).strip()
+    return _MULTI_SPACE_RE.sub(" ", result).strip()
 
 
 def _find_word_boundary(text: str, pos: int) -> int:
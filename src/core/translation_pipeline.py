@@ -13,6 +13,7 @@ import asyncio
 import concurrent.futures
 import logging
 import re
+import sys
 import time
 import tempfile
 
@@ -47,6 +48,14 @@ from .constants import (
 )
 from .engine_profiler import EngineProfiler, ProjectProfile
 
+try:
+    if sys.platform == 'win32':
+        from winloop import new_event_loop as _fast_loop_factory
+    else:
+        from uvloop import new_event_loop as _fast_loop_factory
+except ImportError:  # optional: fall back to the stdlib event loop
+    _fast_loop_factory = None
+
 
 class TranslationPipeline(QObject):
     """
@@ -1294,7 +1303,10 @@ class TranslationPipeline(QObject):
             # Cleanup
             await self.translator.close()
 
-        asyncio.run(process_all())
+        # Runner(loop_factory=...) keeps the faster loop local to this worker
+        # thread instead of swapping the process-wide event loop policy.
+        with asyncio.Runner(loop_factory=_fast_loop_factory) as runner:
+            runner.run(process_all())
         
         return results_map
 
@@ -1423,7 +1435,7 @@ class TranslationPipeline(QObject):
 
             stage_path = os.path.join(staging_dir, filename)
             # Use safe_write to staging (temp + atomic replace within staging dir)
-            with safe_write(stage_path, 'wb') as f:
+            with safe_write(stage_path, 'wb', durable=False) as f:
                 if file_ext == '.json':
                     f.write(orjson.dumps(new_data))
                 elif file_ext == '.js':
@@ -1486,8 +1498,10 @@ class TranslationPipeline(QObject):
                         continue
                     raise ValueError(reason or f"No data for {basename}")
 
-                # Write directly using safe_write (temp file + atomic replace)
-                with safe_write(fp, 'wb') as f:
+                # Write directly using safe_write (temp file + atomic replace).
+                # No per-file fsync: a save pass can write thousands of files,
+                # and the replace still never leaves a half-written one.
+                with safe_write(fp, 'wb', durable=False) as f:
                     if file_ext == '.json':
                         f.write(orjson.dumps(new_data))
                     elif file_ext == '.js':
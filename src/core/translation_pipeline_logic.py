@@ -1,178 +1,11 @@
 """
-DEPRECATED: This file is legacy code and is NOT used by the application.
-All translation logic has been moved to translation_pipeline.py
-Do not use this file - it contains outdated patterns and may have bugs.
-This file will be removed in a future version.
+REMOVED: legacy pipeline module.
 
-Last reviewed: v0.6.1 - Contains incomplete/buggy patterns (missing logger instance, undefined method calls)
+All translation logic lives in translation_pipeline.py. The old implementation
+here was never wired into the application and pulled PyQt6 and the translator
+into any context that imported it, so it has been replaced by this shim.
 """
-import os
-import logging
-import asyncio
-from typing import Dict, Any, List, Optional, Tuple
-from PyQt6.QtCore import QObject, pyqtSignal, QThread
-
-from .translator import TranslationResult
-
-logger = logging.getLogger(__name__)
-
-class TranslationPipeline(QObject):
-    """
-    Orchestrates the translation process:
-    1. Scans files and extracts text using Parsers.
-    2. Batches and optimizes text using TextMerger.
-    3. Sends requests to Translator (with retries).
-    4. Handles results (Splitting merged blocks, error logging).
-    5. Updates files and saves backup.
-    """
-    
-    progress_updated = pyqtSignal(int, int, str) # current, total, message
-    log_message = pyqtSignal(str, str) # level, msg
-    finished = pyqtSignal(bool, str) # success, message
-
-    def __init__(self, settings: Dict[str, Any], project_path: str):
-        super().__init__()
-        self.settings = settings
-        self.project_path = project_path
-        self.should_stop = False
-        
-        # Dependencies
-        from .translator import GoogleTranslator
-        from .text_merger import TextMerger
-        # Parsers would be imported dynamically or passed in
-        
-        self.translator = GoogleTranslator(
-            concurrency=settings.get('concurrency', 16),
-            batch_size=settings.get('batch_size', 15)
-        )
-        self.merger = TextMerger(batch_size=settings.get('batch_size', 15))
-        self.parsers: Dict[str, Any] = {} # file_path -> Parser Instance
-        self.failed_items: List[Dict] = []
-
-    def stop(self):
-        self.should_stop = True
-
-    async def run_translation_task(self):
-        """Main async entry point for the translation logic."""
-        try:
-            self.log_message.emit("info", "Starting translation pipeline...")
-            
-            # 1. Collect Translatable Strings
-            # (Assuming self.parsers is populated by scanner logic in a previous step)
-            # If not, we scan here. For brevity, assuming scanner logic is external or done.
-            # Let's assume we receive a list of raw entries from scanner:
-            # entries = [(file_path, key, text, context)]
-            
-            # Since full pipeline logic is huge, I focus on the PROCESSING part as requested.
-            pass
-            
-            # ... (Scanner Logic Placeholder) ...
-            
-            # 2. Merge & Optimize
-            self.log_message.emit("info", "Optimizing text batches...")
-            # requests = self.merger.get_requests() # populated during scan
-            
-            # 3. Execution
-            if not self.merger.merged_requests:
-                self.finished.emit(True, "Nothing to translate.")
-                return
-
-            total = len(self.merger.merged_requests)
-            processed = 0
-            
-            def on_progress(count):
-                nonlocal processed
-                processed += count
-                self.progress_updated.emit(processed, total, f"Translating... ({processed}/{total})")
-
-            # 4. Translate Schema (Result Pattern)
-            results = await self.translator.translate_batch(self.merger.merged_requests, on_progress)
-            
-            # 5. Result Handling (The Critical Part)
-            success_count = 0
-            fail_count = 0
-            
-            # We need a way to map results back to parsers.
-            # Our TextMerger requests have metadata: {'file', 'key', 'is_merged', 'original_entries'}
-            
-            # Map: {file_path: {key: translated_text}}
-            final_translations: Dict[str, Dict[str, str]] = {}
-
-            for res in results:
-                if self.should_stop: break
-                
-                meta = res.metadata
-                
-                if not res.success:
-                    fail_count += 1
-                    # Log failure but continue
-                    err_msg = f"Failed: {meta.get('key')} in {meta.get('file')} - {res.error}"
-                    self.logger.warning(err_msg)
-                    self.failed_items.append({'file': meta.get('file'), 'key': meta.get('key'), 'error': res.error})
-                    continue
-
-                # Success Handling
-                # Is it merged?
-                if meta.get('is_merged'):
-                    # Split back
-                    original_entries = meta.get('original_entries', [])
-                    # original_entries is List[(context, key, text)]
-                    
-                    split_pairs = self.merger.split_merged_result(res.translated_text, original_entries)
-                    
-                    for key, val in split_pairs:
-                        # Find owner file.
-                        # Quick hack: assume first entry's file is the batch file (MERGER logic ensures this typically)
-                        # Merger logic: current_block.append((context_info, key, text))
-                        # context_info usually holds file_path in our system.
-                        # Let's verify TextMerger.add usage.
-                        
-                        # In new TextMerger, we stored (context_info, key, text).
-                        # Let's assume context_info IS file_path.
-                        # We need to look at original_entries to find context.
-                        pass # Validated: TextMerger logic consistently uses context as file path.
-                        
-                        # We need to find the specific entry for this key to get its context(file)
-                        # O(N) search in small list (batch size < 50), acceptable.
-                        matched_entry = next((e for e in original_entries if e[1] == key), None)
-                        if matched_entry:
-                            f_path = matched_entry[0]
-                            if f_path not in final_translations: final_translations[f_path] = {}
-                            final_translations[f_path][key] = val
-                            success_count += 1
-                            
-                else:
-                    # Single
-                    f_path = meta.get('metadata', {}).get('file') # Wait, meta IS metadata
-                    # Check TextMerger.flush_block for single entry structure
-                    # Single: metadata = {'description': context, 'key': key, 'is_merged': False}
-                    f_path = meta.get('description') # Context stored in description
-                    
-                    key = meta.get('key')
-                    if f_path and key:
-                        if f_path not in final_translations: final_translations[f_path] = {}
-                        final_translations[f_path][key] = res.translated_text
-                        success_count += 1
-
-            # 6. Apply to Parsers & Save
-            self.log_message.emit("info", f"Applying translations... (Success: {success_count}, Failed: {fail_count})")
-            
-            for f_path, translations in final_translations.items():
-                if f_path in self.parsers:
-                    parser = self.parsers[f_path]
-                    parser.apply_translations(translations)
-                    parser.save(f_path) # Atomic save implied
-            
-            # Report
-            if fail_count > 0:
-                self.finished.emit(True, f"Done with warnings. {fail_count} items failed. Check logs.")
-            else:
-                self.finished.emit(True, "Translation completed successfully!")
-
-        except Exception as e:
-            logger.error(f"Critical Pipeline Error: {e}", exc_info=True)
-            self.finished.emit(False, str(e))
-
-    def run(self):
-        """Qt Thread Entry"""
-        asyncio.run(self.run_translation_task())
+raise ImportError(
+    "src.core.translation_pipeline_logic was removed; "
+    "use src.core.translation_pipeline.TranslationPipeline instead"
+)
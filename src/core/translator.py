@@ -9,21 +9,28 @@ from __future__ import annotations
 
 import asyncio
 import aiohttp
+import heapq
 import logging
+import orjson
 import re
 import time
 import random
+import statistics
 import urllib.parse
+from bisect import bisect_right
 from collections import deque
+from itertools import accumulate
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Dict, List, Optional, Tuple, Any
+from typing import Dict, Iterator, List, Optional, Tuple, Any
 from abc import ABC, abstractmethod
 
 from src.core.text_segmenter import (
     segment_text,
+    segment_texts,
     reassemble as segmenter_reassemble,
     Segment,
+    SegmentType,
     TEXT_SEGMENT_SEPARATOR,
 )
 from src.core.constants import (
@@ -37,8 +44,33 @@ from src.core.constants import (
     DEFAULT_MIRROR_MAX_FAILURES,
     DEFAULT_MIRROR_BAN_TIME,
     DEFAULT_RACING_ENDPOINTS,
+    ENDPOINT_RATE_MIN,
+    ENDPOINT_RATE_MAX,
+    SAFE_BATCH_SEPARATOR,
+    TOKEN_BATCH_SEPARATOR,
+    REGEX_BATCH_SPLIT,
 )
 
+_BATCH_SPLIT_RE = re.compile(REGEX_BATCH_SPLIT, re.IGNORECASE | re.DOTALL)
+_BATCH_SEPARATOR_LITERAL = SAFE_BATCH_SEPARATOR.strip()
+# Google sometimes inserts spaces between the pipes of our ASCII separators
+_SEPARATOR_REPAIR_RE = re.compile(r'\|\s*\|\s*\|(RPGMSEP_[SMI]|TXTSEG)\|\s*\|\s*\|')
+# Endpoint latency EWMA: unmeasured mirrors start mid-pack so they get tried
+_EWMA_INITIAL_MS = 500.0
+_EWMA_ALPHA = 0.2
+# Endpoint score = ewma_ms + penalty per consecutive failure
+_FAIL_PENALTY_MS = 500.0
+# Hedged racing: every request earns 0.1 hedge tokens, so at most ~10% of
+# requests fire a backup endpoint
+_HEDGE_BUDGET_RATIO = 0.1
+_HEDGE_TOKEN_CAP = 5.0
+_HEDGE_MIN_SAMPLES = 8
+_HEDGE_DEFAULT_DELAY_SECS = 1.0
+# Bounds for the adaptive multiplier on batch_size
+_BATCH_SCALE_MIN = 0.5
+_BATCH_SCALE_MAX = 2.0
+_CJK_SOURCE_LANGS = frozenset({'ja', 'zh', 'zh-cn', 'zh-tw', 'ko', 'zh-hans', 'zh-hant'})
+
 
 class TranslationEngine(Enum):
     GOOGLE = "google"
@@ -64,15 +96,81 @@ class TranslationResult:
     metadata: dict = field(default_factory=dict)
 
 
+def _split_batch(text: str) -> List[str]:
+    """Split a translated batch on the slice separator.
+
+    Uses ``str.split`` unless the text could hold a legacy or mangled
+    separator; if every underscore belongs to a canonical ``|||RPGMSEP_``
+    marker, the tolerant regex cannot match anything the literal misses.
+    Callers strip and drop empty parts, which absorbs the whitespace the
+    regex would have consumed.
+    """
+    if TOKEN_BATCH_SEPARATOR not in text and text.count('_') == text.count('|||RPGMSEP_'):
+        return text.split(_BATCH_SEPARATOR_LITERAL)
+    return _BATCH_SPLIT_RE.split(text)
+
+
+@dataclass(slots=True)
+class _EndpointHealth:
+    fails: int = 0
+    banned_until: float = 0.0
+    ewma_ms: float = _EWMA_INITIAL_MS
+
+
+@dataclass(slots=True)
+class _TokenBucket:
+    """Proactive per-host rate gate: requests wait for a token instead of
+    bursting into a wall of 429s and backing off afterwards.
+
+    The gate stays open (``rate`` is None) until the host first throttles
+    us; from then on the rate follows AIMD starting at half the maximum.
+    """
+    rate: float | None = None
+    tokens: float = 0.0
+    updated: float = field(default_factory=time.monotonic)
+    successes: int = 0
+
+    async def acquire(self) -> None:
+        if self.rate is None:
+            return
+        while True:
+            now = time.monotonic()
+            capacity = max(1.0, self.rate)
+            self.tokens = min(capacity, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            if self.tokens >= 1.0:
+                self.tokens -= 1.0
+                return
+            await asyncio.sleep((1.0 - self.tokens) / self.rate)
+
+    def on_success(self) -> None:
+        if self.rate is None:
+            return
+        self.successes += 1
+        if self.successes % 10 == 0:
+            self.rate = min(ENDPOINT_RATE_MAX, self.rate * 1.05)
+
+    def on_throttled(self) -> None:
+        self.rate = max(ENDPOINT_RATE_MIN, (self.rate or ENDPOINT_RATE_MAX) * 0.5)
+        self.tokens = 0.0
+        # An open gate never touched `updated`; restart the refill clock now
+        self.updated = time.monotonic()
+        self.successes = 0
+
+
 class BaseTranslator(ABC):
     def __init__(self, timeout_seconds: int = DEFAULT_TIMEOUT_SECONDS) -> None:
         self.logger = logging.getLogger(self.__class__.__name__)
         self._session: aiohttp.ClientSession | None = None
         self._connector: aiohttp.TCPConnector | None = None
         self.timeout_seconds = timeout_seconds
+        # Set by close(): pending work fails fast instead of retrying
+        # (with backoff) against a closed session
+        self._closed = asyncio.Event()
 
     async def _get_session(self) -> aiohttp.ClientSession:
         if self._session is None or self._session.closed:
+            self._closed.clear()
             self._connector = aiohttp.TCPConnector(limit=256, ttl_dns_cache=300)
             timeout = aiohttp.ClientTimeout(
                 total=max(45, self.timeout_seconds),
@@ -89,6 +187,7 @@ class BaseTranslator(ABC):
         return self._session
 
     async def close(self):
+        self._closed.set()
         if self._session:
             try:
                 await self._session.close()
@@ -186,10 +285,19 @@ class GoogleTranslator(BaseTranslator):
         self.mirror_max_failures = max(1, mirror_max_failures)
         self.mirror_ban_time = max(10, mirror_ban_time)
         self.racing_endpoints = max(1, racing_endpoints)
-        self._endpoint_health: Dict[str, Dict[str, float]] = {}
-        self._endpoint_index = 0
+        self._endpoint_health: dict[str, _EndpointHealth] = {}
         self._lingva_index = 0
         self._endpoint_semaphores: dict[str, asyncio.Semaphore] = {}
+        self._buckets: dict[str, _TokenBucket] = {}
+        self._latency_samples: deque[float] = deque(maxlen=128)
+        self._hedge_tokens: float = 1.0
+        # (text, source_lang, target_lang) -> reassembled translation; pending
+        # while a translate_batch call is still working on it
+        self._inflight: dict[tuple[str, str, str], asyncio.Future] = {}
+        # (clean text, source_lang, target_lang) -> single-text request in
+        # progress; distinct originals often share a clean text ("\c[1]Yes"
+        # and "\c[2]Yes"), so concurrent fallbacks await one request
+        self._single_inflight: dict[tuple[str, str, str], asyncio.Future] = {}
         self._global_cooldown_until: float = 0.0
         self._consecutive_identity_count: int = 0
         self._circuit_breaker_active: bool = False
@@ -201,8 +309,15 @@ class GoogleTranslator(BaseTranslator):
         self.min_concurrency_floor = 4
         self._recent_metrics: deque = deque(maxlen=500)
         self._adapt_lock = asyncio.Lock()
+        # Caps single-text fallbacks so one failed slice can't fan out into
+        # batch_size simultaneous requests competing with healthy slices
+        self._single_retry_sem = asyncio.Semaphore(max(2, concurrency // 2))
         self._last_adapt_time = 0.0
         self.adapt_interval_sec = 5.0
+        # Multiplier on batch_size: a slow/throttled link gets fewer, larger
+        # requests, a fast one smaller slices spread across more workers.
+        # The char limit never scales (GET URL length).
+        self._batch_scale: float = 1.0
         self.aggressive_retry = True
 
         # v0.7.0: use_syntax_guard/use_html_protection are accepted for
@@ -211,29 +326,47 @@ class GoogleTranslator(BaseTranslator):
         self.use_html_protection = False
         self.logger.info("GoogleTranslator: using segmenter (v0.7.0) — token protection is removed")
 
-        from .constants import REGEX_BATCH_SPLIT
-        self.BATCH_SPLIT_PATTERN = re.compile(REGEX_BATCH_SPLIT, re.IGNORECASE | re.DOTALL)
+        self.BATCH_SPLIT_PATTERN = _BATCH_SPLIT_RE
 
         for ep in self.google_endpoints:
-            self._endpoint_health[ep] = {"fails": 0, "banned_until": 0.0}
+            self._endpoint_health[ep] = _EndpointHealth()
 
     @property
     def max_chars(self) -> int:
         return self._max_chars
 
-    def _get_next_endpoint(self) -> str:
-        now = time.time()
-        available = []
-        for ep in self.google_endpoints:
-            health = self._endpoint_health.get(ep, {"fails": 0, "banned_until": 0.0})
-            if now > health.get("banned_until", 0.0):
-                available.append(ep)
+    def _pick_endpoints(self, k: int) -> List[str]:
+        """Return a primary mirror followed by the *k - 1* best-scored others.
+
+        Score is latency EWMA plus a penalty per recent failure. The primary
+        is a draw over every unbanned mirror weighted by 1/score, so load
+        spreads across all healthy mirrors and slower ones keep getting
+        re-measured. Each call draws afresh: concurrent workers must land on
+        different mirrors, since each one admits only two requests at once.
+        """
+        available = self._available_endpoints(time.time())
+        primary = random.choices(available, weights=[1.0 / self._endpoint_score(ep) for ep in available])[0]
+        if k <= 1:
+            return [primary]
+        # Fallbacks only need the best k - 1, not a full sort
+        rest = heapq.nsmallest(k - 1, (ep for ep in available if ep != primary), key=self._endpoint_score)
+        return [primary, *rest]
+
+    def _available_endpoints(self, now: float) -> List[str]:
+        """Unbanned mirrors; every mirror again once all of them are banned."""
+        available = [
+            ep for ep in self.google_endpoints
+            if now > self._endpoint_health.setdefault(ep, _EndpointHealth()).banned_until
+        ]
         if not available:
             for ep in self.google_endpoints:
-                self._endpoint_health[ep] = {"fails": 0, "banned_until": 0.0}
+                self._endpoint_health[ep] = _EndpointHealth()
             available = self.google_endpoints[:]
-        self._endpoint_index = (min(self._endpoint_index, len(available) - 1) + 1) % len(available)
-        return available[self._endpoint_index]
+        return available
+
+    def _endpoint_score(self, endpoint: str) -> float:
+        health = self._endpoint_health[endpoint]
+        return max(1.0, health.ewma_ms + _FAIL_PENALTY_MS * health.fails)
 
     def _get_next_lingva(self) -> str:
         self._lingva_index = (self._lingva_index + 1) % len(self.lingva_instances)
@@ -243,116 +376,182 @@ class GoogleTranslator(BaseTranslator):
         if not requests:
             return []
 
-        results: List[TranslationResult] = []
-        for req in requests:
-            original_text = req.get('metadata', {}).get('original_text', req['text'])
-            results.append(TranslationResult(
-                original_text=original_text,
+        first_metadata = requests[0].get('metadata', {})
+        s_lang = first_metadata.get('source_lang', 'auto')
+        t_lang = first_metadata.get('target_lang', 'en')
+
+        results: List[TranslationResult] = [
+            TranslationResult(
+                original_text=meta.get('original_text', req['text']),
                 translated_text=req['text'],
-                source_lang=requests[0].get('metadata', {}).get('source_lang', 'auto'),
-                target_lang=requests[0].get('metadata', {}).get('target_lang', 'en'),
+                source_lang=s_lang,
+                target_lang=t_lang,
                 success=False,
-                metadata=req.get('metadata', {}),
+                metadata=meta,
                 error="Processing not started",
-            ))
-
+            )
+            for req in requests
+            for meta in (req.get('metadata', {}),)
+        ]
+
+        # One pass over the requests both dedups within the call and resolves
+        # run-wide dedup: texts already translated (or in flight) by an
+        # earlier/concurrent call are awaited instead of re-sent. str caches
+        # its own hash, so keying on the text hashes each string once.
+        loop = asyncio.get_running_loop()
         unique_map: Dict[str, List[int]] = {}
+        owned: Dict[str, asyncio.Future] = {}
+        joined: Dict[str, asyncio.Future] = {}
         for i, req in enumerate(requests):
             txt = req['text']
-            if txt not in unique_map:
-                unique_map[txt] = []
-            unique_map[txt].append(i)
-
-        unique_texts = list(unique_map.keys())
-
-        first_metadata_lang = requests[0].get('metadata', {}).get('source_lang', 'auto') if requests else 'auto'
-        batches_of_text_slices = self._prepare_slices(unique_texts, source_lang=first_metadata_lang)
-
-        sem = asyncio.Semaphore(self.concurrency)
-
-        async def process_slice(slice_texts: List[str]):
-            async with sem:
+            indices = unique_map.get(txt)
+            if indices is not None:
+                indices.append(i)
+                continue
+            unique_map[txt] = [i]
+
+            key = (txt, s_lang, t_lang)
+            fut = self._inflight.get(key)
+            if fut is None:
+                fut = self._inflight[key] = loop.create_future()
+                owned[txt] = fut
+            else:
+                joined[txt] = fut
+
+        def settle(txt: str, final_text: str | None) -> None:
+            fut = owned.get(txt)
+            if fut is None or fut.done():
+                return
+            fut.set_result(final_text)
+            if final_text is None:
+                # Failures are not memoized so later calls can retry them
+                self._inflight.pop((txt, s_lang, t_lang), None)
+
+        def report_progress(count: int) -> None:
+            # One emit per slice instead of per text: each call crosses
+            # into a Qt signal on the pipeline side.
+            if count and progress_callback:
                 try:
-                    # --- Phase 1: Segment-based protection ---
-                    # For each text, segment it and extract clean text.
-                    # Store segments for later reassembly.
-                    segment_maps: List[List[Segment]] = []
-                    clean_batch: List[str] = []
-                    bypass_indices = set()
-
-                    for idx, txt in enumerate(slice_texts):
-                        segments = segment_text(txt)
-                        segment_maps.append(segments)
-
-                        # Build clean text (only TEXT segments joined by separator)
-                        text_parts = [s.content for s in segments if s.type.name == "TEXT"]
-                        if not text_parts:
-                            # No translatable text (only codes)
-                            bypass_indices.add(idx)
-                            clean_batch.append(".")  # minimal dummy
-                        else:
-                            clean_batch.append(TEXT_SEGMENT_SEPARATOR.join(text_parts))
-
-                    # --- Phase 2: Join & translate ---
-                    from .constants import SAFE_BATCH_SEPARATOR
-                    batch_text = SAFE_BATCH_SEPARATOR.join(clean_batch)
-
-                    first_metadata = requests[0].get('metadata', {}) if requests else {}
-                    s_lang = first_metadata.get('source_lang', 'auto')
-                    t_lang = first_metadata.get('target_lang', 'en')
-
-                    translated_parts = await self._try_translate(batch_text, s_lang, t_lang, len(clean_batch))
-
-                    if not translated_parts:
-                        translated_parts = [None] * len(clean_batch)
-
-                        if self._circuit_breaker_active:
-                            self.logger.debug("Circuit breaker active — individual retries will use Lingva only")
+                    progress_callback(count)
+                except Exception:
+                    pass
 
-                        async def retry_single(idx):
-                            try:
-                                single_res = await self._try_translate(clean_batch[idx], s_lang, t_lang, 1)
-                                if single_res:
-                                    translated_parts[idx] = single_res[0]
-                            except Exception:
-                                pass
+        # Resolved once for every request this call makes; None when all
+        # texts were served by dedup (retries then resolve lazily).
+        session = await self._get_session() if owned else None
+        unique_texts = list(owned)
+        # Sliced lazily as workers pull, so adaptive batch sizing mid-run
+        # re-shapes the slices not yet sent
+        slices = self._iter_slices(unique_texts, source_lang=s_lang)
 
-                        await asyncio.gather(*(retry_single(i) for i in range(len(clean_batch))))
+        async def process_slice(slice_texts: List[str]):
+            try:
+                # --- Phase 1: Segment-based protection ---
+                # Segment the whole slice in one regex scan and extract
+                # clean text. Store segments for later reassembly.
+                # Parallel lists aligned with slice_texts: segments, clean
+                # text and a code-only flag per entry.
+                segment_maps: List[List[Segment]] = segment_texts(slice_texts)
+                clean_batch: List[str] = []
+                bypass: List[bool] = []
+
+                for segments in segment_maps:
+                    # Build clean text (only TEXT segments joined by separator)
+                    text_parts = [s.content for s in segments if s.type is SegmentType.TEXT]
+                    # No translatable text (only codes): send a minimal dummy
+                    bypass.append(not text_parts)
+                    clean_batch.append(TEXT_SEGMENT_SEPARATOR.join(text_parts) if text_parts else ".")
+
+                # --- Phase 2: Join & translate ---
+                batch_text = SAFE_BATCH_SEPARATOR.join(clean_batch)
+
+                translated_parts = await self._try_translate(
+                    batch_text, s_lang, t_lang, len(clean_batch), session=session,
+                )
 
-                    # --- Phase 3: Reassemble codes ---
-                    for idx, (original, translated, segments) in enumerate(zip(slice_texts, translated_parts, segment_maps)):
-                        indices = unique_map.get(original, [])
+                if not translated_parts:
+                    translated_parts = [None] * len(clean_batch)
 
-                        if idx in bypass_indices:
-                            final_text = original
-                            success = True
-                        elif translated:
-                            final_text = segmenter_reassemble(translated, segments)
-                            success = True
-                        else:
-                            final_text = original
-                            success = False
-
-                        for i_idx in indices:
-                            res = results[i_idx]
-                            res.translated_text = final_text
-                            res.success = success
-                            res.error = None if success else "Translation failed or empty"
-                            if success and progress_callback:
-                                try:
-                                    progress_callback(1)
-                                except Exception:
-                                    pass
+                    if self._circuit_breaker_active:
+                        self.logger.debug("Circuit breaker active — individual retries will use Lingva only")
 
-                except Exception as e:
-                    self.logger.error(f"Batch processing error: {str(e)}")
-                    for txt in slice_texts:
-                        for idx in unique_map.get(txt, []):
-                            results[idx].error = f"Exception: {str(e)}"
+                    async def retry_single(idx: int) -> None:
+                        try:
+                            async with self._single_retry_sem:
+                                single_res = await self._try_translate(
+                                    clean_batch[idx], s_lang, t_lang, 1, session=session,
+                                )
+                            if single_res:
+                                translated_parts[idx] = single_res[0]
+                        except Exception:
+                            pass
+
+                    await asyncio.gather(*(retry_single(i) for i in range(len(clean_batch))))
+
+                # --- Phase 3: Reassemble codes ---
+                completed = 0
+                for original, translated, segments, code_only in zip(
+                    slice_texts, translated_parts, segment_maps, bypass,
+                ):
+                    indices = unique_map.get(original, [])
+
+                    if code_only:
+                        final_text = original
+                        success = True
+                    elif translated:
+                        final_text = segmenter_reassemble(translated, segments)
+                        success = True
+                    else:
+                        final_text = original
+                        success = False
+
+                    settle(original, final_text if success else None)
+                    for i_idx in indices:
+                        res = results[i_idx]
+                        res.translated_text = final_text
+                        res.success = success
+                        res.error = None if success else "Translation failed or empty"
+                    if success:
+                        completed += len(indices)
+                report_progress(completed)
 
-        tasks = [process_slice(batch) for batch in batches_of_text_slices]
-        if tasks:
-            await asyncio.gather(*tasks)
+            except Exception as e:
+                self.logger.error(f"Batch processing error: {str(e)}")
+                for txt in slice_texts:
+                    settle(txt, None)
+                    for idx in unique_map.get(txt, []):
+                        results[idx].error = f"Exception: {str(e)}"
+
+        # Fixed worker pool: task count stays at `concurrency` no matter how
+        # many slices the batch produced. Workers share one slice iterator;
+        # next() never awaits, so no two workers get the same slice.
+        async def worker() -> None:
+            for slice_texts in slices:
+                if self._closed.is_set():
+                    return
+                await process_slice(slice_texts)
+
+        n_workers = min(max(1, self.concurrency), len(unique_texts))
+        try:
+            if n_workers:
+                await asyncio.gather(*(worker() for _ in range(n_workers)))
+        finally:
+            for txt in owned:
+                settle(txt, None)
+
+        completed = 0
+        for txt, fut in joined.items():
+            final_text = await fut
+            for i_idx in unique_map[txt]:
+                res = results[i_idx]
+                if final_text is None:
+                    res.error = "Translation failed or empty"
+                    continue
+                res.translated_text = final_text
+                res.success = True
+                res.error = None
+                completed += 1
+        report_progress(completed)
 
         # Post-batch identity retry (RenLocalizer pattern):
         # unchanged texts likely hit soft rate-limit → retry individually
@@ -366,20 +565,22 @@ class GoogleTranslator(BaseTranslator):
                     "Post-batch: %d unchanged texts, retrying individually...",
                     len(unchanged),
                 )
-                async def retry_one(idx):
+                async def retry_one(idx: int) -> None:
                     txt = results[idx].original_text
                     segments = segment_text(txt)
-                    text_parts = [s.content for s in segments if s.type.name == "TEXT"]
+                    text_parts = [s.content for s in segments if s.type is SegmentType.TEXT]
                     if text_parts:
                         clean_txt = TEXT_SEGMENT_SEPARATOR.join(text_parts)
                     else:
                         clean_txt = txt
-                    r = await self._try_translate(
-                        clean_txt,
-                        results[idx].source_lang,
-                        results[idx].target_lang,
-                        1,
-                    )
+                    async with self._single_retry_sem:
+                        r = await self._try_translate(
+                            clean_txt,
+                            results[idx].source_lang,
+                            results[idx].target_lang,
+                            1,
+                            session=session,
+                        )
                     if r and r[0].strip() != txt.strip():
                         if text_parts:
                             results[idx].translated_text = segmenter_reassemble(r[0], segments)
@@ -387,6 +588,8 @@ class GoogleTranslator(BaseTranslator):
                             results[idx].translated_text = r[0]
                         results[idx].success = True
                         results[idx].error = None
+                        self._remember(requests[idx]['text'], s_lang, t_lang,
+                                       results[idx].translated_text)
                 await asyncio.gather(
                     *(asyncio.create_task(retry_one(i)) for i in unchanged),
                     return_exceptions=True,
@@ -399,47 +602,66 @@ class GoogleTranslator(BaseTranslator):
 
         return results
 
+    def _remember(self, text: str, source: str, target: str, translated: str) -> None:
+        fut = asyncio.get_running_loop().create_future()
+        fut.set_result(translated)
+        self._inflight[(text, source, target)] = fut
+
     def _prepare_slices(self, texts: List[str], source_lang: str = 'auto') -> List[List[str]]:
-        slices = []
-        current_batch = []
-        current_chars = 0
-        from .constants import SAFE_BATCH_SEPARATOR
+        return list(self._iter_slices(texts, source_lang))
+
+    def _iter_slices(self, texts: List[str], source_lang: str = 'auto') -> Iterator[List[str]]:
+        """Yield greedy slices of *texts* lazily.
 
+        The batch size is re-read for every slice, so an adaptive change made
+        while workers drain the iterator applies to the texts still left.
+        """
         sep_len = len(SAFE_BATCH_SEPARATOR)
 
-        _CJK_SOURCE_LANGS = {'ja', 'zh', 'zh-cn', 'zh-tw', 'ko', 'zh-hans', 'zh-hant'}
         cjk_multiplier = 0.25 if source_lang.lower() in _CJK_SOURCE_LANGS else 1.0
         base_limit = min(self.max_chars, self.max_slice_chars)
-        cjk_limit = max(200, int(base_limit * cjk_multiplier))
+        chars_limit = max(200, int(base_limit * cjk_multiplier))
 
-        for text in texts:
-            text_len = len(text)
-            overhead = sep_len if current_batch else 0
-            chars_limit = cjk_limit
-            if len(current_batch) >= self.batch_size or (current_chars + text_len + overhead > chars_limit and current_batch):
-                slices.append(current_batch)
-                current_batch = []
-                current_chars = 0
-                overhead = 0
-            current_batch.append(text)
-            current_chars += text_len + overhead
-
-        if current_batch:
-            slices.append(current_batch)
+        n = len(texts)
+        if not n:
+            return
+        # Common case: the whole request fits in one slice, skip the prefix pass
+        if n <= self._effective_batch_size() and sum(map(len, texts)) + sep_len * (n - 1) <= chars_limit:
+            yield list(texts)
+            return
 
-        return slices
+        # prefix[k] = sum of (len + sep_len) over texts[:k]; a slice texts[i:k]
+        # costs prefix[k] - prefix[i] - sep_len, so each greedy cut point is a
+        # single bisect instead of a per-text Python accumulator.
+        prefix = list(accumulate((len(t) + sep_len for t in texts), initial=0))
+        i = 0
+        while i < n:
+            end = bisect_right(prefix, prefix[i] + sep_len + chars_limit, i + 1) - 1
+            end = min(max(end, i + 1), i + self._effective_batch_size(), n)
+            yield texts[i:end]
+            i = end
 
     def _register_failure(self, endpoint: str, count_failure: bool = True) -> None:
         if not count_failure:
             return
-        health = self._endpoint_health.setdefault(endpoint, {"fails": 0, "banned_until": 0.0})
-        health["fails"] = health.get("fails", 0) + 1
-        if health["fails"] >= self.mirror_max_failures:
-            health["banned_until"] = time.time() + self.mirror_ban_time
-
-    def _register_success(self, endpoint: str) -> None:
-        health = self._endpoint_health.setdefault(endpoint, {"fails": 0, "banned_until": 0.0})
-        health["fails"] = 0
+        health = self._endpoint_health.setdefault(endpoint, _EndpointHealth())
+        health.fails += 1
+        if health.fails >= self.mirror_max_failures:
+            health.banned_until = time.time() + self.mirror_ban_time
+
+    def _register_success(self, endpoint: str, elapsed: float | None = None) -> None:
+        health = self._endpoint_health.setdefault(endpoint, _EndpointHealth())
+        health.fails = 0
+        if elapsed is not None:
+            self._latency_samples.append(elapsed)
+            health.ewma_ms = (1 - _EWMA_ALPHA) * health.ewma_ms + _EWMA_ALPHA * elapsed * 1000.0
+
+    def _hedge_delay(self) -> float:
+        """Seconds to wait on the primary endpoint before hedging: 1.5x the
+        rolling median success latency."""
+        if len(self._latency_samples) < _HEDGE_MIN_SAMPLES:
+            return _HEDGE_DEFAULT_DELAY_SECS
+        return statistics.median(self._latency_samples) * 1.5
 
     # ------------------------------------------------------------------
     # Adaptive concurrency (ported from RenLocalizer)
@@ -470,19 +692,72 @@ class GoogleTranslator(BaseTranslator):
             fail_rate = 1 - (sum(1 for s in successes if s) / len(successes))
             old = self.concurrency
             new = old
+            old_batch = self._effective_batch_size()
             if fail_rate > 0.2 or avg_latency > 1.5:
                 new = max(self.min_concurrency_floor, int(old * 0.8))
+                self._batch_scale = min(_BATCH_SCALE_MAX, self._batch_scale * 1.25)
             elif fail_rate < 0.05 and avg_latency < 0.5:
                 new = min(self.max_concurrency_cap, max(old + 1, int(old * 1.1)))
+                self._batch_scale = max(_BATCH_SCALE_MIN, self._batch_scale * 0.9)
             if new != old:
                 self.concurrency = new
                 self.logger.info(
                     "Adaptive concurrency %d -> %d (lat=%.3fs fail=%.2f%%)",
                     old, new, avg_latency, fail_rate * 100,
                 )
+            new_batch = self._effective_batch_size()
+            if new_batch != old_batch:
+                self.logger.info("Adaptive batch size %d -> %d", old_batch, new_batch)
             self._last_adapt_time = now2
 
-    async def _try_translate(self, text: str, source: str, target: str, expected_count: int, racing: bool = True) -> Optional[List[str]]:
+    def _effective_batch_size(self) -> int:
+        return max(1, round(self.batch_size * self._batch_scale))
+
+    async def _try_translate(
+        self,
+        text: str,
+        source: str,
+        target: str,
+        expected_count: int,
+        racing: bool = True,
+        session: aiohttp.ClientSession | None = None,
+    ) -> Optional[List[str]]:
+        if self._closed.is_set():
+            return None
+        if expected_count != 1:
+            # Multi-text batches are unique by construction
+            return await self._send(text, source, target, expected_count, racing, session)
+
+        key = (text, source, target)
+        pending = self._single_inflight.get(key)
+        if pending is not None:
+            return await asyncio.shield(pending)
+
+        fut = self._single_inflight[key] = asyncio.get_running_loop().create_future()
+        result = None
+        try:
+            result = await self._send(text, source, target, 1, racing, session)
+            return result
+        finally:
+            # A cancelled/failed leader reports None so followers fall back
+            # to their own failure handling instead of hanging
+            fut.set_result(result)
+            del self._single_inflight[key]
+
+    async def _send(
+        self,
+        text: str,
+        source: str,
+        target: str,
+        expected_count: int,
+        racing: bool = True,
+        session: aiohttp.ClientSession | None = None,
+    ) -> Optional[List[str]]:
+        # Resolved once per call (callers in translate_batch pass theirs)
+        # rather than awaited again for every attempt and Lingva instance.
+        if session is None:
+            session = await self._get_session()
+        # Shared by every endpoint/attempt; aiohttp encodes it into the URL
         params = {
             "client": "gtx",
             "sl": source,
@@ -491,19 +766,17 @@ class GoogleTranslator(BaseTranslator):
             "q": text,
         }
 
-        query = urllib.parse.urlencode(params)
-
         use_racing = self.use_multi_endpoint and racing
         n_endpoints = self.racing_endpoints if use_racing else 1
-        endpoints = [self._get_next_endpoint() for _ in range(n_endpoints)]
+        endpoints = self._pick_endpoints(n_endpoints)
 
         async def call_endpoint(ep):
-            query = urllib.parse.urlencode(params)
-            url = f"{ep}?{query}"
-
             ep_sem = self._endpoint_semaphores.setdefault(ep, asyncio.Semaphore(2))
+            bucket = self._buckets.setdefault(urllib.parse.urlsplit(ep).netloc, _TokenBucket())
 
             for attempt in range(1, self.max_retries + 1):
+                if self._closed.is_set():
+                    return None
                 try:
                     if self.request_delay_ms:
                         await asyncio.sleep(self.request_delay_ms / 1000.0 + random.uniform(0, 0.05))
@@ -531,25 +804,34 @@ class GoogleTranslator(BaseTranslator):
                         self._circuit_breaker_active = False
                         self._consecutive_identity_count = 0
 
-                    session = await self._get_session()
+                    await bucket.acquire()
                     async with ep_sem:
-                        req_start = time.time()
+                        req_start = time.monotonic()
                         async with session.get(
-                            url,
+                            ep,
+                            params=params,
                             timeout=aiohttp.ClientTimeout(total=self.timeout_seconds),
                         ) as resp:
-                            elapsed = time.time() - req_start
+                            elapsed = time.monotonic() - req_start
                             if resp.status == 200:
-                                data = await resp.json(content_type=None)
+                                try:
+                                    data = orjson.loads(await resp.read())
+                                except orjson.JSONDecodeError:
+                                    # Truncated/HTML body (captcha page): endpoint
+                                    # failure, but no transport backoff needed
+                                    self.logger.debug(f"Undecodable response from {ep}")
+                                    self._register_failure(ep)
+                                    continue
                                 if not data or not data[0]:
                                     self._register_failure(ep)
                                     continue
 
                                 full = ""
-                                if isinstance(data, list) and len(data) > 0 and isinstance(data[0], list):
-                                    for seg in data[0]:
-                                        if isinstance(seg, list) and len(seg) > 0 and seg[0]:
-                                            full += str(seg[0])
+                                if isinstance(data, list) and isinstance(data[0], list):
+                                    full = "".join(
+                                        str(seg[0]) for seg in data[0]
+                                        if isinstance(seg, list) and seg and seg[0]
+                                    )
 
                                 if not full:
                                     self.logger.warning(f"Empty translation from {ep}")
@@ -567,17 +849,15 @@ class GoogleTranslator(BaseTranslator):
 
                                 self._consecutive_identity_count = 0
                                 self._circuit_breaker_active = False
-                                self._register_success(ep)
+                                self._register_success(ep, elapsed)
+                                bucket.on_success()
                                 if self._consecutive_429_count > 0:
                                     self._consecutive_429_count -= 1
                                 asyncio.ensure_future(self._record_metric(elapsed, True))
 
-                                full = re.sub(r'\|\s*\|\s*\|RPGMSEP_S\|\s*\|\s*\|', '|||RPGMSEP_S|||', full)
-                                full = re.sub(r'\|\s*\|\s*\|RPGMSEP_M\|\s*\|\s*\|', '|||RPGMSEP_M|||', full)
-                                full = re.sub(r'\|\s*\|\s*\|RPGMSEP_I\|\s*\|\s*\|', '|||RPGMSEP_I|||', full)
-                                full = re.sub(r'\|\s*\|\s*\|TXTSEG\|\s*\|\s*\|', '|||TXTSEG|||', full)
+                                full = _SEPARATOR_REPAIR_RE.sub(r'|||\1|||', full)
 
-                                parts = self.BATCH_SPLIT_PATTERN.split(full)
+                                parts = _split_batch(full)
                                 parts = [p.strip() for p in parts if p.strip()]
                                 if len(parts) > expected_count:
                                     parts = parts[:expected_count]
@@ -594,6 +874,7 @@ class GoogleTranslator(BaseTranslator):
                                 asyncio.ensure_future(self._record_metric(elapsed, False))
                                 # Escalating global cooldown: 3s→6s→12s→24s (capped 30s)
                                 self._consecutive_429_count += 1
+                                bucket.on_throttled()
                                 global_wait = min(3.0 * (2 ** (self._consecutive_429_count - 1)), 30.0)
                                 self._global_cooldown_until = max(
                                     self._global_cooldown_until,
@@ -618,28 +899,41 @@ class GoogleTranslator(BaseTranslator):
                     await asyncio.sleep(wait_time)
             return None
 
-        result_found = asyncio.Event()
+        # Hedged racing: start one endpoint; a backup is launched only when
+        # the primary outlives the hedge delay (budgeted) or gives up
+        # (failover, free). Healthy runs send ~1 request per batch.
         final_result = None
-
-        async def call_and_signal(ep: str) -> None:
-            nonlocal final_result
-            res = await call_endpoint(ep)
-            if res and not result_found.is_set():
-                result_found.set()
-                final_result = res
-
+        backups = endpoints[1:]
+        pending = {asyncio.create_task(call_endpoint(endpoints[0]))}
+        self._hedge_tokens = min(_HEDGE_TOKEN_CAP, self._hedge_tokens + _HEDGE_BUDGET_RATIO)
         try:
-            async with asyncio.TaskGroup() as tg:
-                tasks = [tg.create_task(call_and_signal(ep)) for ep in endpoints]
-                while not result_found.is_set() and any(not t.done() for t in tasks):
-                    await asyncio.sleep(0.05)
-                if result_found.is_set():
-                    for t in tasks:
-                        if not t.done():
-                            t.cancel()
-                    return final_result
-        except* Exception:
-            pass
+            while pending and not final_result:
+                can_hedge = bool(backups) and self._hedge_tokens >= 1.0
+                done, pending = await asyncio.wait(
+                    pending,
+                    timeout=self._hedge_delay() if can_hedge else None,
+                    return_when=asyncio.FIRST_COMPLETED,
+                )
+                for t in done:
+                    if t.cancelled() or t.exception() is not None:
+                        continue
+                    if t.result():
+                        final_result = t.result()
+                        break
+                if final_result or not backups:
+                    continue
+                if not pending:
+                    pending.add(asyncio.create_task(call_endpoint(backups.pop(0))))
+                elif not done and can_hedge:
+                    self._hedge_tokens -= 1.0
+                    pending.add(asyncio.create_task(call_endpoint(backups.pop(0))))
+        finally:
+            # Racing losers must be reaped, not just cancelled: an un-awaited
+            # cancelled task keeps its pooled connection until GC.
+            for t in pending:
+                t.cancel()
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
 
         if final_result:
             return final_result
@@ -647,19 +941,22 @@ class GoogleTranslator(BaseTranslator):
         # Lingva fallback
         if self.enable_lingva_fallback and expected_count == 1:
             n = len(self.lingva_instances)
+            # Path segment: '/' must be escaped too or it splits the route
+            quoted = urllib.parse.quote(text, safe="")
             for _ in range(n):
+                if self._closed.is_set():
+                    return None
                 try:
                     instance = self._get_next_lingva()
-                    url = f"{instance}/api/v1/{source}/{target}/{urllib.parse.quote(text)}"
-                    session = await self._get_session()
+                    url = f"{instance}/api/v1/{source}/{target}/{quoted}"
                     async with session.get(url, timeout=aiohttp.ClientTimeout(total=min(self.timeout_seconds, 15))) as resp:
                         if resp.status == 200:
-                            data = await resp.json()
+                            data = orjson.loads(await resp.read())
                             trans = data.get("translation", "")
                             if trans.strip() == text.strip():
                                 self.logger.warning(f"Identity response from Lingva {instance}")
                                 continue
-                            parts = self.BATCH_SPLIT_PATTERN.split(trans.strip())
+                            parts = _split_batch(trans.strip())
                             parts = [p.strip() for p in parts if p.strip()]
                             if len(parts) > expected_count:
                                 parts = parts[:expected_count]
@@ -3,6 +3,7 @@ Validation module for RPGMLocalizer.
 Ensures translation integrity and safety before saving files.
 """
 import logging
+from collections import deque
 from typing import Dict, List, Any, Tuple, Optional
 from dataclasses import dataclass, field
 
@@ -68,43 +69,44 @@ class Validator:
     @staticmethod
     def validate_json_structure(original_data: Any, translated_data: Any) -> bool:
         """
-        Recursively validate that the structure of translated data matches original.
+        Validate that the structure of translated data matches original.
         Checks list lengths and key presence for critical structures.
+
+        Walks iteratively, so nesting depth is not bounded by the recursion
+        limit; lists are sampled by their first item.
         """
-        if type(original_data) != type(translated_data):
-            logger.error(f"Type mismatch: {type(original_data)} vs {type(translated_data)}")
-            return False
-            
-        if isinstance(original_data, list):
-            if len(original_data) != len(translated_data):
-                logger.error(f"List length mismatch: {len(original_data)} vs {len(translated_data)}")
-                return False
-            # Check first item's structure if list is not empty
-            if len(original_data) > 0:
-                return Validator.validate_json_structure(original_data[0], translated_data[0])
-            return True
-            
-        if isinstance(original_data, dict):
-            # Check that all original keys are present in translated
-            original_keys = set(original_data.keys())
-            translated_keys = set(translated_data.keys())
-            
-            # All original keys must be present
-            if not (original_keys <= translated_keys):
-                missing_keys = original_keys - translated_keys
-                logger.error(f"Missing keys in translated data: {missing_keys}")
-                return False
-            
-            # Recursively check values for nested structures
-            for key in original_keys:
-                orig_val = original_data[key]
-                trans_val = translated_data.get(key)
-                
-                if isinstance(orig_val, (dict, list)):
-                    if not Validator.validate_json_structure(orig_val, trans_val):
-                        logger.error(f"Structure mismatch at key '{key}'")
-                        return False
-            
-            return True
-            
+        pending = deque([(original_data, translated_data, None)])
+
+        while pending:
+            orig, trans, key = pending.popleft()
+            if type(orig) != type(trans):
+                logger.error(f"Type mismatch: {type(orig)} vs {type(trans)}")
+                return Validator._structure_mismatch(key)
+
+            if isinstance(orig, list):
+                if len(orig) != len(trans):
+                    logger.error(f"List length mismatch: {len(orig)} vs {len(trans)}")
+                    return Validator._structure_mismatch(key)
+                # Check first item's structure if list is not empty
+                if orig:
+                    pending.append((orig[0], trans[0], key))
+
+            elif isinstance(orig, dict):
+                # All original keys must be present
+                missing_keys = orig.keys() - trans.keys()
+                if missing_keys:
+                    logger.error(f"Missing keys in translated data: {missing_keys}")
+                    return Validator._structure_mismatch(key)
+
+                # Queue nested structures; plain values need no check
+                for k, orig_val in orig.items():
+                    if isinstance(orig_val, (dict, list)):
+                        pending.append((orig_val, trans[k], k if key is None else key))
+
         return True
+
+    @staticmethod
+    def _structure_mismatch(key: Any) -> bool:
+        if key is not None:
+            logger.error(f"Structure mismatch at key '{key}'")
+        return False
@@ -1,7 +1,7 @@
 from datetime import datetime
 from PyQt6.QtWidgets import QWidget, QVBoxLayout
 from PyQt6.QtCore import QTimer
-from PyQt6.QtGui import QFont, QTextCursor
+from PyQt6.QtGui import QColor, QFont, QTextCharFormat, QTextCursor
 from qfluentwidgets import TextEdit, StrongBodyLabel
 
 
@@ -9,9 +9,12 @@ class ConsoleLog(QWidget):
     """
     A buffered console log viewer.
 
-    Batches log signals via QTimer and uses plain-text block append
+    Batches log signals via a single-shot QTimer that is armed by the
+    first pending line (so an idle console never wakes up) and uses
+    plain-text block append
     (not HTML) to avoid the overhead of QTextEdit's HTML renderer.
-    ``MAX_LINES`` is kept moderate to keep ``blockCount()`` trimming cheap.
+    Each line is its own block so the document's ``maximumBlockCount``
+    drops old lines natively.
     """
 
     FLUSH_INTERVAL_MS = 200
@@ -24,8 +27,10 @@ class ConsoleLog(QWidget):
         "info":    "#7b93b5",
     }
 
-    def __init__(self, parent=None, show_label=True):
+    def __init__(self, parent=None, show_label=True, max_lines: int | None = None):
         super().__init__(parent)
+        if max_lines is not None:
+            self.MAX_LINES = max_lines
         self.setMinimumHeight(120)
 
         layout = QVBoxLayout(self)
@@ -42,52 +47,64 @@ class ConsoleLog(QWidget):
         font.setFamilies(["Consolas", "SF Mono", "Liberation Mono", "DejaVu Sans Mono", "monospace"])
         font.setPointSize(10)
         self.textEdit.setFont(font)
+        self.textEdit.document().setMaximumBlockCount(self.MAX_LINES)
         layout.addWidget(self.textEdit)
 
-        self._pending: list[str] = []
+        self._formats: dict[str, QTextCharFormat] = {}
+        self._pending: list[tuple[str, str]] = []
+
+        # "[HH:MM:SS] " prefix, reformatted only when the second changes
+        self._ts_second = -1
+        self._ts_prefix = ""
 
         self._flush_timer = QTimer(self)
+        self._flush_timer.setSingleShot(True)
         self._flush_timer.setInterval(self.FLUSH_INTERVAL_MS)
         self._flush_timer.timeout.connect(self._flush_pending)
-        self._flush_timer.start()
 
     def log(self, level: str, message: str) -> None:
-        color = self._COLORS.get(level, "#e0e0e0")
-        ts = datetime.now().strftime("%H:%M:%S")
-        safe = message.replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;")
-        self._pending.append(
-            f'<span style="color:{color};">[{ts}] {safe}</span>'
-        )
+        now = datetime.now()
+        second = int(now.timestamp())
+        if second != self._ts_second:
+            self._ts_second = second
+            self._ts_prefix = now.strftime("[%H:%M:%S] ")
+        self._pending.append((level, self._ts_prefix + message))
+        if not self._flush_timer.isActive():
+            self._flush_timer.start()
+
+    def flush(self) -> None:
+        """Write pending lines now instead of on the next timer tick."""
+        self._flush_timer.stop()
+        self._flush_pending()
 
     def clear(self) -> None:
+        self._flush_timer.stop()
         self._pending.clear()
         self.textEdit.clear()
 
+    def _format(self, level: str) -> QTextCharFormat:
+        fmt = self._formats.get(level)
+        if fmt is None:
+            fmt = QTextCharFormat()
+            fmt.setForeground(QColor(self._COLORS.get(level, "#e0e0e0")))
+            self._formats[level] = fmt
+        return fmt
+
     def _flush_pending(self) -> None:
         if not self._pending:
             return
-        batch = "<br>".join(self._pending)
+        # Lines beyond MAX_LINES would be trimmed right away; skip them
+        batch = self._pending[-self.MAX_LINES:]
         self._pending.clear()
 
-        self._trim()
-        # Use insertPlainText + moveCursor instead of append() to avoid
-        # full-document HTML re-render on every flush.
-        cursor = self.textEdit.textCursor()
+        doc = self.textEdit.document()
+        cursor = QTextCursor(doc)
         cursor.movePosition(QTextCursor.MoveOperation.End)
-        cursor.insertHtml(batch + "<br>")
+        cursor.beginEditBlock()
+        for level, line in batch:
+            if not doc.isEmpty():
+                cursor.insertBlock()
+            cursor.insertText(line, self._format(level))
+        cursor.endEditBlock()
         # Scroll to bottom
-        cursor.movePosition(QTextCursor.MoveOperation.End)
-        self.textEdit.setTextCursor(cursor)
-
-    def _trim(self) -> None:
-        doc = self.textEdit.document()
-        if doc.blockCount() <= self.MAX_LINES:
-            return
-        excess = doc.blockCount() - self.MAX_LINES
-        cursor = self.textEdit.textCursor()
-        cursor.movePosition(QTextCursor.MoveOperation.Start)
-        for _ in range(excess):
-            cursor.movePosition(QTextCursor.MoveOperation.Down,
-                                QTextCursor.MoveMode.KeepAnchor)
-        cursor.removeSelectedText()
         self.textEdit.setTextCursor(cursor)
@@ -1,13 +1,24 @@
-from PyQt6.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QLabel
+import datetime
+import os
+from typing import Optional
+
+from PyQt6.QtWidgets import QWidget, QVBoxLayout, QLabel
 from PyQt6.QtCore import Qt
-from PyQt6.QtGui import QPixmap, QFont
+from PyQt6.QtGui import QPixmap
 from qfluentwidgets import (ScrollArea, CardWidget, StrongBodyLabel, CaptionLabel, 
-                            PrimaryPushButton, FluentIcon as FIF, BodyLabel, HyperlinkButton)
+                            PrimaryPushButton, FluentIcon as FIF, BodyLabel)
 
 from version import VERSION
 
+_CURRENT_YEAR = datetime.date.today().year
+_ICON_SIZE = 96
+
+
 class AboutInterface(ScrollArea):
     """ About Interface displaying app info and credits """
+
+    # Scaled header icon, decoded and smooth-scaled once per process
+    _ICON_CACHE: Optional[QPixmap] = None
     
     def __init__(self, parent=None):
         super().__init__(parent)
@@ -27,12 +38,9 @@ class AboutInterface(ScrollArea):
         # Icon
         self.lbl_icon = QLabel()
         # Ensure we have an icon, otherwise fallback
-        from src.utils.paths import existing_resource_path
-        
-        icon_path = existing_resource_path("icon.png", "icon.ico")
-        if icon_path:
-            pixmap = QPixmap(icon_path)
-            self.lbl_icon.setPixmap(pixmap.scaled(96, 96, Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation))
+        pixmap = self._header_icon()
+        if pixmap is not None:
+            self.lbl_icon.setPixmap(pixmap)
         else:
             self.lbl_icon.setText("RL")
             self.lbl_icon.setStyleSheet("font-size: 48px; font-weight: bold; color: #00b4d8;")
@@ -82,9 +90,7 @@ class AboutInterface(ScrollArea):
         self.lbl_license = CaptionLabel("GNU GPLv3", self.scrollWidget)
         self.lbl_license.setAlignment(Qt.AlignmentFlag.AlignCenter)
         
-        import datetime
-        current_year = datetime.datetime.now().year
-        self.lbl_copyright = CaptionLabel(f"Copyright © {current_year} LordOfTurk. All rights reserved.", self.scrollWidget)
+        self.lbl_copyright = CaptionLabel(f"Copyright © {_CURRENT_YEAR} LordOfTurk. All rights reserved.", self.scrollWidget)
         self.lbl_copyright.setAlignment(Qt.AlignmentFlag.AlignCenter)
 
         # Add to main layout
@@ -104,3 +110,36 @@ class AboutInterface(ScrollArea):
     def _open_patreon(self):
         import webbrowser
         webbrowser.open("https://www.patreon.com/cw/LordOfTurk")
+
+    @classmethod
+    def _header_icon(cls) -> Optional[QPixmap]:
+        if cls._ICON_CACHE is None:
+            from src.utils.paths import existing_resource_path
+
+            icon_path = existing_resource_path("icon.png", "icon.ico")
+            if not icon_path:
+                return None
+            cls._ICON_CACHE = cls._load_scaled_icon(icon_path)
+        return cls._ICON_CACHE
+
+    @staticmethod
+    def _load_scaled_icon(icon_path: str) -> QPixmap:
+        # The smooth scale is persisted next to the translation cache and
+        # reused until the source icon is newer than the cached copy
+        cache_path = None
+        try:
+            from src.utils.app_paths import get_cache_dir
+
+            cache_path = os.path.join(str(get_cache_dir()), f"about_icon_{_ICON_SIZE}.png")
+            if os.path.getmtime(cache_path) >= os.path.getmtime(icon_path):
+                cached = QPixmap(cache_path)
+                if not cached.isNull():
+                    return cached
+        except OSError:
+            pass
+        pixmap = QPixmap(icon_path).scaled(
+            _ICON_SIZE, _ICON_SIZE, Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation
+        )
+        if cache_path and not pixmap.isNull():
+            pixmap.save(cache_path, "PNG")
+        return pixmap
@@ -1,6 +1,6 @@
-from PyQt6.QtWidgets import QWidget, QVBoxLayout, QFileDialog, QHBoxLayout
+from PyQt6.QtWidgets import QWidget, QVBoxLayout, QFileDialog
 from qfluentwidgets import (ScrollArea, SettingCardGroup, PushSettingCard, FluentIcon as FIF, PrimaryPushButton, SwitchSettingCard)
-from PyQt6.QtCore import Qt, pyqtSignal as Signal
+from PyQt6.QtCore import pyqtSignal as Signal
 
 class ExportInterface(ScrollArea):
     """
@@ -1,14 +1,109 @@
-from typing import cast
-from PyQt6.QtCore import Qt, pyqtSignal
+from typing import Any, Callable, cast
+from PyQt6.QtCore import Qt, pyqtSignal, QAbstractTableModel, QModelIndex, QTimer
 from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QHeaderView, 
-                             QFileDialog, QTableWidgetItem)
+                             QFileDialog, QAbstractItemView)
 from qfluentwidgets import (ScrollArea, PrimaryPushButton, PushButton, 
-                            TableWidget, FluentIcon as FIF, LineEdit, 
+                            TableView, FluentIcon as FIF, LineEdit, 
                             ComboBox, SwitchButton, SubtitleLabel, InfoBar, CheckBox, CaptionLabel)
 
 from src.core.glossary import Glossary, create_sample_glossary
 import os
 
+
+class GlossaryTableModel(QAbstractTableModel):
+    """Read-only table model over ``Glossary.terms``.
+
+    Terms are flattened once into display tuples, so painting a cell is a
+    list index instead of dict lookups, and adding a term costs one row
+    insert instead of a full table rebuild.
+    """
+
+    HEADERS = ("Original", "Translation", "Type")
+
+    def __init__(self, glossary: Glossary, parent=None):
+        super().__init__(parent)
+        self.glossary = glossary
+        self._rows: list[tuple[str, str, str]] = []
+        self._row_of: dict[str, int] = {}
+        self._rebuild()
+
+    @staticmethod
+    def _display_row(original: str, entry: Any) -> tuple[str, str, str]:
+        if not isinstance(entry, dict):
+            entry = {}
+        return (original, entry.get('translation', ""),
+                "Regex" if entry.get('is_regex') else "Text")
+
+    def _rebuild(self) -> None:
+        display_row = self._display_row
+        self._rows = [display_row(k, v) for k, v in self.glossary.terms.items()]
+        self._row_of = {row[0]: i for i, row in enumerate(self._rows)}
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole) -> Any:
+        # Only DisplayRole is answered; the view's per-paint queries for
+        # font/color/alignment roles fall through to the delegate defaults
+        if role != Qt.ItemDataRole.DisplayRole or not index.isValid():
+            return None
+        return self._rows[index.row()][index.column()]
+
+    def headerData(self, section: int, orientation: Qt.Orientation,
+                   role: int = Qt.ItemDataRole.DisplayRole) -> Any:
+        if role == Qt.ItemDataRole.DisplayRole and orientation == Qt.Orientation.Horizontal:
+            return self.HEADERS[section]
+        return None
+
+    def add_term(self, original: str, translation: str, is_regex: bool) -> bool:
+        """Add or update a term in the glossary and notify the view.
+
+        Returns False without touching the view when nothing changed.
+        """
+        if not self.glossary.add_term(original, translation, is_regex):
+            return False
+        display = self._display_row(original, self.glossary.terms[original])
+        row = self._row_of.get(original)
+        if row is not None:
+            # dict update keeps the key's position, so the row is unchanged
+            self._rows[row] = display
+            self.dataChanged.emit(self.index(row, 1), self.index(row, 2))
+            return True
+        row = len(self._rows)
+        self.beginInsertRows(QModelIndex(), row, row)
+        self._rows.append(display)
+        self._row_of[original] = row
+        self.endInsertRows()
+        return True
+
+    def clear(self) -> None:
+        self.glossary.terms.clear()
+        if not self._rows:
+            return
+        # One contiguous removal instead of a reset: the view keeps its
+        # header/selection state and gets a single rowsRemoved signal
+        self.beginRemoveRows(QModelIndex(), 0, len(self._rows) - 1)
+        self._rows = []
+        self._row_of = {}
+        self.endRemoveRows()
+
+    def reload(self, loader: Callable[[], bool]) -> bool:
+        """Run a bulk glossary mutation inside one model reset.
+
+        The view gets a single structural notification and never reads rows
+        mid-load; rows are re-read even when *loader* fails partway.
+        """
+        self.beginResetModel()
+        try:
+            return loader()
+        finally:
+            self._rebuild()
+            self.endResetModel()
+
+
 class GlossaryInterface(ScrollArea):
     """ Interface for managing the glossary. """
     
@@ -25,6 +120,13 @@ class GlossaryInterface(ScrollArea):
         
         self.setWidget(self.view)
         self.setWidgetResizable(True)
+
+        # Duplicate-term warnings are coalesced into one InfoBar per burst
+        self._pending_duplicates: list[str] = []
+        self._warn_timer = QTimer(self)
+        self._warn_timer.setSingleShot(True)
+        self._warn_timer.setInterval(200)
+        self._warn_timer.timeout.connect(self._flush_warnings)
         
         self._init_ui()
         self._connect_signals()
@@ -78,14 +180,26 @@ class GlossaryInterface(ScrollArea):
         self.vBoxLayout.addLayout(self.hBoxActions)
         
         # 4. Table
-        self.table = TableWidget(self)
-        self.table.setColumnCount(3)
-        self.table.setHorizontalHeaderLabels(["Original", "Translation", "Type"])
+        self.model = GlossaryTableModel(self.glossary, self)
+        self.table = TableView(self)
+        self.table.setModel(self.model)
         vertical_header = cast(QHeaderView, self.table.verticalHeader())
         horizontal_header = cast(QHeaderView, self.table.horizontalHeader())
         vertical_header.hide()
-        horizontal_header.setSectionResizeMode(QHeaderView.ResizeMode.Stretch)
-        horizontal_header.setSectionResizeMode(2, QHeaderView.ResizeMode.ResizeToContents) # Type column
+        # Nothing below measures cell contents: rows share one fixed height
+        # and columns have set widths, so large glossaries never trigger a
+        # per-row size-hint pass on insert/reset.
+        vertical_header.setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
+        vertical_header.setDefaultSectionSize(self.table.fontMetrics().height() + 16)
+        self.table.setWordWrap(False)
+        self.table.setVerticalScrollMode(QAbstractItemView.ScrollMode.ScrollPerPixel)
+        horizontal_header.setSectionResizeMode(0, QHeaderView.ResizeMode.Interactive)
+        horizontal_header.resizeSection(0, 300)
+        horizontal_header.setSectionResizeMode(1, QHeaderView.ResizeMode.Stretch)
+        # Type column only ever holds "Regex"/"Text": size it once instead of
+        # ResizeToContents, which re-measures every row on each insert/reset
+        horizontal_header.setSectionResizeMode(2, QHeaderView.ResizeMode.Fixed)
+        horizontal_header.resizeSection(2, self.table.fontMetrics().horizontalAdvance("Regex") + 48)
         self.table.setBorderRadius(8)
         self.table.setBorderVisible(True)
         
@@ -115,11 +229,12 @@ class GlossaryInterface(ScrollArea):
             InfoBar.warning("Input Error", "Both fields are required.", parent=self)
             return
             
-        if original in self.glossary.terms:
-            InfoBar.warning("Duplicate", "Term exists. Updating it.", parent=self)
-        
-        self.glossary.add_term(original, trans, is_regex)
-        self._refresh_table()
+        exists = original in self.glossary.terms
+        if self.model.add_term(original, trans, is_regex):
+            if exists:
+                self._pending_duplicates.append(original)
+                self._warn_timer.start()
+            self._update_status()
         
         # Clear inputs and focus original
         self.txt_original.clear()
@@ -127,23 +242,15 @@ class GlossaryInterface(ScrollArea):
         self.chk_regex.setChecked(False)
         self.txt_original.setFocus()
         
-    def _refresh_table(self):
-        self.table.setRowCount(0)
-        self.table.setRowCount(len(self.glossary))
-        
-        # self.glossary.terms is now {key: {translation, is_regex}}
-        for i, (orig, data) in enumerate(self.glossary.terms.items()):
-            translation = data['translation']
-            is_regex = data['is_regex']
-            
-            item_orig = QTableWidgetItem(orig)
-            item_trans = QTableWidgetItem(translation)
-            item_type = QTableWidgetItem("Regex" if is_regex else "Text")
-            
-            self.table.setItem(i, 0, item_orig)
-            self.table.setItem(i, 1, item_trans)
-            self.table.setItem(i, 2, item_type)
-            
+    def _flush_warnings(self):
+        count = len(self._pending_duplicates)
+        self._pending_duplicates.clear()
+        if count == 1:
+            InfoBar.warning("Duplicate", "Term exists. Updating it.", parent=self)
+        elif count:
+            InfoBar.warning("Duplicate", f"{count} existing terms updated.", parent=self)
+
+    def _update_status(self):
         self.lbl_status.setText(f"Terms: {len(self.glossary)}")
         
     def load_glossary(self):
@@ -151,9 +258,10 @@ class GlossaryInterface(ScrollArea):
             self, "Open Glossary", "", "JSON Files (*.json)"
         )
         if file_path:
-            if self.glossary.load(file_path):
+            loaded = self.model.reload(lambda: self.glossary.load(file_path))
+            self._update_status()
+            if loaded:
                 self.current_file_path = file_path
-                self._refresh_table()
                 self.glossary_selected.emit(file_path)
                 InfoBar.success("Success", f"Loaded {os.path.basename(file_path)}", parent=self)
             else:
@@ -183,12 +291,13 @@ class GlossaryInterface(ScrollArea):
             self.load_glossary_from_path(file_path)
             
     def load_glossary_from_path(self, path):
-        if self.glossary.load(path):
+        loaded = self.model.reload(lambda: self.glossary.load(path))
+        self._update_status()
+        if loaded:
             self.current_file_path = path
-            self._refresh_table()
             InfoBar.success("Success", "Sample loaded.", parent=self)
 
     def clear_glossary(self):
-        self.glossary.terms.clear()
-        self._refresh_table()
+        self.model.clear()
+        self._update_status()
         InfoBar.info("Cleared", "Glossary cleared.", parent=self)
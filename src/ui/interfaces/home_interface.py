@@ -1,15 +1,69 @@
 import os
+import re
 from typing import Optional
 from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QFileDialog,
-                             QSplitter, QFrame)
-from PyQt6.QtCore import Qt, pyqtSignal as Signal, QSize
+                             QSplitter)
+from PyQt6.QtCore import Qt, pyqtSignal as Signal, QObject, QRunnable, QThreadPool
 from qfluentwidgets import (LineEdit, PrimaryPushButton, PushButton, ComboBox,
                             StrongBodyLabel, CaptionLabel, CardWidget, BodyLabel,
                             FluentIcon as FIF, ProgressBar, InfoBar, InfoBarPosition,
-                            SimpleCardWidget, HeaderCardWidget)
+                            SimpleCardWidget)
 
 from src.ui.components.console_log import ConsoleLog
 
+# Google Translate supports 130+ languages.
+# Source list has "Auto Detect" prepended; target list is pure.
+_ALL_LANGS = (
+    ("Afrikaans", "af"), ("Albanian", "sq"), ("Amharic", "am"),
+    ("Arabic", "ar"), ("Armenian", "hy"), ("Assamese", "as"), ("Aymara", "ay"),
+    ("Azerbaijani", "az"), ("Bambara", "bm"), ("Basque", "eu"),
+    ("Belarusian", "be"), ("Bengali", "bn"), ("Bhojpuri", "bho"),
+    ("Bosnian", "bs"), ("Bulgarian", "bg"), ("Catalan", "ca"),
+    ("Cebuano", "ceb"), ("Chinese (Simplified)", "zh-CN"),
+    ("Chinese (Traditional)", "zh-TW"), ("Corsican", "co"), ("Croatian", "hr"),
+    ("Czech", "cs"), ("Danish", "da"), ("Dhivehi", "dv"), ("Dogri", "doi"),
+    ("Dutch", "nl"), ("English", "en"), ("Esperanto", "eo"),
+    ("Estonian", "et"), ("Ewe", "ee"), ("Filipino", "tl"), ("Finnish", "fi"),
+    ("French", "fr"), ("Frisian", "fy"), ("Galician", "gl"),
+    ("Georgian", "ka"), ("German", "de"), ("Greek", "el"), ("Guarani", "gn"),
+    ("Gujarati", "gu"), ("Haitian Creole", "ht"), ("Hausa", "ha"),
+    ("Hawaiian", "haw"), ("Hebrew", "he"), ("Hindi", "hi"), ("Hmong", "hmn"),
+    ("Hungarian", "hu"), ("Icelandic", "is"), ("Igbo", "ig"),
+    ("Ilocano", "ilo"), ("Indonesian", "id"), ("Irish", "ga"),
+    ("Italian", "it"), ("Japanese", "ja"), ("Javanese", "jv"),
+    ("Kannada", "kn"), ("Kazakh", "kk"), ("Khmer", "km"),
+    ("Kinyarwanda", "rw"), ("Konkani", "gom"), ("Korean", "ko"),
+    ("Krio", "kri"), ("Kurdish", "ku"), ("Kurdish (Sorani)", "ckb"),
+    ("Kyrgyz", "ky"), ("Lao", "lo"), ("Latin", "la"), ("Latvian", "lv"),
+    ("Lingala", "ln"), ("Lithuanian", "lt"), ("Luganda", "lg"),
+    ("Luxembourgish", "lb"), ("Macedonian", "mk"), ("Maithili", "mai"),
+    ("Malagasy", "mg"), ("Malay", "ms"), ("Malayalam", "ml"),
+    ("Maltese", "mt"), ("Maori", "mi"), ("Marathi", "mr"),
+    ("Meiteilon (Manipuri)", "mni"), ("Mizo", "lus"), ("Mongolian", "mn"),
+    ("Myanmar (Burmese)", "my"), ("Nepali", "ne"), ("Norwegian", "no"),
+    ("Nyanja (Chichewa)", "ny"), ("Odia (Oriya)", "or"), ("Oromo", "om"),
+    ("Pashto", "ps"), ("Persian", "fa"), ("Polish", "pl"),
+    ("Portuguese", "pt"), ("Portuguese (Brazil)", "pt-BR"), ("Punjabi", "pa"),
+    ("Quechua", "qu"), ("Romanian", "ro"), ("Russian", "ru"), ("Samoan", "sm"),
+    ("Sanskrit", "sa"), ("Scots Gaelic", "gd"), ("Serbian", "sr"),
+    ("Sesotho", "st"), ("Shona", "sn"), ("Sindhi", "sd"), ("Sinhala", "si"),
+    ("Slovak", "sk"), ("Slovenian", "sl"), ("Somali", "so"), ("Spanish", "es"),
+    ("Sundanese", "su"), ("Swahili", "sw"), ("Swedish", "sv"), ("Tajik", "tg"),
+    ("Tamil", "ta"), ("Tatar", "tt"), ("Telugu", "te"), ("Thai", "th"),
+    ("Tigrinya", "ti"), ("Tsonga", "ts"), ("Turkish", "tr"), ("Turkmen", "tk"),
+    ("Twi (Akan)", "ak"), ("Ukrainian", "uk"), ("Urdu", "ur"),
+    ("Uyghur", "ug"), ("Uzbek", "uz"), ("Vietnamese", "vi"), ("Welsh", "cy"),
+    ("Xhosa", "xh"), ("Yiddish", "yi"), ("Yoruba", "yo"), ("Zulu", "zu"),
+)
+
+# Parallel name/code tuples in combo item order: codes are looked up by
+# currentIndex() and names by code index, so no dict is needed.
+TARGET_NAMES = tuple(name for name, _ in _ALL_LANGS)
+TARGET_CODES = tuple(code for _, code in _ALL_LANGS)
+SOURCE_NAMES = ("Auto Detect",) + TARGET_NAMES
+SOURCE_CODES = ("auto",) + TARGET_CODES
+assert len(SOURCE_NAMES) == len(SOURCE_CODES) and len(set(SOURCE_CODES)) == len(SOURCE_CODES)
+
 
 class _LogCard(CardWidget):
     """Card wrapping a ConsoleLog widget for the dashboard."""
@@ -19,74 +73,54 @@ class _LogCard(CardWidget):
         layout = QVBoxLayout(self)
         layout.setContentsMargins(0, 0, 0, 0)
         # Dashboard console: smaller buffer, no separate label
-        self.console = ConsoleLog(self, show_label=False)
-        self.console.MAX_LINES = 150
+        self.console = ConsoleLog(self, show_label=False, max_lines=150)
         layout.addWidget(self.console)
 
 
+def _suffix_pattern(extensions: tuple) -> re.Pattern:
+    """Compile *extensions* into one case-insensitive end-of-name pattern.
+
+    Each directory entry is then tested with a single C-level search, with
+    no lowercased copy of the name.
+    """
+    alternatives = "|".join(re.escape(ext.lstrip(".")) for ext in extensions)
+    return re.compile(rf"\.(?:{alternatives})\Z", re.IGNORECASE)
+
+
+class _EncryptedScanSignals(QObject):
+    # (scan token, encrypted file names); names empty when the game is fine
+    finished = Signal(int, list)
+
+
+class _EncryptedScanTask(QRunnable):
+    """Runs the encrypted-game directory scan on HomeInterface's scan pool."""
+
+    def __init__(self, token: int, path: str, signals: _EncryptedScanSignals):
+        super().__init__()
+        self.token = token
+        self.path = path
+        self.signals = signals
+
+    def run(self) -> None:
+        try:
+            found = HomeInterface._scan_encrypted_game(self.path)
+        except Exception:
+            found = []
+        self.signals.finished.emit(self.token, found)
+
+
 class HomeInterface(QWidget):
     """
     Dashboard: project + languages + controls on left,
     progress + live console log on right.
     """
     ENCRYPTED_ARCHIVE_EXTENSIONS = ('.rgss3a', '.rpgmvp', '.rpgmvo', '.rpgmvm')
+    _ENCRYPTED_RX = _suffix_pattern(ENCRYPTED_ARCHIVE_EXTENSIONS)
+    _DATA_RX = _suffix_pattern(('.json', '.rvdata2', '.rxdata'))
 
     start_requested = Signal(dict)
     stop_requested = Signal()
 
-    # Google Translate supports 130+ languages.
-    # Source list has "Auto Detect" prepended; target list is pure.
-    _ALL_LANGS = {
-        "Afrikaans": "af", "Albanian": "sq", "Amharic": "am",
-        "Arabic": "ar", "Armenian": "hy", "Assamese": "as",
-        "Aymara": "ay", "Azerbaijani": "az", "Bambara": "bm",
-        "Basque": "eu", "Belarusian": "be", "Bengali": "bn",
-        "Bhojpuri": "bho", "Bosnian": "bs", "Bulgarian": "bg",
-        "Catalan": "ca", "Cebuano": "ceb", "Chinese (Simplified)": "zh-CN",
-        "Chinese (Traditional)": "zh-TW", "Corsican": "co",
-        "Croatian": "hr", "Czech": "cs", "Danish": "da",
-        "Dhivehi": "dv", "Dogri": "doi", "Dutch": "nl",
-        "English": "en", "Esperanto": "eo", "Estonian": "et",
-        "Ewe": "ee", "Filipino": "tl", "Finnish": "fi",
-        "French": "fr", "Frisian": "fy", "Galician": "gl",
-        "Georgian": "ka", "German": "de", "Greek": "el",
-        "Guarani": "gn", "Gujarati": "gu", "Haitian Creole": "ht",
-        "Hausa": "ha", "Hawaiian": "haw", "Hebrew": "he",
-        "Hindi": "hi", "Hmong": "hmn", "Hungarian": "hu",
-        "Icelandic": "is", "Igbo": "ig", "Ilocano": "ilo",
-        "Indonesian": "id", "Irish": "ga", "Italian": "it",
-        "Japanese": "ja", "Javanese": "jv", "Kannada": "kn",
-        "Kazakh": "kk", "Khmer": "km", "Kinyarwanda": "rw",
-        "Konkani": "gom", "Korean": "ko", "Krio": "kri",
-        "Kurdish": "ku", "Kurdish (Sorani)": "ckb", "Kyrgyz": "ky",
-        "Lao": "lo", "Latin": "la", "Latvian": "lv",
-        "Lingala": "ln", "Lithuanian": "lt", "Luganda": "lg",
-        "Luxembourgish": "lb", "Macedonian": "mk", "Maithili": "mai",
-        "Malagasy": "mg", "Malay": "ms", "Malayalam": "ml",
-        "Maltese": "mt", "Maori": "mi", "Marathi": "mr",
-        "Meiteilon (Manipuri)": "mni", "Mizo": "lus", "Mongolian": "mn",
-        "Myanmar (Burmese)": "my", "Nepali": "ne", "Norwegian": "no",
-        "Nyanja (Chichewa)": "ny", "Odia (Oriya)": "or", "Oromo": "om",
-        "Pashto": "ps", "Persian": "fa", "Polish": "pl",
-        "Portuguese": "pt", "Portuguese (Brazil)": "pt-BR",
-        "Punjabi": "pa", "Quechua": "qu", "Romanian": "ro",
-        "Russian": "ru", "Samoan": "sm", "Sanskrit": "sa",
-        "Scots Gaelic": "gd", "Serbian": "sr", "Sesotho": "st",
-        "Shona": "sn", "Sindhi": "sd", "Sinhala": "si",
-        "Slovak": "sk", "Slovenian": "sl", "Somali": "so",
-        "Spanish": "es", "Sundanese": "su", "Swahili": "sw",
-        "Swedish": "sv", "Tajik": "tg", "Tamil": "ta",
-        "Tatar": "tt", "Telugu": "te", "Thai": "th",
-        "Tigrinya": "ti", "Tsonga": "ts", "Turkish": "tr",
-        "Turkmen": "tk", "Twi (Akan)": "ak", "Ukrainian": "uk",
-        "Urdu": "ur", "Uyghur": "ug", "Uzbek": "uz",
-        "Vietnamese": "vi", "Welsh": "cy", "Xhosa": "xh",
-        "Yiddish": "yi", "Yoruba": "yo", "Zulu": "zu",
-    }
-
-    SOURCE_LANGUAGES = {"Auto Detect": "auto", **_ALL_LANGS}
-    TARGET_LANGUAGES = dict(_ALL_LANGS)
-
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setObjectName("HomeInterface")
@@ -95,6 +129,15 @@ class HomeInterface(QWidget):
         self._current_source_code = "auto"
         self._current_target_code = "tr"
         self._current_running = False
+        self._languages_populated = False
+        # One scan at a time; the token tells the slot which result is current
+        self._scan_pool = QThreadPool(self)
+        self._scan_pool.setMaxThreadCount(1)
+        self._last_scan_token = 0
+        self._encrypted_scan = _EncryptedScanSignals(self)
+        self._encrypted_scan.finished.connect(
+            self._on_encrypted_scan_finished, Qt.ConnectionType.QueuedConnection
+        )
 
         # Root: horizontal splitter (left panel | right panel)
         root = QHBoxLayout(self)
@@ -134,16 +177,12 @@ class HomeInterface(QWidget):
         hl = QHBoxLayout()
         vs = QVBoxLayout()
         vs.addWidget(BodyLabel("Source"))
+        # Combos are filled on first show (_ensure_languages_populated)
         self.cmb_source = ComboBox(self.card_lang)
-        self.cmb_source.addItems(list(self.SOURCE_LANGUAGES.keys()))
-        self.cmb_source.currentTextChanged.connect(self._on_language_changed)
         vs.addWidget(self.cmb_source)
         vt = QVBoxLayout()
         vt.addWidget(BodyLabel("Target"))
         self.cmb_target = ComboBox(self.card_lang)
-        self.cmb_target.addItems(list(self.TARGET_LANGUAGES.keys()))
-        self.cmb_target.setCurrentText("Turkish")
-        self.cmb_target.currentTextChanged.connect(self._on_language_changed)
         vt.addWidget(self.cmb_target)
         hl.addLayout(vs)
         hl.addSpacing(16)
@@ -219,16 +258,46 @@ class HomeInterface(QWidget):
             self._current_project_path = path
         sc = settings.get("source_lang")
         if sc:
-            self._set_combo_by_code(self.cmb_source, self.SOURCE_LANGUAGES, sc)
             self._current_source_code = sc
+            if self._languages_populated:
+                self._set_combo_by_code(self.cmb_source, SOURCE_CODES, sc)
         tc = settings.get("target_lang")
         if tc:
-            self._set_combo_by_code(self.cmb_target, self.TARGET_LANGUAGES, tc)
             self._current_target_code = tc
+            if self._languages_populated:
+                self._set_combo_by_code(self.cmb_target, TARGET_CODES, tc)
         self._refresh_overview()
 
+    def current_language_codes(self) -> tuple[str, str]:
+        """(source, target) codes as selected in the language combos."""
+        self._ensure_languages_populated()
+        si = self.cmb_source.currentIndex()
+        ti = self.cmb_target.currentIndex()
+        sc = SOURCE_CODES[si] if si >= 0 else "auto"
+        tc = TARGET_CODES[ti] if ti >= 0 else "tr"
+        return sc, tc
+
+    def showEvent(self, event):
+        self._ensure_languages_populated()
+        super().showEvent(event)
+
     # ── internals ──
 
+    def _ensure_languages_populated(self):
+        """Fill the language combos once, deferred from __init__ to first
+        show so window construction doesn't pay for ~270 combo items."""
+        if self._languages_populated:
+            return
+        self._languages_populated = True
+        self.cmb_source.addItems(SOURCE_NAMES)
+        self.cmb_target.addItems(TARGET_NAMES)
+        self.cmb_target.setCurrentText("Turkish")
+        self._set_combo_by_code(self.cmb_source, SOURCE_CODES, self._current_source_code)
+        self._set_combo_by_code(self.cmb_target, TARGET_CODES, self._current_target_code)
+        # Connected after filling so population itself doesn't fire them
+        self.cmb_source.currentTextChanged.connect(self._on_language_changed)
+        self.cmb_target.currentTextChanged.connect(self._on_language_changed)
+
     def _browse_folder(self):
         d = QFileDialog.getExistingDirectory(self, "Select Game Project Folder",
                                              self.txt_path.text().strip() or "")
@@ -253,8 +322,7 @@ class HomeInterface(QWidget):
         if path:
             self.txt_path.setText(path)
             self._current_project_path = path
-        sc = self.SOURCE_LANGUAGES.get(self.cmb_source.currentText(), "auto")
-        tc = self.TARGET_LANGUAGES.get(self.cmb_target.currentText(), "tr")
+        sc, tc = self.current_language_codes()
         self._current_source_code = sc
         self._current_target_code = tc
         self._current_running = True
@@ -265,21 +333,21 @@ class HomeInterface(QWidget):
         self.stop_requested.emit()
 
     def _on_language_changed(self, _text=None):
-        self._current_source_code = self.SOURCE_LANGUAGES.get(self.cmb_source.currentText(), "auto")
-        self._current_target_code = self.TARGET_LANGUAGES.get(self.cmb_target.currentText(), "tr")
+        self._current_source_code, self._current_target_code = self.current_language_codes()
         self._refresh_overview()
 
     def _refresh_overview(self):
         pass  # status is shown in control card label
 
     @staticmethod
-    def _set_combo_by_code(combo, mapping: dict, code: str):
-        for name, value in mapping.items():
-            if value == code:
-                combo.setCurrentText(name)
-                return
+    def _set_combo_by_code(combo, codes: tuple, code: str):
+        try:
+            combo.setCurrentIndex(codes.index(code))
+        except ValueError:
+            pass
 
-    def _find_child_case_insensitive(self, parent_dir: str, target_name: str) -> Optional[str]:
+    @staticmethod
+    def _find_child_case_insensitive(parent_dir: str, target_name: str) -> Optional[str]:
         if not parent_dir or not os.path.isdir(parent_dir):
             return None
         tl = target_name.lower()
@@ -293,42 +361,68 @@ class HomeInterface(QWidget):
         return None
 
     def _check_encrypted_game(self, path: str) -> None:
+        """Scan *path* off the UI thread; warns via InfoBar when encrypted."""
+        self._last_scan_token += 1
+        # Rapid re-browsing: drop queued scans that have not started yet
+        self._scan_pool.clear()
+        self._scan_pool.start(
+            _EncryptedScanTask(self._last_scan_token, path, self._encrypted_scan)
+        )
+
+    def _on_encrypted_scan_finished(self, token: int, enc_files: list) -> None:
+        # A newer folder may have been picked while the scan ran
+        if not enc_files or token != self._last_scan_token:
+            return
+        InfoBar.warning(
+            title="Encrypted Game Detected",
+            content=f"This game contains encrypted files ({enc_files[0]}…).\n"
+                    "Please decrypt first, otherwise translation cannot continue.",
+            orient=Qt.Orientation.Horizontal, isClosable=True,
+            position=InfoBarPosition.TOP_RIGHT, duration=10000, parent=self,
+        )
+
+    @classmethod
+    def _scan_encrypted_game(cls, path: str) -> list[str]:
+        """Return encrypted archive names when the game has no readable data
+        files, else an empty list. Safe to call from a worker thread."""
+        www = cls._find_child_case_insensitive(path, "www")
+
+        # Readable data means no warning whatever else is there; checking it
+        # first skips the archive scan for the common (unencrypted) case.
+        data_dirs = []
+        rdd = cls._find_child_case_insensitive(path, "data")
+        if rdd:
+            data_dirs.append(rdd)
+        if www:
+            wdd = cls._find_child_case_insensitive(www, "data")
+            if wdd:
+                data_dirs.append(wdd)
+        for d in data_dirs:
+            if cls._first_matches(d, cls._DATA_RX, limit=1):
+                return []
+
+        enc_files: list[str] = []
+        to_check = [path]
+        if www:
+            to_check.append(www)
+        for p in to_check:
+            enc_files.extend(cls._first_matches(p, cls._ENCRYPTED_RX, limit=3))
+            if len(enc_files) >= 3:
+                break
+        return enc_files
+
+    @staticmethod
+    def _first_matches(directory: str, pattern: re.Pattern, limit: int) -> list[str]:
+        """Names in *directory* matching *pattern* (from ``_suffix_pattern``),
+        stopping after *limit*."""
+        found: list[str] = []
         try:
-            encrypted = False
-            enc_files = []
-            to_check = [path]
-            www = self._find_child_case_insensitive(path, "www")
-            if www:
-                to_check.append(www)
-            for p in to_check:
-                if not os.path.exists(p):
-                    continue
-                found = [f for f in os.listdir(p)
-                         if f.lower().endswith(self.ENCRYPTED_ARCHIVE_EXTENSIONS)]
-                if found:
-                    encrypted = True
-                    enc_files.extend(found)
-            has_data = False
-            data_dirs = []
-            rdd = self._find_child_case_insensitive(path, "data")
-            if rdd:
-                data_dirs.append(rdd)
-            if www:
-                wdd = self._find_child_case_insensitive(www, "data")
-                if wdd:
-                    data_dirs.append(wdd)
-            for d in data_dirs:
-                if os.path.exists(d) and os.path.isdir(d):
-                    if [f for f in os.listdir(d) if f.lower().endswith(('.json', '.rvdata2', '.rxdata'))]:
-                        has_data = True
-                        break
-            if encrypted and not has_data:
-                InfoBar.warning(
-                    title="Encrypted Game Detected",
-                    content=f"This game contains encrypted files ({enc_files[0]}…).\n"
-                            "Please decrypt first, otherwise translation cannot continue.",
-                    orient=Qt.Orientation.Horizontal, isClosable=True,
-                    position=InfoBarPosition.TOP_RIGHT, duration=10000, parent=self,
-                )
-        except Exception:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    if pattern.search(entry.name):
+                        found.append(entry.name)
+                        if len(found) >= limit:
+                            break
+        except OSError:
             pass
+        return found
@@ -1,14 +1,45 @@
-from PyQt6.QtWidgets import QWidget, QVBoxLayout, QLabel
+import orjson
+from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLabel, QFileDialog,
+                             QMessageBox, QAbstractItemView)
 from qfluentwidgets import (ScrollArea, SettingCardGroup, SwitchSettingCard, 
-                            OptionsSettingCard, PushSettingCard, FluentIcon as FIF,
-                            TextEdit, CardWidget, StrongBodyLabel, CaptionLabel,
+                            PushSettingCard, FluentIcon as FIF,
+                            ListView, PushButton, CardWidget, StrongBodyLabel, CaptionLabel,
                             Slider, SettingCard)
-from PyQt6.QtCore import Qt
+from PyQt6.QtCore import (Qt, QTimer, pyqtSignal, QObject, QRunnable, QThreadPool,
+                          QStringListModel, QSignalBlocker)
+
+
+class _WriteSignals(QObject):
+    # (path, error message); the message is empty on success
+    finished = pyqtSignal(str, str)
+
+
+class _WriteJob(QRunnable):
+    """Writes *payload* to *path* on the global thread pool."""
+
+    def __init__(self, path: str, payload: bytes, signals: _WriteSignals):
+        super().__init__()
+        self.path = path
+        self.payload = payload
+        self.signals = signals
+
+    def run(self) -> None:
+        try:
+            with open(self.path, 'wb') as f:
+                f.write(self.payload)
+        except Exception as e:
+            self.signals.finished.emit(self.path, str(e) or type(e).__name__)
+        else:
+            self.signals.finished.emit(self.path, "")
+
 
 class SliderSettingCard(SettingCard):
     """
     Custom SettingCard with a Slider and Value Label, independent of qconfig.
     """
+    # Label strings shared by all cards; bounded by the union of slider ranges
+    _STR_CACHE: dict[int, str] = {}
+
     def __init__(self, icon, title, content=None, parent=None):
         super().__init__(icon, title, content, parent)
         
@@ -25,15 +56,36 @@ class SliderSettingCard(SettingCard):
         self.slider.setFixedWidth(200)
         self.valueLabel.setObjectName("valueLabel")
         
+        # Dragging emits valueChanged per step; the label follows at most
+        # every 50 ms and snaps to the final value on release
+        self._pending = self.slider.value()
+        self._throttle = QTimer(self)
+        self._throttle.setSingleShot(True)
+        self._throttle.setInterval(50)
+        self._throttle.timeout.connect(self._flush_label)
+
         # Connect
         self.slider.valueChanged.connect(self._on_value_changed)
+        self.slider.sliderReleased.connect(self._flush_label)
         
     def _on_value_changed(self, value):
-        self.valueLabel.setText(str(value))
+        self._pending = value
+        if not self._throttle.isActive():
+            self._throttle.start()
+
+    def _flush_label(self):
+        self._throttle.stop()
+        text = self._STR_CACHE.get(self._pending)
+        if text is None:
+            text = self._STR_CACHE[self._pending] = str(self._pending)
+        self.valueLabel.setText(text)
         
     def setValue(self, value):
-        self.slider.setValue(value)
-        self.valueLabel.setText(str(value))
+        # The label is set directly below, so the throttled path is skipped
+        with QSignalBlocker(self.slider):
+            self.slider.setValue(value)
+        self._pending = self.slider.value()
+        self._flush_label()
         
     def value(self):
         return self.slider.value()
@@ -45,304 +97,272 @@ class SettingsInterface(ScrollArea):
     """
     Settings interface with grouped options.
     """
+    # (group attribute, group title, card specs). Card specs are
+    #   ("switch", attr, icon, title, content, checked)
+    #   ("slider", attr, icon, title, content, (min, max), value)
+    #   ("push", attr, button text, icon, title, content)
+    # and every card is stored on the interface under its attr name.
+    _GROUPS = (
+        ("parserGroup", "Parser", (
+            ("switch", "chk_translate_comments", FIF.CHAT, "Translate Comments",
+             "Extract text from event comments (Code 108/408). Useful for story hints hidden in dev notes.",
+             False),
+            ("switch", "chk_translate_notes", FIF.EDIT, "Translate 'Note' Fields",
+             "Translate database note fields. CAUTION: May break plugins that store logic here.",
+             False),
+            ("switch", "chk_plugin_js_ui_extraction", FIF.CODE, "Deep JS UI Extraction",
+             "Scan JS source files for UI text. Best for custom modern plugins.",
+             False),
+        )),
+        ("pipelineGroup", "Pipeline", (
+            ("switch", "chk_backup", FIF.SAVE, "Create Backups",
+             "Create a .bak copy before modification. Essential for safety and original file recovery.",
+             True),
+            ("switch", "chk_cache", FIF.SPEED_HIGH, "Global Translation Cache",
+             "Reuse previous translations to save time and API quota.",
+             True),
+            ("push", "btn_clear_cache", "Clear Cache", FIF.DELETE, "Clear Translation Cache",
+             "Clear cached translations."),
+        )),
+        ("performanceGroup", "Speed", (
+            ("slider", "slider_batch_size", FIF.SPEED_HIGH, "Batch Processing Size",
+             "Entries merged per request. Higher is faster, but large batches may cause timeouts.",
+             (1, 500), 100),
+            ("slider", "slider_concurrent", FIF.PEOPLE, "Parallel Requests",
+             "Simultaneous API calls. Increase for speed, decrease if blocked by rate limits.",
+             (5, 50), 20),
+            ("slider", "slider_throttle", FIF.TAG, "Progress Throttle (ms)",
+             "UI update frequency.",
+             (0, 1000), 100),
+        )),
+        ("formattingGroup", "Text Flow", (
+            ("switch", "chk_visustella_wordwrap", FIF.ALIGNMENT, "VisuStella <WordWrap> Mode",
+             "Uses engine tags. Best for modern games with message plugins. Safest method.",
+             False),
+            ("switch", "chk_auto_wordwrap", FIF.ALIGNMENT, "Physical Auto Word-Wrap",
+             "Hard-codes line breaks with \\n. Use ONLY for legacy engines (XP/VX Ace) without plugins.",
+             False),
+            ("slider", "slider_wrap_standard", FIF.ALIGNMENT, "Standard Wrap Limit",
+             "Max characters allowed per line for standard message boxes.",
+             (10, 100), 54),
+            ("slider", "slider_wrap_portrait", FIF.PEOPLE, "Portrait Wrap Limit",
+             "Character limit for line-wrapping when a character picture is detected.",
+             (10, 100), 44),
+        )),
+        ("networkGroup", "Network", (
+            ("switch", "chk_multi_endpoint", FIF.SPEED_HIGH, "Multi-Endpoint Bridge",
+             "Rotate between multiple Google mirrors to maximize stability and bypass rate limits.",
+             True),
+            ("switch", "chk_lingva_fallback", FIF.SPEED_HIGH, "Enable Lingva Fallback",
+             "Use Lingva if Google fails.",
+             True),
+            ("slider", "slider_request_delay", FIF.SPEED_HIGH, "Request Delay (ms)",
+             "Delay between requests.",
+             (0, 1000), 150),
+            ("slider", "slider_timeout", FIF.SPEED_HIGH, "Request Timeout (sec)",
+             "Request timeout.",
+             (5, 30), 15),
+            ("slider", "slider_max_retries", FIF.SPEED_HIGH, "Max Retries",
+             "Retry count.",
+             (1, 5), 3),
+        )),
+        ("glossaryGroup", "Glossary", (
+            ("switch", "chk_glossary", FIF.BOOK_SHELF, "Enable Project Glossary",
+             "Apply mandatory term replacements (e.g., Potion -> İksir) after translation.",
+             False),
+            ("push", "card_glossary_path", "Select Glossary", FIF.FOLDER, "Glossary File",
+             "Not selected"),
+            ("push", "btn_create_sample", "Create Sample", FIF.ADD, "Create Sample Glossary",
+             "Create a sample glossary."),
+        )),
+        ("fontGroup", "Font", (
+            ("switch", "chk_noto_font", FIF.FONT, "Use Noto Sans (Recommended)",
+             "Prepends Noto Sans (Latin + Cyrillic + Greek) to the game's font stack. "
+             "Missing glyphs (CJK, Arabic, etc.) still fall back to the original game font. "
+             "Safely fixes tofu (□□□) for European/Cyrillic target languages.",
+             False),
+            ("push", "card_font_path", "Select Font", FIF.FOLDER, "Custom Font (.ttf/.otf)",
+             "None"),
+        )),
+    )
+
+    # (settings key, card attr, default) applied by apply_settings; a None
+    # default leaves the card as it is when the key is missing
+    _SETTINGS_MAP = (
+        ("translate_comments", "chk_translate_comments", False),
+        ("translate_notes", "chk_translate_notes", False),
+        ("plugin_js_ui_extraction", "chk_plugin_js_ui_extraction", False),
+        ("visustella_wordwrap", "chk_visustella_wordwrap", False),
+        ("auto_wordwrap", "chk_auto_wordwrap", False),
+        ("wordwrap_limit_standard", "slider_wrap_standard", 54),
+        ("wordwrap_limit_portrait", "slider_wrap_portrait", 44),
+        ("font_use_noto", "chk_noto_font", False),
+        ("backup_enabled", "chk_backup", True),
+        ("use_cache", "chk_cache", True),
+        ("batch_size", "slider_batch_size", None),
+        ("concurrent_requests", "slider_concurrent", None),
+        ("progress_throttle_ms", "slider_throttle", 100),
+        ("use_multi_endpoint", "chk_multi_endpoint", True),
+        ("enable_lingva_fallback", "chk_lingva_fallback", True),
+        ("request_delay_ms", "slider_request_delay", None),
+        ("request_timeout", "slider_timeout", None),
+        ("max_retries", "slider_max_retries", None),
+    )
+
+    clear_cache_requested = pyqtSignal()
+    # A persisted setting was changed after the saved values were applied
+    settings_changed = pyqtSignal()
+
     def __init__(self, parent=None):
         super().__init__(parent)
         self.scrollWidget = QWidget()
         self.expandLayout = QVBoxLayout(self.scrollWidget)
         self.setObjectName("SettingsInterface")
 
-        # Parser Settings Group
-        self.parserGroup = SettingCardGroup("Parser", self.scrollWidget)
-        
-        self.chk_translate_comments = SwitchSettingCard(
-            FIF.CHAT,
-            "Translate Comments",
-            "Extract text from event comments (Code 108/408). Useful for story hints hidden in dev notes.",
-            parent=self.parserGroup
-        )
-        self.chk_translate_comments.setChecked(False)
-        
-        self.chk_translate_notes = SwitchSettingCard(
-            FIF.EDIT,
-            "Translate 'Note' Fields",
-            "Translate database note fields. CAUTION: May break plugins that store logic here.",
-            parent=self.parserGroup
-        )
-        self.chk_translate_notes.setChecked(False)
+        # Style
+        self.scrollWidget.setObjectName("scrollWidget")
+        self.setStyleSheet("QWidget{background-color: transparent;}")
+        self.setWidget(self.scrollWidget)
+        self.setWidgetResizable(True)
+        self.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
 
-        self.chk_plugin_js_ui_extraction = SwitchSettingCard(
-            FIF.CODE,
-            "Deep JS UI Extraction",
-            "Scan JS source files for UI text. Best for custom modern plugins.",
-            parent=self.parserGroup
-        )
-        self.chk_plugin_js_ui_extraction.setChecked(False)
-        
-        self.parserGroup.addSettingCard(self.chk_translate_comments)
-        self.parserGroup.addSettingCard(self.chk_translate_notes)
-        self.parserGroup.addSettingCard(self.chk_plugin_js_ui_extraction)
-        
-        # Pipeline Settings Group
-        self.pipelineGroup = SettingCardGroup("Pipeline", self.scrollWidget)
-        
-        self.chk_backup = SwitchSettingCard(
-            FIF.SAVE,
-            "Create Backups",
-            "Create a .bak copy before modification. Essential for safety and original file recovery.",
-            parent=self.pipelineGroup
-        )
-        self.chk_backup.setChecked(True)
-        
-        self.chk_cache = SwitchSettingCard(
-            FIF.SPEED_HIGH,
-            "Global Translation Cache",
-            "Reuse previous translations to save time and API quota.",
-            parent=self.pipelineGroup
-        )
-        self.chk_cache.setChecked(True)
-        
-        self.btn_clear_cache = PushSettingCard(
-            "Clear Cache",
-            FIF.DELETE,
-            "Clear Translation Cache",
-            "Clear cached translations.",
-            self.pipelineGroup
+        self.glossary_path = ""
+        # Cards are built on first show (or first ensure_built() call);
+        # settings applied before that are kept and replayed on build
+        self._built = False
+        self._pending_settings: dict = {}
+
+        self._sample_write = _WriteSignals(self)
+        self._sample_write.finished.connect(
+            self._on_sample_written, Qt.ConnectionType.QueuedConnection
         )
-        
-        self.pipelineGroup.addSettingCard(self.chk_backup)
-        self.pipelineGroup.addSettingCard(self.chk_cache)
-        self.pipelineGroup.addSettingCard(self.btn_clear_cache)
 
-        # Performance Group
-        self.performanceGroup = SettingCardGroup("Speed", self.scrollWidget)
-        
-        self.slider_batch_size = SliderSettingCard(
-            icon=FIF.SPEED_HIGH,
-            title="Batch Processing Size",
-            content="Entries merged per request. Higher is faster, but large batches may cause timeouts.",
-            parent=self.performanceGroup
-        )
-        self.slider_batch_size.setRange(1, 500)
-        self.slider_batch_size.setValue(100)
-        
-        self.slider_concurrent = SliderSettingCard(
-            icon=FIF.PEOPLE,
-            title="Parallel Requests",
-            content="Simultaneous API calls. Increase for speed, decrease if blocked by rate limits.",
-            parent=self.performanceGroup
-        )
-        self.slider_concurrent.setRange(5, 50)
-        self.slider_concurrent.setValue(20)
-
-        self.slider_throttle = SliderSettingCard(
-            icon=FIF.TAG,
-            title="Progress Throttle (ms)",
-            content="UI update frequency.",
-            parent=self.performanceGroup
-        )
-        self.slider_throttle.setRange(0, 1000)
-        self.slider_throttle.setValue(100)
-        
-        self.performanceGroup.addSettingCard(self.slider_batch_size)
-        self.performanceGroup.addSettingCard(self.slider_concurrent)
-        self.performanceGroup.addSettingCard(self.slider_throttle)
+    def showEvent(self, event):
+        self.ensure_built()
+        super().showEvent(event)
 
-        # Formatting Group
-        self.formattingGroup = SettingCardGroup("Text Flow", self.scrollWidget)
-        
-        self.chk_visustella_wordwrap = SwitchSettingCard(
-            FIF.ALIGNMENT,
-            "VisuStella <WordWrap> Mode",
-            "Uses engine tags. Best for modern games with message plugins. Safest method.",
-            parent=self.formattingGroup
-        )
-        self.chk_visustella_wordwrap.setChecked(False)
-        
-        self.chk_auto_wordwrap = SwitchSettingCard(
-            FIF.ALIGNMENT,
-            "Physical Auto Word-Wrap",
-            "Hard-codes line breaks with \\n. Use ONLY for legacy engines (XP/VX Ace) without plugins.",
-            parent=self.formattingGroup
-        )
-        self.chk_auto_wordwrap.setChecked(False)
-        
-        self.slider_wrap_standard = SliderSettingCard(
-            icon=FIF.ALIGNMENT,
-            title="Standard Wrap Limit",
-            content="Max characters allowed per line for standard message boxes.",
-            parent=self.formattingGroup
-        )
-        self.slider_wrap_standard.setRange(10, 100)
-        self.slider_wrap_standard.setValue(54)
-        
-        self.slider_wrap_portrait = SliderSettingCard(
-            icon=FIF.PEOPLE,
-            title="Portrait Wrap Limit",
-            content="Character limit for line-wrapping when a character picture is detected.",
-            parent=self.formattingGroup
-        )
-        self.slider_wrap_portrait.setRange(10, 100)
-        self.slider_wrap_portrait.setValue(44)
-
-        self.formattingGroup.addSettingCard(self.chk_visustella_wordwrap)
-        self.formattingGroup.addSettingCard(self.chk_auto_wordwrap)
-        self.formattingGroup.addSettingCard(self.slider_wrap_standard)
-        self.formattingGroup.addSettingCard(self.slider_wrap_portrait)
-
-        # Network Group
-        self.networkGroup = SettingCardGroup("Network", self.scrollWidget)
-
-        self.chk_multi_endpoint = SwitchSettingCard(
-            FIF.SPEED_HIGH,
-            "Multi-Endpoint Bridge",
-            "Rotate between multiple Google mirrors to maximize stability and bypass rate limits.",
-            parent=self.networkGroup
-        )
-        self.chk_multi_endpoint.setChecked(True)
+    def ensure_built(self):
+        """Create the setting cards if the page has not been built yet.
 
-        self.chk_lingva_fallback = SwitchSettingCard(
-            FIF.SPEED_HIGH,
-            "Enable Lingva Fallback",
-            "Use Lingva if Google fails.",
-            parent=self.networkGroup
-        )
-        self.chk_lingva_fallback.setChecked(True)
-
-        self.slider_request_delay = SliderSettingCard(
-            icon=FIF.SPEED_HIGH,
-            title="Request Delay (ms)",
-            content="Delay between requests.",
-            parent=self.networkGroup
-        )
-        self.slider_request_delay.setRange(0, 1000)
-        self.slider_request_delay.setValue(150)
-
-        self.slider_timeout = SliderSettingCard(
-            icon=FIF.SPEED_HIGH,
-            title="Request Timeout (sec)",
-            content="Request timeout.",
-            parent=self.networkGroup
-        )
-        self.slider_timeout.setRange(5, 30)
-        self.slider_timeout.setValue(15)
-
-        self.slider_max_retries = SliderSettingCard(
-            icon=FIF.SPEED_HIGH,
-            title="Max Retries",
-            content="Retry count.",
-            parent=self.networkGroup
-        )
-        self.slider_max_retries.setRange(1, 5)
-        self.slider_max_retries.setValue(3)
-
-        self.networkGroup.addSettingCard(self.chk_multi_endpoint)
-        self.networkGroup.addSettingCard(self.chk_lingva_fallback)
-        self.networkGroup.addSettingCard(self.slider_request_delay)
-        self.networkGroup.addSettingCard(self.slider_timeout)
-        self.networkGroup.addSettingCard(self.slider_max_retries)
-        
-        # Glossary Group
-        self.glossaryGroup = SettingCardGroup("Glossary", self.scrollWidget)
-        
-        self.chk_glossary = SwitchSettingCard(
-            FIF.BOOK_SHELF,
-            "Enable Project Glossary",
-            "Apply mandatory term replacements (e.g., Potion -> İksir) after translation.",
-            parent=self.glossaryGroup
-        )
-        self.chk_glossary.setChecked(False)
-        
-        self.card_glossary_path = PushSettingCard(
-            "Select Glossary",
-            FIF.FOLDER,
-            "Glossary File",
-            "Not selected",
-            self.glossaryGroup
-        )
-        
-        self.btn_create_sample = PushSettingCard(
-            "Create Sample",
-            FIF.ADD,
-            "Create Sample Glossary",
-            "Create a sample glossary.",
-            self.glossaryGroup
-        )
- 
-        self.glossaryGroup.addSettingCard(self.chk_glossary)
-        self.glossaryGroup.addSettingCard(self.card_glossary_path)
-        self.glossaryGroup.addSettingCard(self.btn_create_sample)
-
-        # Font Group
-        self.fontGroup = SettingCardGroup("Font", self.scrollWidget)
-
-        self.chk_noto_font = SwitchSettingCard(
-            FIF.FONT,
-            "Use Noto Sans (Recommended)",
-            "Prepends Noto Sans (Latin + Cyrillic + Greek) to the game's font stack. "
-            "Missing glyphs (CJK, Arabic, etc.) still fall back to the original game font. "
-            "Safely fixes tofu (□□□) for European/Cyrillic target languages.",
-            parent=self.fontGroup,
-        )
-        self.chk_noto_font.setChecked(False)
-
-        self.card_font_path = PushSettingCard(
-            "Select Font",
-            FIF.FOLDER,
-            "Custom Font (.ttf/.otf)",
-            "None",
-            self.fontGroup,
-        )
+        Callers that read card widgets directly must call this first.
+        """
+        if self._built:
+            return
+        self._built = True
 
-        self.fontGroup.addSettingCard(self.chk_noto_font)
-        self.fontGroup.addSettingCard(self.card_font_path)
+        for group_attr, title, specs in self._GROUPS:
+            group = self._build_group(title, specs)
+            setattr(self, group_attr, group)
+            self.expandLayout.addWidget(group)
 
         # Filtering Group
         self.filterGroup = SettingCardGroup("Filters", self.scrollWidget)
         
         # Custom card for Regex input
         self.card_regex = CardWidget(self.filterGroup)
-        self.card_regex.setFixedHeight(200)  # Explicit height to ensure visibility
+        self.card_regex.setFixedHeight(240)  # Explicit height to ensure visibility
         self.v_regex = QVBoxLayout(self.card_regex)
         self.lbl_regex_title = StrongBodyLabel("Global Extraction Blacklist", self.card_regex)
-        self.lbl_regex_desc = CaptionLabel("Skip matching strings (one per line). Use regular expressions (e.g. ^System_.*)", self.card_regex)
-        self.txt_regex = TextEdit(self.card_regex)
-        self.txt_regex.setPlaceholderText("^Skip_This_.*\n^<Internal_Code>.*\nActor\\d+")
+        self.lbl_regex_desc = CaptionLabel("Skip matching strings (one pattern per row, double-click to edit). Use regular expressions (e.g. ^System_.*)", self.card_regex)
+        # Model/view list: only visible rows are laid out, so restoring a
+        # long blacklist costs one setStringList instead of a text reshape
+        self._regex_model = QStringListModel(self)
+        self.list_regex = ListView(self.card_regex)
+        self.list_regex.setModel(self._regex_model)
+        self.list_regex.setUniformItemSizes(True)
+        self.list_regex.setSelectionMode(QAbstractItemView.SelectionMode.ExtendedSelection)
+        self.list_regex.setEditTriggers(
+            QAbstractItemView.EditTrigger.DoubleClicked | QAbstractItemView.EditTrigger.EditKeyPressed
+        )
+        self.btn_regex_add = PushButton(FIF.ADD, "Add", self.card_regex)
+        self.btn_regex_remove = PushButton(FIF.DELETE, "Remove", self.card_regex)
+        self.h_regex_buttons = QHBoxLayout()
+        self.h_regex_buttons.addWidget(self.btn_regex_add)
+        self.h_regex_buttons.addWidget(self.btn_regex_remove)
+        self.h_regex_buttons.addStretch(1)
         
         self.v_regex.addWidget(self.lbl_regex_title)
         self.v_regex.addWidget(self.lbl_regex_desc)
-        self.v_regex.addWidget(self.txt_regex)
+        self.v_regex.addWidget(self.list_regex)
+        self.v_regex.addLayout(self.h_regex_buttons)
         self.v_regex.setContentsMargins(16, 16, 16, 16)
         self.v_regex.addStretch(1)
         
         self.filterGroup.addSettingCard(self.card_regex)
 
-        # Add groups to layout
-        self.expandLayout.addWidget(self.parserGroup)
-        self.expandLayout.addWidget(self.pipelineGroup)
-        self.expandLayout.addWidget(self.performanceGroup)
-        self.expandLayout.addWidget(self.formattingGroup)
-        self.expandLayout.addWidget(self.networkGroup)
-        self.expandLayout.addWidget(self.glossaryGroup)
-        self.expandLayout.addWidget(self.fontGroup)
         self.expandLayout.addWidget(self.filterGroup)
         self.expandLayout.addStretch(1)
         
-        # Style
-        self.scrollWidget.setObjectName("scrollWidget")
-        self.setStyleSheet("QWidget{background-color: transparent;}")
-        self.setWidget(self.scrollWidget)
-        self.setWidgetResizable(True)
-        self.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
-        
         # Connect signals
+        self.btn_clear_cache.clicked.connect(self.clear_cache_requested)
         self.card_glossary_path.clicked.connect(self._select_glossary)
         self.btn_create_sample.clicked.connect(self._create_sample)
         self.card_font_path.clicked.connect(self._select_font)
-
-        self.glossary_path = ""
+        self.btn_regex_add.clicked.connect(self._add_regex_row)
+        self.btn_regex_remove.clicked.connect(self._remove_regex_rows)
+
+        if self._pending_settings:
+            settings, self._pending_settings = self._pending_settings, {}
+            self.apply_settings(settings)
+
+        # Connected after the replay so restoring saved values is not a change
+        for _group_attr, _title, specs in self._GROUPS:
+            for kind, attr, *_args in specs:
+                card = getattr(self, attr)
+                if kind == "switch":
+                    card.checkedChanged.connect(self.settings_changed)
+                elif kind == "slider":
+                    card.slider.valueChanged.connect(self.settings_changed)
+        for signal in (self._regex_model.dataChanged, self._regex_model.rowsInserted,
+                       self._regex_model.rowsRemoved, self._regex_model.modelReset):
+            signal.connect(self.settings_changed)
+
+    def _build_group(self, title: str, specs: tuple) -> SettingCardGroup:
+        """Create a SettingCardGroup from ``_GROUPS`` card specs."""
+        group = SettingCardGroup(title, self.scrollWidget)
+        for kind, attr, *args in specs:
+            if kind == "switch":
+                icon, card_title, content, checked = args
+                card = SwitchSettingCard(icon, card_title, content, parent=group)
+                card.setChecked(checked)
+            elif kind == "slider":
+                icon, card_title, content, (lo, hi), value = args
+                card = SliderSettingCard(icon, card_title, content, parent=group)
+                card.setRange(lo, hi)
+                card.setValue(value)
+            else:
+                text, icon, card_title, content = args
+                card = PushSettingCard(text, icon, card_title, content, group)
+            setattr(self, attr, card)
+            group.addSettingCard(card)
+        return group
+
+    def card_values(self) -> dict:
+        """Current value of every ``_SETTINGS_MAP`` card, keyed by setting."""
+        self.ensure_built()
+        values = {}
+        for key, attr, _default in self._SETTINGS_MAP:
+            card = getattr(self, attr)
+            values[key] = card.value() if isinstance(card, SliderSettingCard) else card.isChecked()
+        return values
+
+    def regex_patterns(self) -> list[str]:
+        """Blacklist patterns in list order, without blank rows."""
+        return [p for p in self._regex_model.stringList() if p.strip()]
+
+    def _add_regex_row(self):
+        row = self._regex_model.rowCount()
+        self._regex_model.insertRows(row, 1)
+        index = self._regex_model.index(row)
+        self.list_regex.setCurrentIndex(index)
+        self.list_regex.edit(index)
+
+    def _remove_regex_rows(self):
+        rows = sorted({i.row() for i in self.list_regex.selectedIndexes()}, reverse=True)
+        for row in rows:
+            self._regex_model.removeRows(row, 1)
 
     def _select_font(self):
-        from PyQt6.QtWidgets import QFileDialog
         path, _ = QFileDialog.getOpenFileName(
             self, "Select Font File", "",
             "Font Files (*.ttf *.otf);;TrueType (*.ttf);;OpenType (*.otf)",
@@ -352,7 +372,6 @@ class SettingsInterface(ScrollArea):
             self.chk_noto_font.setChecked(False)
 
     def _select_glossary(self):
-        from PyQt6.QtWidgets import QFileDialog
         path, _ = QFileDialog.getOpenFileName(
             self, "Select Glossary File", "", "JSON Files (*.json)"
         )
@@ -360,11 +379,9 @@ class SettingsInterface(ScrollArea):
             self.glossary_path = path
             self.card_glossary_path.setContent(path)
             self.chk_glossary.setChecked(True)
+            self.settings_changed.emit()
 
     def _create_sample(self):
-        from PyQt6.QtWidgets import QFileDialog, QMessageBox
-        import json
-        
         path, _ = QFileDialog.getSaveFileName(
             self, "Create Sample Glossary", "glossary.json", "JSON Files (*.json)"
         )
@@ -374,60 +391,66 @@ class SettingsInterface(ScrollArea):
                 "Sword": "Kılıç", 
                 "Dragon": "Ejderha"
             }
-            try:
-                with open(path, 'w', encoding='utf-8') as f:
-                    json.dump(sample, f, ensure_ascii=False, indent=2)
-                
-                self.glossary_path = path
-                self.card_glossary_path.setContent(path)
-                self.chk_glossary.setChecked(True)
-                
-                QMessageBox.information(self, "Success", f"Sample glossary created at:\n{path}")
-            except Exception as e:
-                QMessageBox.critical(self, "Error", f"Failed to create file:\n{e}")
+            payload = orjson.dumps(sample, option=orjson.OPT_INDENT_2)
+            # The target may be a slow or network drive: write off the UI thread
+            QThreadPool.globalInstance().start(_WriteJob(path, payload, self._sample_write))
+
+    def _on_sample_written(self, path: str, error: str):
+        if error:
+            QMessageBox.critical(self, "Error", f"Failed to create file:\n{error}")
+            return
+        self.glossary_path = path
+        self.card_glossary_path.setContent(path)
+        self.chk_glossary.setChecked(True)
+        self.settings_changed.emit()
+
+        QMessageBox.information(self, "Success", f"Sample glossary created at:\n{path}")
 
     def set_glossary_path(self, path: str):
         """Update the glossary path from external source."""
         if path:
             self.glossary_path = path
+            self.settings_changed.emit()
+            if not self._built:
+                self._pending_settings.update(glossary_path=path, use_glossary=True)
+                return
             self.card_glossary_path.setContent(path)
             self.chk_glossary.setChecked(True)
 
     def apply_settings(self, settings: dict):
         if not settings:
             return
+        if not self._built:
+            self._pending_settings.update(settings)
+            return
 
-        self.chk_translate_comments.setChecked(settings.get("translate_comments", False))
-        self.chk_translate_notes.setChecked(settings.get("translate_notes", False))
-        self.chk_plugin_js_ui_extraction.setChecked(settings.get("plugin_js_ui_extraction", False))
-
-        self.chk_visustella_wordwrap.setChecked(settings.get("visustella_wordwrap", False))
-        self.chk_auto_wordwrap.setChecked(settings.get("auto_wordwrap", False))
-        
-        self.slider_wrap_standard.setValue(settings.get("wordwrap_limit_standard", 54))
-        self.slider_wrap_portrait.setValue(settings.get("wordwrap_limit_portrait", 44))
+        # One repaint for the whole profile instead of one per changed card
+        self.scrollWidget.setUpdatesEnabled(False)
+        try:
+            self._apply_cards(settings)
+        finally:
+            self.scrollWidget.setUpdatesEnabled(True)
+
+    def _apply_cards(self, settings: dict):
+        for key, attr, default in self._SETTINGS_MAP:
+            value = settings.get(key, default)
+            if value is None:
+                continue
+            card = getattr(self, attr)
+            if isinstance(card, SliderSettingCard):
+                # Unchanged values skip the slider/label round trip
+                if card.value() != value:
+                    card.setValue(value)
+            elif card.isChecked() != bool(value):
+                card.setChecked(value)
 
-        self.chk_noto_font.setChecked(settings.get("font_use_noto", False))
         font_path = settings.get("font_path", "")
         if font_path:
             self.card_font_path.setContent(font_path)
 
-        self.chk_backup.setChecked(settings.get("backup_enabled", True))
-        self.chk_cache.setChecked(settings.get("use_cache", True))
-
-        self.slider_batch_size.setValue(settings.get("batch_size", self.slider_batch_size.value()))
-        self.slider_concurrent.setValue(settings.get("concurrent_requests", self.slider_concurrent.value()))
-        self.slider_throttle.setValue(settings.get("progress_throttle_ms", 100))
-
-        self.chk_multi_endpoint.setChecked(settings.get("use_multi_endpoint", True))
-        self.chk_lingva_fallback.setChecked(settings.get("enable_lingva_fallback", True))
-        self.slider_request_delay.setValue(settings.get("request_delay_ms", self.slider_request_delay.value()))
-        self.slider_timeout.setValue(settings.get("request_timeout", self.slider_timeout.value()))
-        self.slider_max_retries.setValue(settings.get("max_retries", self.slider_max_retries.value()))
-
         regex_list = settings.get("regex_blacklist")
         if isinstance(regex_list, list):
-            self.txt_regex.setPlainText("\n".join(regex_list))
+            self._regex_model.setStringList([str(p) for p in regex_list])
 
         glossary_path = settings.get("glossary_path", "")
         if glossary_path:
@@ -1,11 +1,18 @@
-from PyQt6.QtCore import Qt, QSize, QThread
+import copy
+import logging
+import webbrowser
+from typing import Callable, Optional
+
+from PyQt6 import sip
+from PyQt6.QtCore import Qt, QSize, QObject, QRunnable, QThreadPool, QTimer, pyqtSignal
 from PyQt6.QtGui import QIcon
-from PyQt6.QtWidgets import QApplication, QTabWidget
+from PyQt6.QtWidgets import QApplication, QTabWidget, QVBoxLayout, QWidget
 
 from qfluentwidgets import (FluentWindow, NavigationItemPosition, 
                              FluentIcon as FIF, InfoBar, InfoBarPosition,
                              setTheme, Theme, MSFluentWindow)
 
+from src.core.cache import get_cache
 from src.core.translation_pipeline import TranslationPipeline
 from src.core.enums import PipelineStage
 
@@ -19,30 +26,83 @@ from src.ui.components.console_log import ConsoleLog
 from src.utils.paths import existing_resource_path
 from src.ui.styles import THEME_QSS
 
+logger = logging.getLogger(__name__)
+
+
+class _PipelineSignals(QObject):
+    # Emitted once run() has returned, whether or not finished was emitted
+    done = pyqtSignal()
+
+
+class _PipelineTask(QRunnable):
+    """Runs a TranslationPipeline on MainWindow's pipeline pool."""
+
+    def __init__(self, pipeline: TranslationPipeline, signals: _PipelineSignals):
+        super().__init__()
+        self.pipeline = pipeline
+        self.signals = signals
+
+    def run(self) -> None:
+        try:
+            self.pipeline.run()
+        finally:
+            try:
+                self.signals.done.emit()
+            except RuntimeError:
+                pass  # window already destroyed after a timed-out close
+
+
+class _LazyPage(QWidget):
+    """Navigation placeholder that builds its real page on first show."""
+
+    def __init__(self, object_name: str, factory: Callable[[QWidget], QWidget], parent=None):
+        super().__init__(parent)
+        self.setObjectName(object_name)
+        self._factory = factory
+        self.page: Optional[QWidget] = None
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(0, 0, 0, 0)
+
+    def ensure_built(self) -> QWidget:
+        if self.page is None:
+            self.page = self._factory(self)
+            self.layout().addWidget(self.page)
+        return self.page
+
+    def showEvent(self, event):
+        self.ensure_built()
+        super().showEvent(event)
+
 
 class MainWindow(MSFluentWindow):
     def __init__(self):
         super().__init__()
 
-        self.thread = None
         self.pipeline = None
+        # One long-lived worker thread, reused by every run
+        self._pipeline_pool = QThreadPool(self)
+        self._pipeline_pool.setMaxThreadCount(1)
+        self._pipeline_pool.setExpiryTimeout(-1)
+        self._pipeline_signals = _PipelineSignals(self)
+        self._pipeline_signals.done.connect(
+            self._on_pipeline_done, Qt.ConnectionType.QueuedConnection
+        )
 
         self.initWindow()
 
         # --- Pages ---
+        # Home and Console receive signals from the start; the Data and
+        # About pages are only built when first navigated to
         self.homeInterface = HomeInterface(self)
         self.settingsInterface = SettingsInterface(self)
-        self.exportInterface = ExportInterface(self)
-        self.glossaryInterface = GlossaryInterface(self)
-        self.aboutInterface = AboutInterface(self)
+        self.exportInterface: Optional[ExportInterface] = None
+        self.glossaryInterface: Optional[GlossaryInterface] = None
+        self.aboutInterface: Optional[AboutInterface] = None
         self.consoleInterface = ConsoleLog(self)
         self.consoleInterface.setObjectName("consoleInterface")
 
-        # Data page: export + glossary as tabs
-        self.dataInterface = QTabWidget(self)
-        self.dataInterface.setObjectName("DataInterface")
-        self.dataInterface.addTab(self.exportInterface, "Export / Import")
-        self.dataInterface.addTab(self.glossaryInterface, "Glossary")
+        self.dataInterface = _LazyPage("DataInterface", self._build_data_page, self)
+        self.aboutPage = _LazyPage("AboutPage", self._build_about_page, self)
 
         # Navigation: 3 main items (Home, Settings, Data)
         self.addSubInterface(self.homeInterface, FIF.HOME, "Home")
@@ -52,7 +112,7 @@ class MainWindow(MSFluentWindow):
         # Bottom items: Console, About, Support
         self.addSubInterface(self.consoleInterface, FIF.COMMAND_PROMPT, "Console",
                              position=NavigationItemPosition.BOTTOM)
-        self.addSubInterface(self.aboutInterface, FIF.INFO, "About",
+        self.addSubInterface(self.aboutPage, FIF.INFO, "About",
                              position=NavigationItemPosition.BOTTOM)
         self.navigationInterface.addItem(
             routeKey="support",
@@ -66,24 +126,56 @@ class MainWindow(MSFluentWindow):
         # Signals
         self.homeInterface.start_requested.connect(self.start_pipeline)
         self.homeInterface.stop_requested.connect(self.stop_pipeline)
-        self.exportInterface.start_requested.connect(self.homeInterface._on_start)
-        self.settingsInterface.btn_clear_cache.clicked.connect(self.clear_cache)
-        self.glossaryInterface.glossary_selected.connect(self.settingsInterface.set_glossary_path)
+        self.settingsInterface.clear_cache_requested.connect(self.clear_cache)
 
         self.settings_store = SettingsStore()
+        # Last dict written to (or read from) disk; saves are skipped while
+        # the collected settings still equal it
+        self._last_saved_settings: dict = {}
+        # Settings waiting for the debounced write; closeEvent flushes them
+        self._pending_settings: Optional[dict] = None
+        self._settings_save_timer = QTimer(self)
+        self._settings_save_timer.setSingleShot(True)
+        self._settings_save_timer.setInterval(2000)
+        self._settings_save_timer.timeout.connect(self._flush_persisted_settings)
         self._load_persisted_settings()
 
+        # Set by any user edit to a persisted setting; closeEvent skips
+        # collecting (and building the Settings page) while it is False
+        self._settings_dirty = False
+        hi = self.homeInterface
+        hi.txt_path.textChanged.connect(self._mark_settings_dirty)
+        hi.cmb_source.activated.connect(self._mark_settings_dirty)
+        hi.cmb_target.activated.connect(self._mark_settings_dirty)
+        self.settingsInterface.settings_changed.connect(self._mark_settings_dirty)
+
+    def _build_data_page(self, parent: QWidget) -> QWidget:
+        # Data page: export + glossary as tabs
+        self.exportInterface = ExportInterface(parent)
+        self.glossaryInterface = GlossaryInterface(parent)
+        self.exportInterface.start_requested.connect(self.homeInterface._on_start)
+        self.glossaryInterface.glossary_selected.connect(self.settingsInterface.set_glossary_path)
+        tabs = QTabWidget(parent)
+        tabs.addTab(self.exportInterface, "Export / Import")
+        tabs.addTab(self.glossaryInterface, "Glossary")
+        return tabs
+
+    def _build_about_page(self, parent: QWidget) -> QWidget:
+        self.aboutInterface = AboutInterface(parent)
+        return self.aboutInterface
+
     def initWindow(self):
         self.resize(1100, 780)
         self.setWindowTitle("RPGMLocalizer")
         icon_path = existing_resource_path("icon.png", "icon.ico")
         if icon_path:
             self.setWindowIcon(QIcon(icon_path))
-        screens = QApplication.screens()
-        if screens:
-            desktop = screens[0].availableGeometry()
-            w, h = desktop.width(), desktop.height()
-            self.move(w // 2 - self.width() // 2, h // 2 - self.height() // 2)
+        # The window's own screen, not simply the first one in the list
+        screen = self.screen() or QApplication.primaryScreen()
+        if screen is not None:
+            desktop = screen.availableGeometry()
+            self.move(desktop.center().x() - self.width() // 2,
+                      desktop.center().y() - self.height() // 2)
         self.setMicaEffectEnabled(False)
         self.setStyleSheet(THEME_QSS)
 
@@ -92,69 +184,43 @@ class MainWindow(MSFluentWindow):
     # ------------------------------------------------------------------
 
     def start_pipeline(self, data: dict):
-        try:
-            if self.thread is not None and self.thread.isRunning():
-                return
-        except RuntimeError:
-            self.thread = None
-            self.pipeline = None
+        if self.pipeline is not None:
+            return
 
         settings = data.copy()
         s = self.settingsInterface
+        s.ensure_built()
 
-        settings["translate_notes"] = s.chk_translate_notes.isChecked()
-        settings["translate_comments"] = s.chk_translate_comments.isChecked()
-        settings["plugin_js_ui_extraction"] = s.chk_plugin_js_ui_extraction.isChecked()
-        settings["visustella_wordwrap"] = s.chk_visustella_wordwrap.isChecked()
-        settings["auto_wordwrap"] = s.chk_auto_wordwrap.isChecked()
-        settings["wordwrap_limit_standard"] = s.slider_wrap_standard.value()
-        settings["wordwrap_limit_portrait"] = s.slider_wrap_portrait.value()
-        settings["font_use_noto"] = s.chk_noto_font.isChecked()
+        settings.update(s.card_values())
         if s.card_font_path.contentLabel.text() not in ("None", ""):
             settings["font_path"] = s.card_font_path.contentLabel.text()
         else:
             settings["font_path"] = ""
-        settings["backup_enabled"] = s.chk_backup.isChecked()
-        settings["use_cache"] = s.chk_cache.isChecked()
         if s.chk_glossary.isChecked() and s.glossary_path:
             settings["glossary_path"] = s.glossary_path
             settings["use_glossary"] = True
-        regex_text = s.txt_regex.toPlainText()
-        if regex_text:
-            settings["regex_blacklist"] = [line for line in regex_text.split('\n') if line.strip()]
+        regex_patterns = s.regex_patterns()
+        if regex_patterns:
+            settings["regex_blacklist"] = regex_patterns
 
         e = self.exportInterface
-        if e.export_path:
+        if e is not None and e.export_path:
             settings["export_path"] = e.export_path
             settings["export_only"] = e.chk_export_only.isChecked()
             settings["export_distinct"] = e.chk_distinct_export.isChecked()
-        if e.import_path:
+        if e is not None and e.import_path:
             settings["import_path"] = e.import_path
 
-        settings["batch_size"] = s.slider_batch_size.value()
-        settings["concurrent_requests"] = s.slider_concurrent.value()
-        settings["progress_throttle_ms"] = s.slider_throttle.value()
-        settings["use_multi_endpoint"] = s.chk_multi_endpoint.isChecked()
-        settings["enable_lingva_fallback"] = s.chk_lingva_fallback.isChecked()
-        settings["request_delay_ms"] = s.slider_request_delay.value()
-        settings["request_timeout"] = s.slider_timeout.value()
-        settings["max_retries"] = s.slider_max_retries.value()
-
-        self.thread = QThread()
         self.pipeline = TranslationPipeline(settings)
-        self.pipeline.moveToThread(self.thread)
 
         self._save_persisted_settings(settings)
 
-        self.thread.started.connect(self.pipeline.run)
-        self.pipeline.finished.connect(self.on_finished)
-        self.pipeline.stage_changed.connect(self.on_stage_changed)
-        self.pipeline.progress_updated.connect(self.on_progress)
-        self.pipeline.log_message.connect(self.on_log_message)
-        self.pipeline.finished.connect(self.thread.quit)
-        self.pipeline.finished.connect(self.pipeline.deleteLater)
-        self.thread.finished.connect(self._cleanup_thread)
-        self.thread.finished.connect(self.thread.deleteLater)
+        # The pipeline emits from the pool thread; queue every slot onto the UI thread
+        queued = Qt.ConnectionType.QueuedConnection
+        self.pipeline.finished.connect(self.on_finished, queued)
+        self.pipeline.stage_changed.connect(self.on_stage_changed, queued)
+        self.pipeline.progress_updated.connect(self.on_progress, queued)
+        self.pipeline.log_message.connect(self.on_log_message, queued)
 
         self.homeInterface.set_running(True)
         self.consoleInterface.clear()
@@ -163,14 +229,12 @@ class MainWindow(MSFluentWindow):
         except Exception:
             pass
 
-        self.thread.start()
+        self._pipeline_pool.start(_PipelineTask(self.pipeline, self._pipeline_signals))
 
-    def _cleanup_thread(self):
-        try:
-            self.thread = None
-            self.pipeline = None
-        except Exception:
-            pass
+    def _on_pipeline_done(self):
+        if self.pipeline is not None:
+            self.pipeline.deleteLater()
+        self.pipeline = None
 
     def stop_pipeline(self):
         if self.pipeline:
@@ -183,9 +247,16 @@ class MainWindow(MSFluentWindow):
 
     def on_finished(self, success, message):
         self.homeInterface.set_running(False)
-        self.exportInterface.set_processing_state(False)
+        if self.exportInterface is not None:
+            self.exportInterface.set_processing_state(False)
         self.homeInterface.update_status(message if success else f"Error: {message}")
         self.on_log_message("success" if success else "error", message)
+        # Show the final lines now rather than on the next batch tick
+        self.consoleInterface.flush()
+        try:
+            self.homeInterface.card_log.console.flush()
+        except Exception:
+            pass
 
     def on_progress(self, current, total, text=""):
         if total > 0:
@@ -212,57 +283,58 @@ class MainWindow(MSFluentWindow):
     # Settings persistence
     # ------------------------------------------------------------------
 
+    def _mark_settings_dirty(self, *_args) -> None:
+        self._settings_dirty = True
+
     def _collect_persisted_settings(self) -> dict:
         data = {}
         hi = self.homeInterface
         s = self.settingsInterface
-        e = self.exportInterface
+        s.ensure_built()
 
         path = hi.txt_path.text().strip()
         if path:
             data["project_path"] = path
-        data["source_lang"] = hi.SOURCE_LANGUAGES.get(hi.cmb_source.currentText(), "auto")
-        data["target_lang"] = hi.TARGET_LANGUAGES.get(hi.cmb_target.currentText(), "tr")
-        data["translate_notes"] = s.chk_translate_notes.isChecked()
-        data["translate_comments"] = s.chk_translate_comments.isChecked()
-        data["plugin_js_ui_extraction"] = s.chk_plugin_js_ui_extraction.isChecked()
-        data["visustella_wordwrap"] = s.chk_visustella_wordwrap.isChecked()
-        data["auto_wordwrap"] = s.chk_auto_wordwrap.isChecked()
-        data["wordwrap_limit_standard"] = s.slider_wrap_standard.value()
-        data["wordwrap_limit_portrait"] = s.slider_wrap_portrait.value()
-        data["backup_enabled"] = s.chk_backup.isChecked()
-        data["use_cache"] = s.chk_cache.isChecked()
-        data["batch_size"] = s.slider_batch_size.value()
-        data["concurrent_requests"] = s.slider_concurrent.value()
-        data["progress_throttle_ms"] = s.slider_throttle.value()
-        data["use_multi_endpoint"] = s.chk_multi_endpoint.isChecked()
-        data["enable_lingva_fallback"] = s.chk_lingva_fallback.isChecked()
-        data["request_delay_ms"] = s.slider_request_delay.value()
-        data["request_timeout"] = s.slider_timeout.value()
-        data["max_retries"] = s.slider_max_retries.value()
+        data["source_lang"], data["target_lang"] = hi.current_language_codes()
+        data.update(s.card_values())
         data["use_glossary"] = s.chk_glossary.isChecked()
         data["glossary_path"] = s.glossary_path
-        rt = s.txt_regex.toPlainText()
-        if rt:
-            data["regex_blacklist"] = [l for l in rt.split("\n") if l.strip()]
+        rp = s.regex_patterns()
+        if rp:
+            data["regex_blacklist"] = rp
         return data
 
     def _load_persisted_settings(self) -> None:
         data = self.settings_store.load()
         if not data:
             return
+        self._last_saved_settings = copy.deepcopy(data)
         self.homeInterface.apply_settings(data)
         self.settingsInterface.apply_settings(data)
 
     def _save_persisted_settings(self, data: dict) -> None:
-        if data:
-            self.settings_store.save(data)
+        if not data or data == self._last_saved_settings:
+            self._pending_settings = None
+            self._settings_save_timer.stop()
+            return
+        # Deep copy: the pipeline keeps (and may mutate) the dict it was given
+        self._pending_settings = copy.deepcopy(data)
+        # Restarting the timer debounces bursts of saves into one write
+        self._settings_save_timer.start()
+
+    def _flush_persisted_settings(self) -> None:
+        self._settings_save_timer.stop()
+        data, self._pending_settings = self._pending_settings, None
+        if data is not None and self.settings_store.save(data):
+            self._last_saved_settings = data
 
     def closeEvent(self, event):
-        try:
-            self._save_persisted_settings(self._collect_persisted_settings())
-        except Exception:
-            pass
+        if self._settings_dirty:
+            try:
+                self._save_persisted_settings(self._collect_persisted_settings())
+            except Exception:
+                pass
+        self._flush_persisted_settings()
         try:
             self.consoleInterface._flush_timer.stop()
         except Exception:
@@ -272,20 +344,19 @@ class MainWindow(MSFluentWindow):
                 self.pipeline.stop()
         except (RuntimeError, AttributeError):
             pass
-        try:
-            if self.thread is not None and self.thread.isRunning():
-                self.thread.quit()
-                if not self.thread.wait(3000):
-                    self.thread.terminate()
-                    self.thread.wait(1000)
-        except (RuntimeError, AttributeError):
-            pass
-        self.thread = None
+        # Give the run a moment to notice stop(). A pool thread cannot be
+        # terminated, and the pool's destructor would wait for it without
+        # limit (e.g. a request sitting out its timeout), so a run that is
+        # still busy is detached: the pool is handed to C++ with no owner
+        # and neither window teardown nor interpreter exit waits on it.
+        if not self._pipeline_pool.waitForDone(3000):
+            logger.warning("Pipeline did not stop within 3 s; closing without waiting for it")
+            self._pipeline_pool.setParent(None)
+            sip.transferto(self._pipeline_pool, None)
         self.pipeline = None
         super().closeEvent(event)
 
     def clear_cache(self):
-        from src.core.cache import get_cache
         try:
             cache = get_cache()
             cache.clear()
@@ -299,5 +370,4 @@ class MainWindow(MSFluentWindow):
             self.on_log_message("error", f"Failed to clear cache: {e}")
 
     def _open_patreon(self):
-        import webbrowser
         webbrowser.open("https://www.patreon.com/cw/LordOfTurk")
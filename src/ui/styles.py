@@ -1,4 +1,6 @@
 """Dark Glass Ocean theme — Turkuaz / Mavi / Koyu Cam tonlari."""
+import re
+
 from qfluentwidgets import setThemeColor
 
 def apply_theme():
@@ -8,7 +10,7 @@ def apply_theme():
 # Lazim oldugunda cagrilabilir; main.py dogrudan setThemeColor kullaniyor.
 # Bu modul yalnizca QSS sabitini disari acar.
 
-THEME_QSS = """
+_THEME_QSS_SOURCE = """
 /* ========================================================================
    Base / Root — deep ocean
    ======================================================================== */
@@ -169,3 +171,14 @@ QTextEdit#consoleOutput {
     selection-background-color: rgba(0, 180, 216, 0.25);
 }
 """
+
+
+def _minify_qss(qss: str) -> str:
+    """Drop comments and collapse whitespace so Qt tokenizes less."""
+    qss = re.sub(r'/\*.*?\*/', '', qss, flags=re.DOTALL)
+    qss = re.sub(r'\s+', ' ', qss)
+    return re.sub(r'\s*([{};:,>])\s*', r'\1', qss).strip()
+
+
+# Minified once at import; the commented source above stays the one to edit
+THEME_QSS = _minify_qss(_THEME_QSS_SOURCE)
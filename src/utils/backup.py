@@ -2,18 +2,91 @@
 Backup utilities for safe file modification.
 Creates backups before any write operation to prevent data loss.
 """
+import errno
+import functools
 import os
+import re
 import shutil
+import sys
 import threading
+import time
 from datetime import datetime
 from pathlib import Path
-from typing import Optional, List
+from typing import Dict, Optional, List
 import logging
 
 from src.utils.app_paths import get_data_dir
 
 logger = logging.getLogger(__name__)
 
+# Timestamped backup name: <stem>_YYYYMMDD_HHMMSS[_N]<ext> (see create_backup)
+_BAK_RE = re.compile(r'^(?P<base>.+)_\d{8}_\d{6}(?:_\d+)?(?P<ext>\.[^.]*)?$')
+
+
+@functools.lru_cache(maxsize=4096)
+def _backup_group(name: str) -> str:
+    """Name of the original file a backup belongs to (stem + extension)."""
+    m = _BAK_RE.match(name)
+    if not m:
+        return name
+    return m.group('base') + (m.group('ext') or '')
+
+
+# Linux FICLONE ioctl: share the source's extents (Btrfs, XFS, bcachefs)
+_FICLONE = 0x40049409
+_clonefile = None  # macOS libc clonefile(), resolved on first use
+# Errors meaning "this filesystem cannot clone", as opposed to a problem
+# with this particular file
+_NO_CLONE_ERRNOS = frozenset({
+    errno.EOPNOTSUPP, errno.ENOTSUP, errno.EXDEV, errno.EINVAL, errno.ENOTTY,
+})
+
+
+def _clone_file(src: str, dst: str) -> bool:
+    """Copy-on-write clone *src* to the new path *dst*.
+
+    Returns False, leaving *dst* absent, when the platform or filesystem
+    cannot clone; the caller then copies the bytes instead. Any other
+    error is raised, including FileExistsError when *dst* already exists.
+    """
+    if sys.platform.startswith('linux'):
+        import fcntl
+        with open(src, 'rb') as fsrc:
+            fd = os.open(dst, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o644)
+            # From here on dst is ours to remove
+            try:
+                try:
+                    fcntl.ioctl(fd, _FICLONE, fsrc.fileno())
+                finally:
+                    os.close(fd)
+            except OSError as e:
+                try:
+                    os.remove(dst)
+                except OSError:
+                    pass
+                if e.errno in _NO_CLONE_ERRNOS:
+                    return False
+                raise
+        return True
+    if sys.platform == 'darwin':
+        global _clonefile
+        import ctypes
+        if _clonefile is None:
+            try:
+                import ctypes.util
+                libc = ctypes.CDLL(ctypes.util.find_library('c'), use_errno=True)
+                _clonefile = libc.clonefile
+            except (OSError, AttributeError):
+                _clonefile = False
+        if _clonefile:
+            if _clonefile(os.fsencode(src), os.fsencode(dst), 0) == 0:
+                return True
+            err = ctypes.get_errno()
+            if err in _NO_CLONE_ERRNOS:
+                return False
+            raise OSError(err, os.strerror(err), dst)
+    return False
+
 
 class BackupManager:
     """
@@ -30,7 +103,13 @@ class BackupManager:
         """
         self.backup_dir = self._resolve_backup_dir(backup_dir)
         self.backup_log: List[tuple] = []  # (original, backup_path, timestamp)
+        # Lookup indexes over backup_log, maintained by create_backup
+        self._backup_to_original: Dict[str, str] = {}
+        self._original_to_backups: Dict[str, List[str]] = {}
         self._lock = threading.Lock()  # Serializes concurrent create_backup calls
+        self._no_clone_dirs: set = set()  # backup dirs whose filesystem cannot clone
+        self._stamp: tuple = (0, '')  # (epoch second, formatted name timestamp)
+        self._made_dirs: set = set()  # backup dirs already created by this manager
 
     def _resolve_backup_dir(self, backup_dir: Optional[str]) -> Optional[str]:
         """Resolve explicit backup directories in a cross-platform-safe way."""
@@ -52,7 +131,7 @@ class BackupManager:
             Path to the backup file, or None if backup failed
         """
         if not os.path.exists(file_path):
-            logger.error(f"Cannot backup non-existent file: {file_path}")
+            logger.error("Cannot backup non-existent file: %s", file_path)
             return None
         
         with self._lock:
@@ -64,13 +143,15 @@ class BackupManager:
                     file_dir = os.path.dirname(file_path)
                     backup_base = os.path.join(file_dir, '.rpgm_backup')
                 
-                # Create backup directory if needed
-                os.makedirs(backup_base, exist_ok=True)
+                # Create backup directory once per manager
+                if backup_base not in self._made_dirs:
+                    os.makedirs(backup_base, exist_ok=True)
+                    self._made_dirs.add(backup_base)
                 
                 # Generate backup filename
                 filename = os.path.basename(file_path)
                 if use_timestamp:
-                    timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+                    timestamp = self._timestamp()
                     name, ext = os.path.splitext(filename)
                     backup_name = f"{name}_{timestamp}{ext}"
                 else:
@@ -86,19 +167,52 @@ class BackupManager:
                         backup_path = os.path.join(backup_base, f"{name}_{counter}{ext}")
                         counter += 1
                 
-                # Copy file
-                shutil.copy2(file_path, backup_path)
+                try:
+                    self._write_backup(file_path, backup_path, backup_base)
+                except FileNotFoundError:
+                    # The backup directory was removed behind our back
+                    # (e.g. between runs); recreate it and try once more
+                    os.makedirs(backup_base, exist_ok=True)
+                    self._write_backup(file_path, backup_path, backup_base)
                 
                 # Log the backup
                 self.backup_log.append((file_path, backup_path, datetime.now()))
-                logger.info(f"Created backup: {backup_path}")
+                self._backup_to_original[backup_path] = file_path
+                self._original_to_backups.setdefault(file_path, []).append(backup_path)
+                logger.info("Created backup: %s", backup_path)
                 
                 return backup_path
                 
             except Exception as e:
-                logger.error(f"Failed to create backup for {file_path}: {e}")
+                logger.error("Failed to create backup for %s: %s", file_path, e)
                 return None
     
+    def _write_backup(self, file_path: str, backup_path: str, backup_base: str) -> None:
+        """Clone where the filesystem supports it (no data copied),
+        otherwise copy the bytes."""
+        cloned = False
+        if backup_base not in self._no_clone_dirs:
+            try:
+                cloned = _clone_file(file_path, backup_path)
+                if not cloned:
+                    self._no_clone_dirs.add(backup_base)
+            except (FileExistsError, FileNotFoundError):
+                raise
+            except OSError as e:
+                # A problem with this file, not the filesystem
+                logger.debug("Clone failed for %s, copying instead: %s", file_path, e)
+        if cloned:
+            shutil.copystat(file_path, backup_path)
+        else:
+            shutil.copy2(file_path, backup_path)
+
+    def _timestamp(self) -> str:
+        """Backup name timestamp, formatted at most once per second."""
+        now = int(time.time())
+        if now != self._stamp[0]:
+            self._stamp = (now, time.strftime('%Y%m%d_%H%M%S', time.localtime(now)))
+        return self._stamp[1]
+
     def restore_backup(self, backup_path: str, original_path: Optional[str] = None) -> bool:
         """
         Restore a file from backup.
@@ -111,15 +225,12 @@ class BackupManager:
             True if restoration succeeded
         """
         if not os.path.exists(backup_path):
-            logger.error(f"Backup file not found: {backup_path}")
+            logger.error("Backup file not found: %s", backup_path)
             return False
         
         # Find original path from log if not provided
         if not original_path:
-            for orig, bak, _ in self.backup_log:
-                if bak == backup_path:
-                    original_path = orig
-                    break
+            original_path = self._backup_to_original.get(backup_path)
         
         if not original_path:
             logger.error("Cannot determine original path for restoration")
@@ -127,10 +238,10 @@ class BackupManager:
         
         try:
             shutil.copy2(backup_path, original_path)
-            logger.info(f"Restored {original_path} from {backup_path}")
+            logger.info("Restored %s from %s", original_path, backup_path)
             return True
         except Exception as e:
-            logger.error(f"Failed to restore backup: {e}")
+            logger.error("Failed to restore backup: %s", e)
             return False
     
     def restore_all(self) -> int:
@@ -157,88 +268,78 @@ class BackupManager:
         if not self.backup_dir or not os.path.exists(self.backup_dir):
             return
         
-        now = datetime.now()
-        file_backups: dict = {}  # original_name -> list of (path, mtime)
+        now_ts = time.time()
+        file_backups: dict = {}  # original_name -> list of (path, mtime_ts)
         
         # Collect all backups
         with os.scandir(self.backup_dir) as entries:
             for entry in entries:
                 if entry.is_file():
-                    mtime = datetime.fromtimestamp(entry.stat().st_mtime)
+                    mtime_ts = entry.stat(follow_symlinks=False).st_mtime
                     # Extract original filename (remove timestamp suffix)
-                    name = entry.name
-                    # Pattern: name_YYYYMMDD_HHMMSS.ext
-                    parts = name.rsplit('_', 2)
-                    if len(parts) >= 2:
-                        base_name = parts[0]
-                    else:
-                        base_name = name
-                    
-                    if base_name not in file_backups:
-                        file_backups[base_name] = []
-                    file_backups[base_name].append((entry.path, mtime))
+                    base_name = _backup_group(entry.name)
+                    file_backups.setdefault(base_name, []).append((entry.path, mtime_ts))
         
         # Process each file's backups
         for base_name, backups in file_backups.items():
             # Sort by modification time (newest first)
             backups.sort(key=lambda x: x[1], reverse=True)
             
-            for i, (path, mtime) in enumerate(backups):
+            for i, (path, mtime_ts) in enumerate(backups):
                 # Keep latest N
                 if i < keep_latest:
                     continue
                 
-                # Check age
-                age = (now - mtime).days
+                # Check age in whole days
+                age = (now_ts - mtime_ts) // 86400
                 if age > max_age_days:
                     try:
                         os.remove(path)
-                        logger.info(f"Deleted old backup: {path}")
+                        logger.info("Deleted old backup: %s", path)
                     except Exception as e:
-                        logger.warning(f"Failed to delete backup {path}: {e}")
+                        logger.warning("Failed to delete backup %s: %s", path, e)
     
     def get_backups_for_file(self, file_path: str) -> List[str]:
         """Get list of available backups for a file."""
-        backups = []
-        for original, backup, _ in self.backup_log:
-            if original == file_path and os.path.exists(backup):
-                backups.append(backup)
-        return backups
+        return [b for b in self._original_to_backups.get(file_path, ()) if os.path.exists(b)]
     
     def get_backup_stats(self) -> dict:
         """Get statistics about backups."""
         return {
             'total_backups': len(self.backup_log),
             'backup_dir': self.backup_dir,
-            'files_backed_up': len(set(orig for orig, _, _ in self.backup_log))
+            'files_backed_up': len(self._original_to_backups)
         }
 
 
 # Global backup manager instance
 _backup_manager: Optional[BackupManager] = None
+_backup_manager_lock = threading.Lock()  # Guards check-and-create of _backup_manager
 
 
 def get_backup_manager(backup_dir: Optional[str] = None) -> BackupManager:
     """Get or create the global backup manager."""
     global _backup_manager
-    if _backup_manager is None:
-        _backup_manager = BackupManager(backup_dir)
-    elif backup_dir is not None:
-        requested_dir = os.path.normcase(os.path.abspath(backup_dir))
-        current_dir = (
-            os.path.normcase(os.path.abspath(_backup_manager.backup_dir))
-            if _backup_manager.backup_dir
-            else None
-        )
-        if requested_dir != current_dir:
+    with _backup_manager_lock:
+        if _backup_manager is None:
             _backup_manager = BackupManager(backup_dir)
+        elif backup_dir is not None:
+            requested_dir = os.path.normcase(os.path.abspath(backup_dir))
+            current_dir = (
+                os.path.normcase(os.path.abspath(_backup_manager.backup_dir))
+                if _backup_manager.backup_dir
+                else None
+            )
+            if requested_dir != current_dir:
+                _backup_manager = BackupManager(backup_dir)
     return _backup_manager
 
 
 def reset_backup_manager() -> None:
     """Reset the global backup manager singleton."""
     global _backup_manager
-    _backup_manager = None
+    with _backup_manager_lock:
+        _backup_manager = None
 
 
 def backup_file(file_path: str) -> Optional[str]:
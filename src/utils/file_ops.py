@@ -12,6 +12,8 @@ logger = logging.getLogger(__name__)
 _WIN32_REPLACE = None
 _WIN32_SHARING_VIOLATION = 32
 
+_TEMP_NAME_ATTEMPTS = 3
+
 
 def _ensure_win32_replace():
     global _WIN32_REPLACE
@@ -65,7 +67,7 @@ def _atomic_replace(src: str, dst: str, retries: int = 3) -> None:
 
 
 @contextmanager
-def safe_write(filepath, mode='w', encoding='utf-8', **kwargs):
+def safe_write(filepath, mode='w', encoding='utf-8', durable=True, **kwargs):
     """
     Safely write to a file using a temporary file + atomic replace.
 
@@ -77,28 +79,42 @@ def safe_write(filepath, mode='w', encoding='utf-8', **kwargs):
         filepath: Path to the target file.
         mode: Open mode ('w', 'wb', …).
         encoding: Encoding for text mode (default: utf-8).
+        durable: ``fsync`` the temp file before the replace (default). Bulk
+            writers may pass False: the replace stays atomic, but the new
+            contents can be lost on power failure instead of costing one
+            disk flush per file.
         **kwargs: Additional arguments for ``open()``.
     """
     dir_name = os.path.dirname(filepath)
     file_name = os.path.basename(filepath)
 
-    temp_name = f"tmp_{file_name}_{os.urandom(4).hex()}.tmp"
-    temp_path = os.path.join(dir_name, temp_name)
+    # Exclusive create: a name clash with another writer's temp file
+    # fails here instead of both writers sharing (and deleting) one file
+    open_mode = mode.replace('w', 'x') if 'w' in mode else mode
+    open_kwargs = dict(kwargs) if 'b' in mode else dict(kwargs, encoding=encoding)
 
+    temp_path = None
     f = None
     try:
-        if 'b' in mode:
-            f = open(temp_path, mode, **kwargs)
-        else:
-            f = open(temp_path, mode, encoding=encoding, **kwargs)
+        for attempt in range(_TEMP_NAME_ATTEMPTS):
+            candidate = os.path.join(dir_name, f"tmp_{file_name}_{os.urandom(4).hex()}.tmp")
+            try:
+                f = open(candidate, open_mode, **open_kwargs)
+            except FileExistsError:
+                if attempt == _TEMP_NAME_ATTEMPTS - 1:
+                    raise
+                continue
+            temp_path = candidate
+            break
 
         yield f
 
         f.flush()
-        try:
-            os.fsync(f.fileno())
-        except OSError:
-            pass
+        if durable:
+            try:
+                os.fsync(f.fileno())
+            except OSError:
+                pass
         f.close()
         f = None
 
@@ -125,7 +141,7 @@ def safe_write(filepath, mode='w', encoding='utf-8', **kwargs):
                 f.close()
             except Exception as ce:
                 logger.debug("Error closing temp file: %s", ce)
-        if os.path.exists(temp_path):
+        if temp_path and os.path.exists(temp_path):
             try:
                 os.remove(temp_path)
             except OSError as oe:
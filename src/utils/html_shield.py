@@ -1,7 +1,9 @@
 import logging
 import re
 from typing import Dict, Tuple
+from src.core.constants import TOKEN_LINE_BREAK
 from src.core.lexer import RPGLexer
+from src.utils.placeholder import fuzzy_repair_tokens, restore_bracket_tokens
 
 logger = logging.getLogger(__name__)
 
@@ -24,7 +26,6 @@ class HTMLShield:
         if not text:
             return "", {}
 
-        from src.core.constants import TOKEN_LINE_BREAK
         processed_text = text.replace('\n', TOKEN_LINE_BREAK)
 
         try:
@@ -57,17 +58,13 @@ class HTMLShield:
             return shielded_text
 
         # 1. Fuzzy Repair: Fix space-mangled and bracket-substituted tokens
-        from src.utils.placeholder import fuzzy_repair_tokens
         result_text = fuzzy_repair_tokens(shielded_text, token_map)
 
-        # 2. Sequential Restoration (longest tokens first to avoid partial matches)
-        tokens = sorted(token_map.keys(), key=len, reverse=True)
-        for token in tokens:
-            original = token_map[token]
-            result_text = result_text.replace(token, original)
+        # 2. Single-pass restoration: each ⟦…⟧ span is looked up whole, so
+        # ⟦T1⟧ never matches inside ⟦T10⟧
+        result_text = restore_bracket_tokens(result_text, token_map)
 
         # 3. Final Line Break Restoration
-        from src.core.constants import TOKEN_LINE_BREAK
         result_text = result_text.replace(TOKEN_LINE_BREAK, '\n')
             
         return result_text
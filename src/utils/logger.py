@@ -3,7 +3,13 @@ import sys
 
 def setup_logger(name="RPGMLocalizer"):
     logger = logging.getLogger(name)
+    # Repeated calls must not stack another stdout handler
+    if logger.handlers:
+        return logger
     logger.setLevel(logging.DEBUG)
+    # Records are printed here; letting them reach root as well would
+    # print them twice once the root logger has a handler
+    logger.propagate = False
     
     formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
     
@@ -1,6 +1,6 @@
 import re
 import logging
-from typing import Dict, Tuple, List
+from typing import Callable, Dict, Tuple, List
 
 from src.core.constants import TOKEN_LINE_BREAK
 
@@ -11,6 +11,17 @@ logger = logging.getLogger(__name__)
 # Adapted from RenLocalizer's battle-tested ⟦⟧ token system
 # =============================================================================
 
+# fuzzy_repair_tokens: both recovery phases as one alternation, so the text
+# is scanned once. The branches can never overlap (the second one cannot
+# start on ⟦), so this matches running them one after the other.
+_MANGLED_TOKEN_RE = re.compile(
+    # ⟦ T 0 ⟧ → ⟦T0⟧, ⟦T 10⟧ → ⟦T10⟧
+    r'⟦\s*[tT]\s*(\d+)\s*⟧'
+    # Google may replace ⟦⟧ with [], (), {}, 【】
+    r'|[\[(\{【]\s*[tT]\s*(\d+)\s*[\])\}】]'
+)
+
+
 def validate_restoration(original: str, restored: str, token_map: Dict[str, str]) -> Tuple[bool, List[str]]:
     """
     Validate that all critical RPG Maker tokens are present in the restored text.
@@ -20,6 +31,7 @@ def validate_restoration(original: str, restored: str, token_map: Dict[str, str]
         return True, []
 
     missing_tokens = []
+    clean_restored = restored.replace(" ", "").lower()
     
     # We check if the CONTENT of the tokens is present in the restored text.
     # Note: tokens were already restored in the unshielding phase.
@@ -27,7 +39,6 @@ def validate_restoration(original: str, restored: str, token_map: Dict[str, str]
         # Check if original content is missing from restored
         # We use a normalized check (ignore spaces if it's RM code)
         clean_content = original_content.replace(" ", "").lower()
-        clean_restored = restored.replace(" ", "").lower()
         
         if clean_content not in clean_restored:
             # Check if it's a decorative code (don't fail for color/icon changes)
@@ -52,34 +63,59 @@ def fuzzy_repair_tokens(restored: str, token_map: Dict[str, str]) -> str:
     if not restored or not token_map:
         return restored
 
-    result = restored
-    
-    # Phase 1: Fix space-mangled tokens inside ⟦⟧
-    # ⟦ T 0 ⟧ → ⟦T0⟧, ⟦T 10⟧ → ⟦T10⟧
-    spaced_pattern = re.compile(r'⟦\s*[tT]\s*(\d+)\s*⟧')
-    
-    def fix_spaced(match: re.Match) -> str:
-        token_id = match.group(1)
-        expected_token = f"⟦T{token_id}⟧"
+    def fix_token(match: re.Match) -> str:
+        expected_token = f"⟦T{match.group(match.lastindex)}⟧"
         if expected_token in token_map:
             return expected_token
         return match.group(0)
 
-    result = spaced_pattern.sub(fix_spaced, result)
-    
-    # Phase 2: Bracket-substituted recovery
-    # Google may replace ⟦⟧ with [], (), {}, 【】
-    bracket_sub_pattern = re.compile(
-        r'[\[(\{【]\s*[tT]\s*(\d+)\s*[\])\}】]'
-    )
-    
-    def fix_bracket_sub(match: re.Match) -> str:
-        token_id = match.group(1)
-        expected_token = f"⟦T{token_id}⟧"
-        if expected_token in token_map:
-            return expected_token
-        return match.group(0)
-    
-    result = bracket_sub_pattern.sub(fix_bracket_sub, result)
+    return _MANGLED_TOKEN_RE.sub(fix_token, restored)
+
+
+def make_restorer(token_map: Dict[str, str]) -> Callable[[str], str]:
+    """
+    Compile *token_map* once into a callable that restores every token in a
+    single regex pass.
+
+    Longer tokens are tried first so ``⟦T10⟧`` is never split as ``⟦T1⟧``;
+    restored code is never rescanned, unlike chained ``str.replace`` calls.
+    Building the restorer costs a regex compile, so it only pays off when
+    one map restores many texts.
+    """
+    if not token_map:
+        return lambda text: text
+    keys = sorted(token_map, key=len, reverse=True)
+    pattern = re.compile("|".join(map(re.escape, keys)))
+    lookup = token_map.__getitem__
+    return lambda text: pattern.sub(lambda m: lookup(m.group(0)), text)
+
 
-    return result
+def restore_bracket_tokens(text: str, token_map: Dict[str, str]) -> str:
+    """
+    Restore ``⟦…⟧`` tokens in *text* with a plain ``str.find`` scan.
+
+    Every key must be a single ⟦…⟧ token with no nested brackets (as
+    HTMLShield's ``⟦Tn⟧`` are), so the text between a ``⟦`` and the next
+    ``⟧`` is looked up as a whole. No pattern is built per map.
+    """
+    start = text.find("⟦")
+    if start == -1 or not token_map:
+        return text
+    parts: List[str] = []
+    pos = 0
+    while start != -1:
+        end = text.find("⟧", start + 1)
+        if end == -1:
+            break
+        original = token_map.get(text[start:end + 1])
+        if original is None:
+            start = text.find("⟦", start + 1)
+            continue
+        parts.append(text[pos:start])
+        parts.append(original)
+        pos = end + 1
+        start = text.find("⟦", pos)
+    if not parts:
+        return text
+    parts.append(text[pos:])
+    return "".join(parts)
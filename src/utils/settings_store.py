@@ -1,7 +1,9 @@
-import json
+import copy
 import logging
 import os
-from typing import Any, Dict
+from typing import Any, Dict, Optional
+
+import orjson
 
 from src.utils.app_paths import get_settings_path
 from src.utils.file_ops import safe_write
@@ -11,28 +13,55 @@ class SettingsStore:
     def __init__(self, filename: str = "settings.json") -> None:
         self.logger = logging.getLogger(self.__class__.__name__)
         self.path = self._resolve_settings_path(filename)
+        # Last dict read from or written to disk, and the file's mtime then;
+        # load() serves it while the file is untouched, save() skips it
+        self._cache: Optional[Dict[str, Any]] = None
+        self._mtime: Optional[int] = None
 
     def _resolve_settings_path(self, filename: str) -> str:
         return os.fspath(get_settings_path(filename))
 
+    def _file_mtime(self) -> Optional[int]:
+        try:
+            return os.stat(self.path).st_mtime_ns
+        except OSError:
+            return None
+
     def load(self) -> Dict[str, Any]:
         try:
-            if not os.path.exists(self.path):
+            try:
+                f = open(self.path, "rb")
+            except FileNotFoundError:
+                return {}
+            with f:
+                # fstat on the open file: the mtime belongs to the bytes read
+                mtime = os.fstat(f.fileno()).st_mtime_ns
+                if self._cache is not None and mtime == self._mtime:
+                    return copy.deepcopy(self._cache)
+                data = orjson.loads(f.read())
+            if not isinstance(data, dict):
                 return {}
-            with open(self.path, "r", encoding="utf-8") as f:
-                data = json.load(f)
-            return data if isinstance(data, dict) else {}
+            self._cache, self._mtime = data, mtime
+            return copy.deepcopy(data)
         except Exception as e:
             self.logger.warning(f"Failed to load settings: {e}")
             return {}
 
-    def save(self, data: Dict[str, Any]) -> None:
+    def save(self, data: Dict[str, Any]) -> bool:
+        if self._cache is not None and data == self._cache and self._file_mtime() == self._mtime:
+            return True
         try:
             # Ensure the parent directory exists (first-run scenario)
             dir_name = os.path.dirname(self.path)
             if dir_name:
                 os.makedirs(dir_name, exist_ok=True)
-            with safe_write(self.path, mode="w", encoding="utf-8") as f:
-                json.dump(data, f, indent=2, ensure_ascii=True)
+            # Serialise first: a bad value then fails before the temp file
+            # exists, and the file gets a single write of ready UTF-8 bytes
+            payload = orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+            with safe_write(self.path, mode="wb") as f:
+                f.write(payload)
+            self._cache, self._mtime = copy.deepcopy(data), self._file_mtime()
+            return True
         except Exception as e:
             self.logger.warning(f"Failed to save settings: {e}")
+            return False
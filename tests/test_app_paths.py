@@ -45,6 +45,23 @@ class TestAppPaths(unittest.TestCase):
 
         self.assertEqual(store.path, os.fspath(settings_path))
 
+    def test_settings_store_caches_until_file_changes(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            settings_path = Path(tmpdir) / "settings.json"
+            with patch("src.utils.settings_store.get_settings_path", return_value=settings_path):
+                store = SettingsStore()
+
+            self.assertTrue(store.save({"regex_blacklist": ["^a"]}))
+            loaded = store.load()
+            loaded["regex_blacklist"].append("^b")
+            with patch("src.utils.settings_store.orjson.loads", side_effect=AssertionError("parsed again")):
+                self.assertEqual(store.load(), {"regex_blacklist": ["^a"]})
+                self.assertTrue(store.save({"regex_blacklist": ["^a"]}))
+
+            settings_path.write_text('{"use_cache": false}', encoding="utf-8")
+            os.utime(settings_path, ns=(0, 1))
+            self.assertEqual(store.load(), {"use_cache": False})
+
     def test_relative_backup_dir_resolves_under_app_data_dir(self) -> None:
         with tempfile.TemporaryDirectory() as tmpdir:
             with patch("src.utils.backup.get_data_dir", return_value=Path(tmpdir)):
@@ -42,5 +42,12 @@ class TestHTMLShield(unittest.TestCase):
         restored = shield.unshield_with_map(protected_text, token_map)
         self.assertEqual(restored, text)
 
+    def test_unshield_prefers_longest_token_and_repairs_brackets(self):
+        shield = HTMLShield()
+        token_map = {f"⟦T{i}⟧": f"\\V[{i}]" for i in range(11)}
+
+        restored = shield.unshield_with_map("a ⟦T10⟧ b [T1] c ⟦ t 0 ⟧", token_map)
+        self.assertEqual(restored, r"a \V[10] b \V[1] c \V[0]")
+
 if __name__ == "__main__":
     unittest.main()
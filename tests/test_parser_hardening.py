@@ -109,6 +109,21 @@ class TestParserHardening(unittest.TestCase):
         self.assertTrue(parser.is_safe_to_translate("meta: Visible text", is_dialogue=True))
         self.assertFalse(parser.is_safe_to_translate("Script: $gameTemp.doThing()", is_dialogue=False))
 
+    def test_regex_blacklist_is_combined_and_matches_each_pattern(self) -> None:
+        parser = DummyParser(regex_blacklist=["^System_.*", "  ", "Actor\\d+", "[invalid"])
+
+        self.assertIsNotNone(parser._blacklist_re)
+        self.assertFalse(parser.is_safe_to_translate("system_menu text", is_dialogue=True))
+        self.assertFalse(parser.is_safe_to_translate("Hello Actor12", is_dialogue=True))
+        self.assertTrue(parser.is_safe_to_translate("Hello there", is_dialogue=True))
+
+    def test_regex_blacklist_with_backreference_is_checked_separately(self) -> None:
+        parser = DummyParser(regex_blacklist=[r"(ab)\1", r"(xy)\1"])
+
+        self.assertIsNone(parser._blacklist_re)
+        self.assertFalse(parser.is_safe_to_translate("say xyxy now", is_dialogue=True))
+        self.assertTrue(parser.is_safe_to_translate("say xyab now", is_dialogue=True))
+
     def test_comment_like_command_is_skipped_when_enabled(self) -> None:
         parser = JsonParser(translate_comments=True)
         data = [{"code": 108, "parameters": ["layer load"], "indent": 0}]
@@ -7,6 +7,7 @@ translation and re-inserted after, instead of the old token-based system.
 import unittest
 from src.core.syntax_guard_rpgm import protect_for_translation, restore_from_translation
 from src.core.text_segmenter import SegmentType
+from src.utils.placeholder import fuzzy_repair_tokens, make_restorer, restore_bracket_tokens
 
 
 class TestPlaceholderProtection(unittest.TestCase):
@@ -166,5 +167,45 @@ class TestPlaceholderRestoration(unittest.TestCase):
         self.assertIn("\\i[5]", restored)
 
 
+class TestMakeRestorer(unittest.TestCase):
+    """make_restorer compiles a token map into a single-pass restore callable."""
+
+    def test_longest_token_wins(self):
+        restore = make_restorer({"⟦T1⟧": r"\c[1]", "⟦T10⟧": r"\V[10]"})
+        self.assertEqual(restore("a ⟦T10⟧ b ⟦T1⟧"), r"a \V[10] b \c[1]")
+
+    def test_restored_code_is_not_rescanned(self):
+        restore = make_restorer({"⟦A⟧": "⟦B⟧", "⟦B⟧": "x"})
+        self.assertEqual(restore("⟦A⟧ ⟦B⟧"), "⟦B⟧ x")
+
+    def test_empty_map_is_identity(self):
+        self.assertEqual(make_restorer({})("⟦T0⟧"), "⟦T0⟧")
+
+
+class TestRestoreBracketTokens(unittest.TestCase):
+    """restore_bracket_tokens scans for ⟦…⟧ spans without a regex."""
+
+    def test_whole_span_lookup(self):
+        token_map = {"⟦T1⟧": r"\c[1]", "⟦T10⟧": r"\V[10]"}
+        self.assertEqual(
+            restore_bracket_tokens("⟦⟦T10⟧ ⟦T2⟧ ⟦T1⟧ ⟦T1", token_map),
+            r"⟦\V[10] ⟦T2⟧ \c[1] ⟦T1",
+        )
+
+    def test_restored_code_is_not_rescanned(self):
+        self.assertEqual(restore_bracket_tokens("⟦A⟧ ⟦B⟧", {"⟦A⟧": "⟦B⟧", "⟦B⟧": "x"}), "⟦B⟧ x")
+
+
+class TestFuzzyRepairTokens(unittest.TestCase):
+    """fuzzy_repair_tokens fixes both mangling styles in one pass."""
+
+    def test_spaced_and_bracketed_tokens_are_repaired(self):
+        token_map = {"⟦T0⟧": r"\c[1]", "⟦T12⟧": r"\V[3]"}
+        self.assertEqual(
+            fuzzy_repair_tokens("⟦ t 0 ⟧ and 【T12】 but [T7]", token_map),
+            "⟦T0⟧ and ⟦T12⟧ but [T7]",
+        )
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -1,15 +1,19 @@
+import errno
 import json
 import os
+import shutil
+import sys
 import tempfile
 import unittest
 from pathlib import Path
 from unittest.mock import patch
 
-from src.core.cache import get_cache, reset_cache
+from src.core.cache import TranslationCache, get_cache, reset_cache
 from src.core.parsers.json_parser import JsonParser
 from src.core.translation_pipeline import TranslationPipeline
 from src.ui.interfaces.home_interface import HomeInterface
-from src.utils.backup import get_backup_manager, reset_backup_manager
+from src.utils.backup import BackupManager, _clone_file, get_backup_manager, reset_backup_manager
+from src.utils.file_ops import safe_write
 
 
 class SingletonResetTestCase(unittest.TestCase):
@@ -293,11 +297,115 @@ class TestSingletonDirectorySwitching(SingletonResetTestCase):
         )
 
 
+class TestTranslationCacheMemo(unittest.TestCase):
+    def test_hot_lookups_skip_hashing_and_language_clear_invalidates(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            cache = TranslationCache(tmpdir)
+            cache.set("Hello", "Merhaba", "en", "tr")
+
+            with patch.object(cache, "_hash_text", side_effect=AssertionError("hashed")):
+                self.assertEqual(cache.get("Hello", "en", "tr"), "Merhaba")
+
+            cache.clear_for_language("tr")
+            self.assertIsNone(cache.get("Hello", "en", "tr"))
+
+    def test_memo_is_bounded(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            cache = TranslationCache(tmpdir)
+            cache.MEMO_MAX_ENTRIES = 2
+            for text in ("a", "b", "c"):
+                cache.set(text, text.upper(), "en", "tr")
+
+            self.assertEqual(list(cache._memo), [("en", "tr", "b"), ("en", "tr", "c")])
+            self.assertEqual(cache.get("a", "en", "tr"), "A")
+
+
 class TestEncryptedArchiveDetection(unittest.TestCase):
     def test_mv_mz_encrypted_audio_extension_is_registered(self) -> None:
         self.assertIn(".rpgmvo", HomeInterface.ENCRYPTED_ARCHIVE_EXTENSIONS)
         self.assertNotIn(".rpgmwo", HomeInterface.ENCRYPTED_ARCHIVE_EXTENSIONS)
 
+    def test_scan_reports_archives_only_without_readable_data(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            root = Path(tmpdir)
+            (root / "WWW").mkdir()
+            (root / "Game.RGSS3A").write_text("", encoding="utf-8")
+            (root / "WWW" / "hero.rpgmvp").write_text("", encoding="utf-8")
+
+            found = HomeInterface._scan_encrypted_game(tmpdir)
+            self.assertEqual(sorted(found), ["Game.RGSS3A", "hero.rpgmvp"])
+
+            (root / "WWW" / "data").mkdir()
+            (root / "WWW" / "data" / "Map001.json").write_text("{}", encoding="utf-8")
+            self.assertEqual(HomeInterface._scan_encrypted_game(tmpdir), [])
+
+
+class TestSafeWriteTempFiles(unittest.TestCase):
+    def test_temp_name_clash_never_reuses_another_writers_file(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            target = os.path.join(tmpdir, "Map001.json")
+            taken = os.path.join(tmpdir, "tmp_Map001.json_00000000.tmp")
+            Path(taken).write_text("other writer", encoding="utf-8")
+
+            names = iter([bytes(4), bytes(4), b"\x00\x00\x00\x01"])
+            with patch("src.utils.file_ops.os.urandom", side_effect=lambda n: next(names)):
+                with safe_write(target) as f:
+                    f.write("{}")
+
+            self.assertEqual(Path(taken).read_text(encoding="utf-8"), "other writer")
+            self.assertEqual(Path(target).read_text(encoding="utf-8"), "{}")
+            self.assertEqual(sorted(os.listdir(tmpdir)), ["Map001.json", os.path.basename(taken)])
+
+
+class TestBackupCloning(unittest.TestCase):
+    @unittest.skipUnless(sys.platform.startswith("linux"), "FICLONE path is Linux-only")
+    def test_clone_never_removes_an_existing_destination(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            src = Path(tmpdir) / "Map001.json"
+            dst = Path(tmpdir) / "Map001_backup.json"
+            src.write_text("{}", encoding="utf-8")
+            dst.write_text("existing backup", encoding="utf-8")
+
+            with self.assertRaises(FileExistsError):
+                _clone_file(os.fspath(src), os.fspath(dst))
+            self.assertEqual(dst.read_text(encoding="utf-8"), "existing backup")
+
+    def _backup_with_clone(self, clone) -> tuple:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            src = Path(tmpdir) / "Map001.json"
+            src.write_text('{"a": 1}', encoding="utf-8")
+            manager = BackupManager(os.path.join(tmpdir, "backups"))
+            with patch("src.utils.backup._clone_file", side_effect=clone):
+                backup = manager.create_backup(os.fspath(src))
+            content = Path(backup).read_text(encoding="utf-8") if backup else None
+            return content, manager.backup_dir in manager._no_clone_dirs
+
+    def test_unsupported_filesystem_disables_cloning_for_the_directory(self) -> None:
+        content, disabled = self._backup_with_clone(lambda src, dst: False)
+        self.assertEqual(content, '{"a": 1}')
+        self.assertTrue(disabled)
+
+    def test_one_off_clone_error_copies_without_disabling_cloning(self) -> None:
+        def clone(src, dst):
+            raise PermissionError(errno.EACCES, "denied", src)
+
+        content, disabled = self._backup_with_clone(clone)
+        self.assertEqual(content, '{"a": 1}')
+        self.assertFalse(disabled)
+
+    def test_backup_dir_removed_between_backups_is_recreated(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            src = Path(tmpdir) / "Map001.json"
+            src.write_text("{}", encoding="utf-8")
+            manager = BackupManager(os.path.join(tmpdir, "backups"))
+            self.assertIsNotNone(manager.create_backup(os.fspath(src)))
+
+            shutil.rmtree(manager.backup_dir)
+            backup = manager.create_backup(os.fspath(src))
+
+            self.assertIsNotNone(backup)
+            self.assertEqual(Path(backup).read_text(encoding="utf-8"), "{}")
+
 
 if __name__ == "__main__":
     unittest.main()
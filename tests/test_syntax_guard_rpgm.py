@@ -14,6 +14,7 @@ from src.core.syntax_guard_rpgm import (
 )
 from src.core.text_segmenter import (
     segment_text,
+    segment_texts,
     clean_text as segmenter_clean,
     reassemble as segmenter_reassemble,
     SegmentType,
@@ -158,6 +159,45 @@ class TestNestedBrackets(unittest.TestCase):
         restored = segmenter_reassemble(clean, segments)
         self.assertEqual(restored, text)
 
+    def test_code_priority_within_shared_opener(self):
+        """Codes sharing an opening character keep their match priority.
+
+        ``\\p[x]`` is ``\\p`` followed by a generic ``[x]``; adjacent codes
+        merge into one CODE segment.
+        """
+        text = r"[[a] b]] [happy2] [x] \p[x] \p[3] \fs \FS[2] <center>"
+        codes = [s.content for s in segment_text(text) if s.type == SegmentType.CODE]
+        self.assertEqual(
+            codes,
+            ["[[a] b]]", "[happy2]", "[x]", r"\p[x]", r"\p[3]", r"\fs", r"\FS[2]", "<center>"],
+        )
+
+
+class TestBatchSegmentation(unittest.TestCase):
+    """segment_texts must match per-text segment_text exactly."""
+
+    def test_batch_matches_per_text(self):
+        texts = [
+            r"Hello \c[1]Hero\c[0]!",
+            "",
+            r"\I[5]",
+            "Plain text",
+            r"Ends with \FS",
+            r"[[escaped]] and {{also}} \n<Bob>",
+        ]
+        self.assertEqual(
+            [repr(s) for s in segment_texts(texts)],
+            [repr(segment_text(t)) for t in texts],
+        )
+
+    def test_match_straddling_boundary_is_rescanned(self):
+        """An unclosed bracket must not pair with a bracket in the next text."""
+        texts = ["open [left", "right] then [x]", r"\V[1] tail"]
+        self.assertEqual(
+            [repr(s) for s in segment_texts(texts)],
+            [repr(segment_text(t)) for t in texts],
+        )
+
 
 class TestLegacyWrapper(unittest.TestCase):
     """Test that legacy `protect_rpgm_syntax` / `restore_rpgm_syntax` wrappers
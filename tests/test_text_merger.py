@@ -24,6 +24,27 @@ class TestTextMerger(unittest.TestCase):
         self.assertTrue(map_requests[0]["metadata"].get("is_merged"))
         self.assertEqual(len(merged_map), 1)
 
+    def test_split_merged_result_checked_pairs_in_merge_order(self) -> None:
+        merger = TextMerger()
+        entries = [("message_dialogue", "k1", "A"), ("message_dialogue", "k2", "B"), ("message_dialogue", "k3", "C")]
+
+        pairs, mismatch = merger.split_merged_result_checked("a\n|||RPGMSEP_M|||\nb ⟦_M_⟧ c", entries)
+        self.assertFalse(mismatch)
+        self.assertEqual(pairs, [("k1", "a"), ("k2", "b"), ("k3", "c")])
+
+        pairs, mismatch = merger.split_merged_result_checked("a |||RPGMSEP_M||| b", entries)
+        self.assertTrue(mismatch)
+        self.assertEqual(pairs, [("k1", "a"), ("k2", "b"), ("k3", "C")])
+
+    def test_add_flushes_on_running_char_total(self) -> None:
+        merger = TextMerger(batch_size=100)
+        merger.MAX_SAFE_CHARS = 30
+        for i in range(4):
+            merger.add(f"k{i}", "x" * 10, "message_dialogue")
+        requests = merger.get_requests()
+        self.assertEqual(len(requests), 4)
+        self.assertTrue(all(not r["metadata"]["is_merged"] for r in requests))
+
 
 if __name__ == "__main__":
     unittest.main()
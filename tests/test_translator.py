@@ -0,0 +1,420 @@
+"""
+Unit tests for GoogleTranslator request orchestration.
+
+Network access is replaced by a minimal fake aiohttp session so that racing,
+slicing and result bookkeeping can be exercised deterministically.
+"""
+import asyncio
+import json
+import random
+import unittest
+import urllib.parse
+from unittest.mock import patch
+
+from src.core.constants import ENDPOINT_RATE_MAX
+from src.core.translator import GoogleTranslator, _TokenBucket, _split_batch, _BATCH_SPLIT_RE
+
+
+class _FakeResponse:
+    def __init__(self, status: int, payload) -> None:
+        self.status = status
+        self._payload = payload
+
+    async def json(self, content_type=None):
+        return self._payload
+
+    async def read(self) -> bytes:
+        return json.dumps(self._payload).encode("utf-8")
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        return False
+
+
+class _FakeSession:
+    """Answers every GET with ``translate(q)`` after an optional per-host delay."""
+
+    def __init__(self, translate=None, delays: dict | None = None) -> None:
+        self.translate = translate or (lambda q: q.upper())
+        self.delays = delays or {}
+        self.calls: list[str] = []
+        self.closed = False
+
+    def get(self, url, params=None, timeout=None):
+        return _FakeRequest(self, url, params or {})
+
+    async def close(self) -> None:
+        self.closed = True
+
+
+class _FakeRequest:
+    def __init__(self, session: _FakeSession, url: str, params: dict) -> None:
+        self.session = session
+        self.url = url
+        self.params = params
+
+    async def __aenter__(self):
+        params = dict(self.params)
+        if not params and "?" in self.url:
+            params = dict(urllib.parse.parse_qsl(self.url.split("?", 1)[1]))
+        self.session.calls.append(self.url.split("?", 1)[0])
+        for host, delay in self.session.delays.items():
+            if host in self.url:
+                await asyncio.sleep(delay)
+        text = self.session.translate(params.get("q", ""))
+        return _FakeResponse(200, [[[text, params.get("q", "")]]])
+
+    async def __aexit__(self, exc_type, exc, tb):
+        return False
+
+
+def _make_translator(session: _FakeSession, **kwargs) -> GoogleTranslator:
+    kwargs.setdefault("request_delay_ms", 0)
+    translator = GoogleTranslator(**kwargs)
+    translator._session = session
+
+    async def _get_session():
+        return session
+
+    translator._get_session = _get_session
+    return translator
+
+
+class TestRacing(unittest.TestCase):
+    SLOW = "https://translate.google.com/translate_a/single"
+    FAST = "https://translate.googleapis.com/translate_a/single"
+
+    def _racing_translator(self, session: _FakeSession) -> GoogleTranslator:
+        translator = _make_translator(session, racing_endpoints=2)
+        translator.google_endpoints = [self.SLOW, self.FAST]
+        translator._endpoint_health[self.SLOW].ewma_ms = 1.0
+        translator._endpoint_health[self.FAST].ewma_ms = 1000.0
+        translator._latency_samples.extend([0.02] * 16)
+        translator._pick_endpoints = lambda k: [self.SLOW, self.FAST][:max(1, k)]
+        return translator
+
+    def test_slow_primary_is_hedged_and_loser_reaped(self) -> None:
+        session = _FakeSession(delays={"translate.google.com/": 5.0})
+        translator = self._racing_translator(session)
+
+        async def run():
+            before = asyncio.all_tasks()
+            result = await asyncio.wait_for(
+                translator._try_translate("hello", "en", "tr", 1), timeout=2.0
+            )
+            leftover = asyncio.all_tasks() - before - {asyncio.current_task()}
+            return result, leftover
+
+        result, leftover = asyncio.run(run())
+        self.assertEqual(result, ["HELLO"])
+        self.assertEqual(session.calls, [self.SLOW, self.FAST])
+        self.assertFalse([t for t in leftover if not t.done()])
+
+    def test_fast_primary_sends_a_single_request(self) -> None:
+        session = _FakeSession()
+        translator = self._racing_translator(session)
+
+        result = asyncio.run(translator._try_translate("hello", "en", "tr", 1))
+        self.assertEqual(result, ["HELLO"])
+        self.assertEqual(session.calls, [self.SLOW])
+
+    def test_undecodable_body_counts_as_endpoint_failure(self) -> None:
+        session = _FakeSession()
+        translator = self._racing_translator(session)
+        translator.max_retries = 1
+        translator.enable_lingva_fallback = False
+
+        async def garbage(self_resp):
+            return b"<html>captcha</html>"
+
+        with patch.object(_FakeResponse, "read", garbage):
+            result = asyncio.run(translator._try_translate("hello", "en", "tr", 1, racing=False))
+        self.assertIsNone(result)
+        self.assertEqual(translator._endpoint_health[self.SLOW].fails, 1)
+
+    def test_hedging_stops_when_budget_is_spent(self) -> None:
+        session = _FakeSession(delays={"translate.google.com/": 0.2})
+        translator = self._racing_translator(session)
+        translator._hedge_tokens = 0.0
+
+        result = asyncio.run(translator._try_translate("hello", "en", "tr", 1))
+        self.assertEqual(result, ["HELLO"])
+        self.assertEqual(session.calls, [self.SLOW])
+
+
+def _requests(*texts: str) -> list[dict]:
+    return [
+        {"text": t, "metadata": {"source_lang": "en", "target_lang": "tr", "key": str(i)}}
+        for i, t in enumerate(texts)
+    ]
+
+
+class TestRunWideDedup(unittest.TestCase):
+    def test_repeated_text_is_not_resent_across_calls(self) -> None:
+        session = _FakeSession()
+        translator = _make_translator(session, batch_size=1)
+
+        async def run():
+            first, second = await asyncio.gather(
+                translator.translate_batch(_requests("hello", "world")),
+                translator.translate_batch(_requests("hello")),
+            )
+            third = await translator.translate_batch(_requests("world"))
+            return first, second, third
+
+        first, second, third = asyncio.run(run())
+        self.assertEqual([r.translated_text for r in first], ["HELLO", "WORLD"])
+        self.assertEqual(second[0].translated_text, "HELLO")
+        self.assertTrue(second[0].success)
+        self.assertEqual(third[0].translated_text, "WORLD")
+        self.assertEqual(len(session.calls), 2)
+
+    def test_concurrent_single_requests_are_coalesced(self) -> None:
+        session = _FakeSession(delays={"translate": 0.05})
+        translator = _make_translator(session, racing_endpoints=1)
+
+        async def run():
+            return await asyncio.gather(
+                translator._try_translate("hello", "en", "tr", 1),
+                translator._try_translate("hello", "en", "tr", 1),
+                translator._try_translate("hello", "en", "de", 1),
+            )
+
+        results = asyncio.run(run())
+        self.assertEqual(results, [["HELLO"], ["HELLO"], ["HELLO"]])
+        self.assertEqual(len(session.calls), 2)
+        self.assertFalse(translator._single_inflight)
+
+    def test_close_fails_pending_work_fast(self) -> None:
+        session = _FakeSession()
+        translator = _make_translator(session)
+
+        async def run():
+            await translator.close()
+            return await translator.translate_batch(_requests("hello"))
+
+        results = asyncio.run(asyncio.wait_for(run(), timeout=2.0))
+        self.assertFalse(results[0].success)
+        self.assertEqual(session.calls, [])
+
+    def test_progress_is_reported_once_per_slice(self) -> None:
+        translator = _make_translator(_FakeSession(), batch_size=2)
+        calls: list[int] = []
+
+        asyncio.run(translator.translate_batch(
+            _requests("a", "b", "a", "c"), progress_callback=calls.append,
+        ))
+        self.assertEqual(sorted(calls), [1, 3])
+
+    def test_failed_text_is_retried_by_later_call(self) -> None:
+        session = _FakeSession(translate=lambda q: "")
+        translator = _make_translator(session, max_retries=1, enable_lingva_fallback=False)
+
+        async def run():
+            failed = await translator.translate_batch(_requests("hello"))
+            session.translate = lambda q: q.upper()
+            retried = await translator.translate_batch(_requests("hello"))
+            return failed, retried
+
+        failed, retried = asyncio.run(run())
+        self.assertFalse(failed[0].success)
+        self.assertEqual(retried[0].translated_text, "HELLO")
+
+
+def _likeliest(pop: list, weights: list) -> list:
+    """Deterministic stand-in for random.choices: the heaviest weight wins."""
+    return [pop[weights.index(max(weights))]]
+
+
+class TestEndpointSelection(unittest.TestCase):
+    def test_pick_endpoints_prefers_low_latency_and_skips_banned(self) -> None:
+        translator = _make_translator(_FakeSession())
+        fast, slow, banned = translator.google_endpoints[:3]
+        for ep in translator.google_endpoints:
+            translator._endpoint_health[ep].ewma_ms = 5000.0
+        translator._endpoint_health[fast].ewma_ms = 100.0
+        translator._register_success(fast, 0.05)
+        translator._endpoint_health[slow].ewma_ms = 1000.0
+        translator._endpoint_health[banned].ewma_ms = 1.0
+        translator._endpoint_health[banned].banned_until = float("inf")
+
+        self.assertAlmostEqual(translator._endpoint_health[fast].ewma_ms, 90.0)
+        with patch("src.core.translator.random.choices", side_effect=_likeliest):
+            self.assertEqual(translator._pick_endpoints(2), [fast, slow])
+        self.assertNotIn(banned, translator._pick_endpoints(len(translator.google_endpoints)))
+
+    def test_recent_failures_outweigh_small_latency_edge(self) -> None:
+        translator = _make_translator(_FakeSession())
+        flaky, steady = translator.google_endpoints[:2]
+        translator.google_endpoints = [flaky, steady]
+        translator._endpoint_health[flaky].ewma_ms = 100.0
+        translator._endpoint_health[steady].ewma_ms = 300.0
+        translator._register_failure(flaky)
+        translator._register_failure(flaky)
+
+        with patch("src.core.translator.random.choices", side_effect=_likeliest):
+            self.assertEqual(translator._pick_endpoints(2), [steady, flaky])
+
+    def test_primary_is_drawn_from_every_healthy_mirror(self) -> None:
+        translator = _make_translator(_FakeSession())
+        banned = translator.google_endpoints[-1]
+        for ep in translator.google_endpoints[:3]:
+            translator._endpoint_health[ep].ewma_ms = 50.0
+        translator._endpoint_health[banned].banned_until = float("inf")
+        drawn_from = []
+
+        def choices(pop, weights):
+            drawn_from.append(list(pop))
+            return [pop[0]]
+
+        with patch("src.core.translator.random.choices", side_effect=choices):
+            translator._pick_endpoints(1)
+        self.assertEqual(set(drawn_from[0]), set(translator.google_endpoints[:-1]))
+
+    def test_banned_mirror_returns_once_ban_expires(self) -> None:
+        translator = _make_translator(_FakeSession(), mirror_max_failures=1)
+        banned, healthy = translator.google_endpoints[:2]
+        translator.google_endpoints = [banned, healthy]
+        with patch("src.core.translator.time.time", return_value=1000.0):
+            translator._register_failure(banned)
+
+        self.assertEqual(translator._available_endpoints(1001.0), [healthy])
+        expiry = 1000.0 + translator.mirror_ban_time + 1
+        self.assertEqual(translator._available_endpoints(expiry), [banned, healthy])
+
+    def test_concurrent_slices_spread_over_several_mirrors(self) -> None:
+        session = _FakeSession(delays={"translate": 0.01})
+        translator = _make_translator(session, concurrency=20, batch_size=1)
+
+        texts = [f"line {i}" for i in range(20)]
+        results = asyncio.run(translator.translate_batch(_requests(*texts)))
+
+        self.assertTrue(all(r.success for r in results))
+        self.assertGreater(len(set(session.calls)), 1)
+
+
+class TestPrepareSlices(unittest.TestCase):
+    @staticmethod
+    def _reference_slices(texts, batch_size, limit, sep_len):
+        slices, current, chars = [], [], 0
+        for text in texts:
+            overhead = sep_len if current else 0
+            if len(current) >= batch_size or (current and chars + len(text) + overhead > limit):
+                slices.append(current)
+                current, chars, overhead = [], 0, 0
+            current.append(text)
+            chars += len(text) + overhead
+        if current:
+            slices.append(current)
+        return slices
+
+    def test_prefix_sum_slicing_matches_greedy_accumulator(self) -> None:
+        rng = random.Random(1234)
+        translator = _make_translator(_FakeSession(), batch_size=7, max_slice_chars=300)
+        sep_len = len("\n|||RPGMSEP_S|||\n")
+        for _ in range(50):
+            texts = ["x" * rng.choice([0, 1, 5, 40, 120, 299, 500]) for _ in range(rng.randint(0, 60))]
+            for lang, limit in (("en", 300), ("ja", 200)):
+                self.assertEqual(
+                    translator._prepare_slices(texts, source_lang=lang),
+                    self._reference_slices(texts, 7, limit, sep_len),
+                )
+
+    def test_batch_size_change_applies_to_remaining_slices(self) -> None:
+        translator = _make_translator(_FakeSession(), batch_size=4)
+        slices = translator._iter_slices(["x"] * 20)
+        self.assertEqual(len(next(slices)), 4)
+        translator._batch_scale = 2.0
+        self.assertEqual([len(s) for s in slices], [8, 8])
+
+
+class TestAdaptiveBatching(unittest.TestCase):
+    def _adapt(self, translator: GoogleTranslator, latency: float, ok: bool) -> None:
+        translator._recent_metrics.extend([(latency, ok)] * 40)
+        asyncio.run(translator._maybe_adapt_concurrency())
+        translator._last_adapt_time = 0.0
+
+    def test_slow_link_grows_batches_and_fast_link_shrinks_them(self) -> None:
+        translator = _make_translator(_FakeSession(), batch_size=40)
+        self._adapt(translator, 3.0, False)
+        self.assertEqual(translator._effective_batch_size(), 50)
+        for _ in range(10):
+            self._adapt(translator, 3.0, False)
+        self.assertEqual(translator._effective_batch_size(), 80)
+
+        translator._recent_metrics.clear()
+        for _ in range(20):
+            self._adapt(translator, 0.1, True)
+        self.assertEqual(translator._effective_batch_size(), 20)
+
+
+class TestTokenBucket(unittest.TestCase):
+    def test_throttle_halves_rate_and_success_regrows_it(self) -> None:
+        bucket = _TokenBucket(rate=4.0, tokens=4.0)
+        bucket.on_throttled()
+        self.assertEqual(bucket.rate, 2.0)
+        self.assertEqual(bucket.tokens, 0.0)
+        for _ in range(10):
+            bucket.on_success()
+        self.assertAlmostEqual(bucket.rate, 2.1)
+
+    def test_gate_is_open_until_first_throttle(self) -> None:
+        bucket = _TokenBucket()
+
+        async def run() -> float:
+            loop = asyncio.get_running_loop()
+            start = loop.time()
+            for _ in range(50):
+                await bucket.acquire()
+            return loop.time() - start
+
+        self.assertLess(asyncio.run(run()), 0.01)
+        bucket.on_throttled()
+        self.assertEqual(bucket.rate, ENDPOINT_RATE_MAX / 2)
+
+    def test_first_throttle_does_not_refill_from_creation_time(self) -> None:
+        bucket = _TokenBucket()
+
+        async def run() -> float:
+            await asyncio.sleep(0.3)
+            bucket.on_throttled()
+            loop = asyncio.get_running_loop()
+            start = loop.time()
+            await bucket.acquire()
+            await bucket.acquire()
+            return loop.time() - start
+
+        self.assertGreaterEqual(asyncio.run(run()), 1.0 / ENDPOINT_RATE_MAX)
+
+    def test_acquire_waits_for_refill_when_empty(self) -> None:
+        bucket = _TokenBucket(rate=20.0, tokens=0.0)
+
+        async def run() -> float:
+            loop = asyncio.get_running_loop()
+            start = loop.time()
+            await bucket.acquire()
+            return loop.time() - start
+
+        self.assertGreaterEqual(asyncio.run(run()), 0.04)
+
+
+class TestBatchSplit(unittest.TestCase):
+    def _normalized(self, parts: list[str]) -> list[str]:
+        return [p.strip() for p in parts if p.strip()]
+
+    def test_literal_fast_path_matches_regex(self) -> None:
+        text = "Merhaba\n|||RPGMSEP_S|||\nDünya |||RPGMSEP_S||| son"
+        self.assertEqual(
+            self._normalized(_split_batch(text)),
+            self._normalized(_BATCH_SPLIT_RE.split(text)),
+        )
+
+    def test_legacy_and_mangled_separators_use_regex(self) -> None:
+        for text in ("a ⟦_S_⟧ b", "a [ _ s _ ] b", "a |||rpgmsep_s||| b", "a \uE001 b"):
+            self.assertEqual(self._normalized(_split_batch(text)), ["a", "b"], text)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -81,6 +81,27 @@ class TestJsonStructureValidation(unittest.TestCase):
         result = Validator.validate_json_structure(original, translated)
         self.assertTrue(result)
 
+    def test_deep_nesting_does_not_recurse(self):
+        """Nesting deeper than the recursion limit is still validated."""
+        original = translated = []
+        for _ in range(5000):
+            original, translated = [original], [translated]
+        self.assertTrue(Validator.validate_json_structure(original, translated))
+
+    def test_repeated_shape_with_different_keys_still_checked(self):
+        """Sibling dicts with the same keys are each compared."""
+        original = {'a': {'x': 1, 'y': 2}, 'b': {'x': 1, 'y': 2}}
+        translated = {'a': {'x': 1, 'y': 2}, 'b': {'x': 1}}
+        self.assertFalse(Validator.validate_json_structure(original, translated))
+
+    def test_repeated_keys_with_different_nested_values_still_checked(self):
+        """Dicts sharing a key layout are each descended into."""
+        original = {'x': {'p': [1, 2]}, 'y': {'p': [1, 2]}}
+        shorter = {'x': {'p': [1, 2]}, 'y': {'p': [1]}}
+        retyped = {'x': {'p': [1, 2]}, 'y': {'p': '1, 2'}}
+        self.assertFalse(Validator.validate_json_structure(original, shorter))
+        self.assertFalse(Validator.validate_json_structure(original, retyped))
+
 
 if __name__ == '__main__':
     unittest.main()